@@ -0,0 +1,92 @@
+"""파라미터 애니메이션의 프레임 생성 속도를 슬라이더 재실행 방식과 비교합니다.
+
+같은 파라미터 훑기(기본: B를 0.5~3.0에서 ``FRAMES``프레임)를 세 가지로 만들어 초당 프레임 수를 출력합니다.
+
+- 재실행 기준: 슬라이더를 한 칸씩 옮길 때처럼 프레임마다 ``render_graph_png`` (페이지 dpi 200과
+  애니메이션과 같은 dpi 두 가지). 캐시 없이 매번 그림
+- 페이지 재실행 기준 (``--apptest``): AppTest로 슬라이더를 실제로 옮겨 가며 그래프 페이지를 재실행
+- 애니메이션: 2차원 브로드캐스트 계산 + 한 번에 그리기 + GIF/WebP 인코딩, 단계별 시간 포함.
+  같은 설정을 다시 요청할 때(캐시 적중)의 시간도 출력
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_animation [--apptest]``
+"""
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from trigkit.animation import (
+    ANIMATION_DPI, SweepSpec, encode_animation, get_sweep_animation, render_frames, sweep_curves,
+)
+from trigkit.graph_figure import FIGURE_DPI, render_graph_png
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAMES = 36
+SPEC = SweepSpec(True, True, True, 1.0, 1.0, 0.0, 0.0, "B", 0.5, 3.0, FRAMES)
+
+
+def per_frame_baseline(spec, dpi):
+    render_graph_png(*spec[:7], dpi=dpi)  # Figure 만들기는 빼고 잼
+    start = time.perf_counter()
+    for frequency in spec.values():
+        render_graph_png(spec.show_sin, spec.show_cos, spec.show_tan, spec.amplitude, float(frequency),
+                         spec.x_shift, spec.y_shift, dpi=dpi)
+    return time.perf_counter() - start
+
+
+def apptest_baseline(spec, steps=8):
+    """슬라이더(B)를 steps번 옮기며 페이지 재실행에 걸린 시간을 잽니다 (프레임당 초)."""
+    import logging
+
+    from streamlit.testing.v1 import AppTest
+
+    logging.disable(logging.WARNING)
+    at = AppTest.from_file(os.path.join(ROOT, "pages", "01_graph.py"), default_timeout=60).run()
+    values = np.round(np.linspace(spec.start, spec.stop, steps), 1)
+    start = time.perf_counter()
+    for value in values:
+        at.sidebar.slider[1].set_value(float(value)).run()
+    return (time.perf_counter() - start) / steps
+
+
+def main(with_apptest=False):
+    warnings.filterwarnings("ignore")
+    spec = SPEC
+    print(f"{spec.param}: {spec.start} → {spec.stop}, {spec.frames}프레임 · sin+cos+tan")
+    print(f"{'방식':<34} {'초':>7} {'프레임/초':>9}")
+
+    for dpi in (FIGURE_DPI, ANIMATION_DPI):
+        elapsed = per_frame_baseline(spec, dpi)
+        print(f"{f'재실행마다 PNG (dpi {dpi})':<34} {elapsed:>7.2f} {spec.frames / elapsed:>9.1f}")
+    if with_apptest:
+        per_frame = apptest_baseline(spec)
+        print(f"{'페이지 재실행 (AppTest)':<34} {per_frame * spec.frames:>7.2f} {1 / per_frame:>9.1f}")
+
+    render_frames(spec._replace(frames=2))  # Figure 만들기는 빼고 잼
+    start = time.perf_counter()
+    sweep_curves(spec)
+    curves_s = time.perf_counter() - start
+    start = time.perf_counter()
+    frames = render_frames(spec)
+    render_s = time.perf_counter() - start
+    print(f"{'  곡선 브로드캐스트 계산':<34} {curves_s:>7.3f}")
+    print(f"{'  프레임 그리기 (RGBA)':<34} {render_s:>7.2f} {spec.frames / render_s:>9.1f}")
+    for fmt in ("gif", "webp"):
+        start = time.perf_counter()
+        data = encode_animation(frames, fmt)
+        encode_s = time.perf_counter() - start
+        total = render_s + encode_s
+        print(f"{f'  {fmt.upper()} 인코딩':<34} {encode_s:>7.2f}   ({len(data) / 1024:.0f} KB)")
+        print(f"{f'애니메이션 {fmt.upper()} 전체':<34} {total:>7.2f} {spec.frames / total:>9.1f}")
+
+    get_sweep_animation(spec)
+    start = time.perf_counter()
+    get_sweep_animation(spec)
+    cached = time.perf_counter() - start
+    print(f"{'같은 설정 다시 요청 (캐시)':<34} {cached:>7.5f}")
+
+
+if __name__ == "__main__":
+    main("--apptest" in sys.argv[1:])
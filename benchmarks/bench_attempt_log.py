@@ -0,0 +1,88 @@
+"""답안 기록 로그의 클릭 지연, 배치 쓰기 처리량, 리더보드 조회 시간을 잽니다.
+
+1. ``record`` 호출 한 번의 지연 (클릭 응답 시간에 더해지는 비용)
+2. 백그라운드 배치 쓰기로 ROWS건을 커밋하는 데 걸린 시간
+3. 리더보드/문제별 정답률: 원본 테이블 GROUP BY(이전 방식) vs 집계 테이블 인덱스 조회 vs 캐시 적중
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_attempt_log [행 수]``
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from trigkit.attempt_log import AttemptLog
+
+ROWS = 1_000_000
+USERS = 5_000
+QUESTIONS = 500
+QUERY_REPEAT = 5
+
+NAIVE_LEADERBOARD = (
+    "SELECT user, SUM(correct) AS c, COUNT(*) AS n FROM attempts GROUP BY user ORDER BY c DESC, n LIMIT 10"
+)
+NAIVE_ACCURACY = (
+    "SELECT question_id, COUNT(*), SUM(correct), AVG(latency_ms) FROM attempts GROUP BY question_id "
+    "ORDER BY SUM(correct) * 1.0 / COUNT(*), COUNT(*) DESC LIMIT 50"
+)
+
+
+def best_ms(func):
+    times = []
+    for _ in range(QUERY_REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(rows=ROWS):
+    rng = np.random.default_rng(0)
+    users = [f"학생{i:04d}" for i in rng.integers(0, USERS, rows)]
+    questions = [f"q{i:04d}" for i in rng.integers(0, QUESTIONS, rows)]
+    correct = rng.random(rows) < 0.7
+    latency = rng.integers(1_000, 30_000, rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "attempts.sqlite3")
+        log = AttemptLog(path)
+
+        record_ns = np.empty(rows, dtype=np.int64)
+        start = time.perf_counter()
+        for i in range(rows):
+            t0 = time.perf_counter_ns()
+            log.record(users[i], questions[i], correct[i], latency[i])
+            record_ns[i] = time.perf_counter_ns() - t0
+        enqueue_s = time.perf_counter() - start
+        log.flush(timeout=None)  # 모두 커밋될 때까지 기다림
+        total_s = time.perf_counter() - start
+
+        print(f"기록 {rows:,}건")
+        print(f"  record() 지연: p50 {np.percentile(record_ns, 50) / 1000:.1f} µs · "
+              f"p99 {np.percentile(record_ns, 99) / 1000:.1f} µs · 최대 {record_ns.max() / 1e6:.2f} ms")
+        print(f"  큐에 넣기 {enqueue_s:.2f} s · 모두 커밋까지 {total_s:.2f} s ({rows / total_s:,.0f} 건/s)")
+
+        conn = sqlite3.connect(path)
+        naive_leaders = best_ms(lambda: conn.execute(NAIVE_LEADERBOARD).fetchall())
+        naive_accuracy = best_ms(lambda: conn.execute(NAIVE_ACCURACY).fetchall())
+        conn.close()
+
+        def uncached(query):
+            def run():
+                log._cache.clear()
+                query()
+            return run
+
+        print("\n조회 (ms)                 GROUP BY   집계 테이블   캐시 적중")
+        print(f"  리더보드 상위 10명      {naive_leaders:>8.1f}   {best_ms(uncached(log.leaderboard)):>10.2f}"
+              f"   {best_ms(log.leaderboard):>9.4f}")
+        print(f"  문제별 정답률           {naive_accuracy:>8.1f}   {best_ms(uncached(log.question_accuracy)):>10.2f}"
+              f"   {best_ms(log.question_accuracy):>9.4f}")
+        log.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else ROWS)
@@ -0,0 +1,54 @@
+"""matplotlib(서버 PNG)와 클라이언트(Vega-Lite) 렌더링 백엔드의 실행당 서버 CPU 시간과 전송 바이트를 비교합니다.
+
+렌더링 캐시를 거치지 않은 최악의 경우(매번 새 파라미터)를 잽니다.
+실행: 저장소 루트에서 ``python -m benchmarks.bench_backends``
+"""
+import gzip
+import json
+import time
+
+import numpy as np
+
+from trigkit.client_chart import build_vega_lite_spec
+from trigkit.graph_figure import checkout_figure
+
+RUNS = 20
+SCENARIOS = {
+    "sin": (True, False, False),
+    "sin+cos": (True, True, False),
+    "sin+cos+tan": (True, True, True),
+}
+
+
+def measure(render, flags):
+    sizes, cpu = [], 0.0
+    for i in range(RUNS):
+        params = (*flags, 1.0 + i * 0.1, 1.0 + i * 0.2, 0.1 * i, 0.0)
+        start = time.process_time()
+        payload = render(params)
+        cpu += time.process_time() - start
+        sizes.append((len(payload), len(gzip.compress(payload))))
+    raw, compressed = np.mean(sizes, axis=0)
+    return cpu / RUNS * 1000, raw / 1024, compressed / 1024
+
+
+def render_png(params):
+    with checkout_figure() as graph:
+        return graph.render_png(*params)
+
+
+def render_spec(params):
+    return json.dumps(build_vega_lite_spec(*params), separators=(",", ":")).encode()
+
+
+def main():
+    render_png((True, True, True, 1.0, 1.0, 0.0, 0.0))  # Figure 생성과 글꼴 로딩은 제외
+    print(f"{'scenario':<12} | {'backend':<10} {'CPU ms':>8} {'KiB':>8} {'gzip KiB':>9}")
+    for name, flags in SCENARIOS.items():
+        for backend, render in (("matplotlib", render_png), ("client", render_spec)):
+            cpu_ms, kib, gz_kib = measure(render, flags)
+            print(f"{name:<12} | {backend:<10} {cpu_ms:>8.1f} {kib:>8.1f} {gz_kib:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
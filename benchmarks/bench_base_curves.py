@@ -0,0 +1,52 @@
+"""진폭(A)·Y축 이동(D) 슬라이더를 움직일 때 기본 곡선 캐시 유무에 따른 곡선 계산 시간을 비교합니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_base_curves``
+"""
+import time
+
+import numpy as np
+
+from trigkit.curves import apply_amplitude_shift
+from trigkit.graph_figure import X_MAX, X_MIN
+from trigkit.sampling import base_curve, sample_curve
+
+FREQUENCY = 2.5
+X_SHIFT = 0.3
+# 진폭 0~4, Y축 이동 -5~5 를 슬라이더 간격(0.1)으로 훑음
+AMPLITUDES = np.round(np.arange(0.0, 4.01, 0.1), 1)
+Y_SHIFTS = np.round(np.arange(-5.0, 5.01, 0.1), 1)
+
+
+def sweep_uncached(func):
+    for amplitude in AMPLITUDES:
+        for y_shift in Y_SHIFTS:
+            x, y = sample_curve(func, FREQUENCY, X_SHIFT, X_MIN, X_MAX)
+            amplitude * y + y_shift
+
+
+def sweep_cached(func):
+    out = None
+    for amplitude in AMPLITUDES:
+        for y_shift in Y_SHIFTS:
+            x, base_y = base_curve(func, FREQUENCY, X_SHIFT, X_MIN, X_MAX)
+            if out is None:
+                out = np.empty_like(base_y)
+            apply_amplitude_shift(base_y, amplitude, y_shift, out)
+
+
+def main():
+    steps = len(AMPLITUDES) * len(Y_SHIFTS)
+    print(f"A/D 슬라이더 {steps}단계, B={FREQUENCY}, C={X_SHIFT}")
+    for func in ("sin", "cos", "tan"):
+        start = time.perf_counter()
+        sweep_uncached(func)
+        uncached = (time.perf_counter() - start) / steps * 1e6
+        start = time.perf_counter()
+        sweep_cached(func)
+        cached = (time.perf_counter() - start) / steps * 1e6
+        print(f"{func}: 매번 계산 {uncached:8.1f} µs/step | 캐시 + 제자리 변환 {cached:6.1f} µs/step "
+              f"({uncached / cached:.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""새로 뜬 서버 프로세스에서 첫 그래프/첫 퀴즈 문제가 나오기까지 걸리는 시간을 잽니다.
+
+시나리오마다 새 파이썬 프로세스를 띄워 다음을 잽니다.
+
+- ``import``: streamlit 테스트 도구 import (서버 프로세스 자체의 시작 비용)
+- ``warm-up``: 예열 시나리오에서 서버 시작 때 ``warm_up``에 쓴 시간
+- ``첫 화면``: 페이지 첫 실행 (퀴즈는 시작 버튼을 눌러 첫 문제가 나올 때까지 포함)
+- ``두 번째``: 같은 프로세스에서 한 번 더 실행 (데워진 상태)
+
+``--fresh-font-cache``를 주면 빈 matplotlib 설정 폴더로 실행해 새 컨테이너처럼 글꼴 캐시를
+처음부터 만들게 합니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_cold_start [--fresh-font-cache]``
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 3
+SCENARIOS = {
+    "quiz": ("main.py", False),
+    "graph": ("pages/01_graph.py", False),
+    "graph+warm-up": ("pages/01_graph.py", True),
+}
+
+
+def child(scenario):
+    """새 프로세스 안에서 실행되는 측정 본문. 결과를 JSON 한 줄로 출력합니다."""
+    import logging
+    import warnings
+    warnings.filterwarnings("ignore")
+
+    page, warm = SCENARIOS[scenario]
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    logging.disable(logging.WARNING)
+    result = {"import": time.perf_counter() - start, "warm-up": 0.0}
+
+    if warm:
+        from trigkit.warmup import warm_up
+        start = time.perf_counter()
+        warm_up()
+        result["warm-up"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=120).run()
+    if scenario == "quiz":
+        at.button[0].click().run()  # 퀴즈 시작 → 첫 문제
+    result["first"] = time.perf_counter() - start
+    result["matplotlib"] = "matplotlib" in sys.modules
+
+    start = time.perf_counter()
+    at.run()
+    result["second"] = time.perf_counter() - start
+    print(json.dumps(result))
+
+
+def run_child(scenario, fresh_font_cache):
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as mpl_dir:
+        if fresh_font_cache:
+            env["MPLCONFIGDIR"] = mpl_dir
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_cold_start", "--child", scenario],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main(argv):
+    if argv[:1] == ["--child"]:
+        child(argv[1])
+        return
+    fresh = "--fresh-font-cache" in argv
+    print(f"새 프로세스 {REPEAT}회 중앙값 (초){' · 글꼴 캐시 없음' if fresh else ''}")
+    print(f"{'scenario':<14} {'import':>7} {'warm-up':>8} {'첫 화면':>8} {'두 번째':>8}  matplotlib 로드")
+    for scenario in SCENARIOS:
+        runs = [run_child(scenario, fresh) for _ in range(REPEAT)]
+        med = {key: statistics.median(r[key] for r in runs) for key in ("import", "warm-up", "first", "second")}
+        print(f"{scenario:<14} {med['import']:>7.2f} {med['warm-up']:>8.2f} {med['first']:>8.2f} "
+              f"{med['second']:>8.2f}  {'예' if runs[0]['matplotlib'] else '아니요'}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,42 @@
+"""일괄 내보내기의 작업 프로세스 수별 처리량과 속도 향상 비율을 잽니다.
+
+같은 작업 묶음(기본 ``JOBS``개 그래프)을 작업 프로세스 1, 2, 4, N(CPU 수)개로 PDF 학습지로
+내보내고, 1개일 때 대비 속도 향상과 효율(향상 ÷ 프로세스 수)을 출력합니다. 프로세스 풀 시작
+비용까지 포함한 전체 시간입니다. CPU 수보다 많은 프로세스는 같은 코어를 나눠 쓰므로 빨라지지 않습니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_export [그래프 수]``
+"""
+import os
+import sys
+import tempfile
+import time
+import warnings
+
+from trigkit.export import export, parse_grid
+
+JOBS = 48
+GRID = "func=sin,cos,tan,sin+cos A=0.5,1,2,3 B=0.5,1,2 C=0 D=0"
+
+
+def main(count=JOBS):
+    warnings.filterwarnings("ignore")
+    jobs = (parse_grid(GRID) * (count // 48 + 1))[:count]
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpus})
+    print(f"그래프 {len(jobs)}개 · CPU {cpus}개")
+    print(f"{'프로세스':>6} {'초':>7} {'개/초':>7} {'향상':>6} {'효율':>6} {'PDF MB':>7}")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in worker_counts:
+            path = os.path.join(tmp, f"worksheet_{workers}.pdf")
+            start = time.perf_counter()
+            done, _ = export(jobs, path, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(f"{workers:>6} {elapsed:>7.2f} {done / elapsed:>7.1f} {speedup:>5.2f}x {speedup / workers:>6.0%} "
+                  f"{os.path.getsize(path) / 1024 / 1024:>7.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else JOBS)
@@ -0,0 +1,78 @@
+"""직접 입력한 식 엔진의 컴파일 캐시 효과와 격자 크기별 계산 시간을 잽니다.
+
+- 첫 컴파일(파싱 + 검사 + 정규화 + 컴파일) 대 캐시 적중의 µs. 적중은 공백·괄호만 다른 식이
+  정규화 캐시에 맞을 때(파싱과 검사는 함)와 같은 입력이 다시 올 때 두 가지
+- 격자 점 수별 ``evaluate``와 극 검출까지 포함한 ``curve``의 ms, 비교용 파이썬 반복(math 모듈) 시간
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_expression``
+"""
+import math
+import time
+
+import numpy as np
+
+from trigkit.expression import _compile_normalized, compile_expression, expression_cache_info
+
+EXPRESSIONS = (
+    "2*sin(x) + cos(3*x)",
+    "sin(x)^2",
+    "tan(x/2) + 1/(x - 1)",
+    "sqrt(abs(x)) * exp(-x^2/4) * sin(5*x)",
+)
+GRID_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+REPEAT = 200
+
+
+def per_call_us(fn, repeat=REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def compile_us(text, clear_normalized, repeat=50):
+    """입력 텍스트 캐시를 비운 채 컴파일 시간을 잽니다 (clear_normalized면 정규화 캐시도 비움)."""
+    total = 0.0
+    for _ in range(repeat):
+        compile_expression.cache_clear()
+        if clear_normalized:
+            _compile_normalized.cache_clear()
+        start = time.perf_counter()
+        compile_expression(text)
+        total += time.perf_counter() - start
+    return total / repeat * 1e6
+
+
+def python_loop(x):
+    # "tan(x/2) + 1/(x - 1)"을 점마다 파이썬으로 계산
+    return [math.tan(v / 2) + 1 / (v - 1) if v != 1 else float("nan") for v in x.tolist()]
+
+
+def main():
+    print(f"{'식':<40} {'첫 컴파일 µs':>12} {'정규화 적중 µs':>14} {'입력 적중 µs':>12}")
+    for text in EXPRESSIONS:
+        first = compile_us(text, clear_normalized=True)
+        spaced = f"  ( {text.replace('*', ' * ')} )  "  # 공백과 괄호만 달라도 정규화 후 같은 캐시 항목
+        compile_expression(text)
+        normalized_hit = compile_us(spaced, clear_normalized=False)
+        compile_expression(text)
+        hit = per_call_us(lambda: compile_expression(text))
+        print(f"{text:<40} {first:>12.1f} {normalized_hit:>14.1f} {hit:>12.2f}")
+    for name, info in zip(("입력 텍스트 캐시", "정규화 텍스트 캐시"), expression_cache_info()):
+        print(f"{name}: 적중 {info.hits} · 실패 {info.misses} · 항목 {info.currsize}/{info.maxsize}")
+
+    compiled = compile_expression("tan(x/2) + 1/(x - 1)")
+    print()
+    print(f"{'격자 점 수':>10} {'evaluate ms':>12} {'curve ms':>10} {'파이썬 반복 ms':>14} {'끊긴 곳':>7}")
+    for n in GRID_SIZES:
+        x = np.linspace(-2 * np.pi, 2 * np.pi, n)
+        repeat = max(1, 200_000 // n)
+        evaluate_ms = per_call_us(lambda: compiled.evaluate(x), repeat) / 1e3
+        curve_ms = per_call_us(lambda: compiled.curve(-2 * np.pi, 2 * np.pi, n), repeat) / 1e3
+        loop_ms = per_call_us(lambda: python_loop(x), 1) / 1e3 if n <= 100_000 else float("nan")
+        gaps = len(compiled.curve(-2 * np.pi, 2 * np.pi, n)[0]) - n
+        print(f"{n:>10} {evaluate_ms:>12.3f} {curve_ms:>10.3f} {loop_ms:>14.1f} {gaps:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""상호작용마다 다시 실행되는 코드의 시간을 전체 스크립트 재실행(이전)과 fragment 영역 재실행(이후)으로 비교합니다.
+
+AppTest는 상호작용마다 항상 전체 스크립트를 다시 실행하므로, ``st.fragment``를 시간 측정
+래퍼로 바꿔 전체 실행 시간 안에서 각 fragment 본문이 차지한 시간을 따로 잽니다.
+fragment로 나눈 뒤에는 해당 영역 본문만 다시 실행되므로 그 시간이 상호작용당 비용입니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_fragments``
+"""
+import functools
+import logging
+import os
+import statistics
+import time
+import warnings
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEAT = 10
+
+_fragment_times = {}
+_original_fragment = st.fragment
+
+
+def _timed_fragment(func=None, **kwargs):
+    """본문 실행 시간을 기록하는 st.fragment 대체 데코레이터 (가장 바깥 호출만 기록)."""
+    if func is None:
+        return functools.partial(_timed_fragment, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kw):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            _fragment_times.setdefault(func.__name__, []).append(time.perf_counter() - start)
+
+    return _original_fragment(wrapper, **kwargs)
+
+
+def run_interactions(page, interactions):
+    """(이름, fragment 이름, 동작) 목록을 실행하며 전체/영역 시간을 잽니다."""
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=120).run()
+    results = []
+    for name, fragment_name, action in interactions:
+        full, region = [], []
+        for i in range(REPEAT):
+            _fragment_times.clear()
+            start = time.perf_counter()
+            action(at, i).run()
+            full.append(time.perf_counter() - start)
+            region.append(sum(_fragment_times.get(fragment_name, [0.0])))
+        results.append((page, name, statistics.median(full) * 1000, statistics.median(region) * 1000))
+    return results
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    st.fragment = _timed_fragment
+
+    angles = ("angle_30_도 (Degrees)", "angle_45_도 (Degrees)")
+    results = run_interactions("pages/00_radian.py", [
+        ("각도 버튼 클릭", "angle_panel", lambda at, i: at.button(key=angles[i % 2]).click()),
+        ("삼각함수 변경", "result_panel", lambda at, i: at.radio(key="selected_func").set_value(("sin", "cos", "tan")[i % 3])),
+    ])
+    results += run_interactions("pages/01_graph.py", [
+        ("진폭 슬라이더", "figure_panel", lambda at, i: at.sidebar.slider[0].set_value(1.0 + (i % 2) * 0.5)),
+    ])
+
+    print(f"{'page':<20} {'interaction':<14} {'전체 재실행 ms':>14} {'fragment ms':>12}")
+    for page, name, full_ms, region_ms in results:
+        print(f"{page:<20} {name:<14} {full_ms:>14.1f} {region_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
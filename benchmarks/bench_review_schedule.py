@@ -0,0 +1,117 @@
+"""간격 반복 스케줄러의 출제/기록 지연과 저장 크기를 문제 수별로 잽니다.
+
+학생 한 명이 하루에 퀴즈 ``QUIZZES_PER_DAY``번(10문제씩)을 ``DAYS``일 동안 푸는 상황을 흉내 냅니다.
+정답률 ``ACCURACY``의 학생이 고른 문제를 풀고, 다음을 출력합니다.
+
+- ``select(10)``과 ``record`` 한 번의 p50/p99 지연 (µs)
+- 주제 조건(문제의 ``FILTER_FRACTION``)이 있는 ``select(10)``의 p50 (µs, 조건별 힙을 만든 뒤)
+- 비교용: 매번 전체 문제의 due를 정렬해 고르는 단순 방식의 ``select`` p50
+- ``encode`` 결과 크기와 인코딩/불러오기 시간
+- 한 달을 푼 뒤 스케줄러가 메모리에 둔 크기 (``nbytes``, 조건별 힙 포함). ``ReviewRegistry``의 상한 계산에 쓰는 값
+- 때 이른 출제: 복습 시각이 아직 안 된(익힌) 문제가 나온 비율. 새 문제가 남아 있는 한 0이어야 함
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_review_schedule``
+"""
+import random
+import time
+
+import numpy as np
+
+from trigkit.review_schedule import ReviewScheduler
+
+SIZES = (1_000, 10_000, 100_000)
+DAYS = 30
+QUIZZES_PER_DAY = 20
+QUIZ_LENGTH = 10
+ACCURACY = 0.8
+FILTER_FRACTION = 0.1
+DAY = 24 * 60 * 60
+
+
+def naive_select(scheduler, k, now):
+    """전체 문제를 훑는 비교용 방식: 복습할 때가 된 문제 → 새 문제 → 나머지를 due 순으로."""
+    state = scheduler.state
+    seen = (state["reps"] > 0) | (state["lapses"] > 0)
+    due = np.where(seen, state["due"], np.inf)
+    overdue = np.flatnonzero(seen & (due <= now))
+    overdue = overdue[np.argsort(due[overdue])]
+    if len(overdue) >= k:
+        return overdue[:k].tolist()
+    new = np.flatnonzero(~seen)[:k - len(overdue)]
+    rest = np.argsort(due)[:k - len(overdue) - len(new)]
+    return overdue.tolist() + new.tolist() + rest.tolist()
+
+
+def simulate(n):
+    rng = random.Random(n)
+    ids = [f"q{i:06d}" for i in range(n)]
+    start = time.perf_counter()
+    scheduler = ReviewScheduler(ids, seed=n)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    subset = np.flatnonzero(np.random.default_rng(n).random(n) < FILTER_FRACTION)
+    select_us, filtered_us, record_us, naive_us = [], [], [], []
+    now = 1_700_000_000.0
+    early = total = 0
+    for day in range(DAYS):
+        for quiz in range(QUIZZES_PER_DAY):
+            now = 1_700_000_000.0 + day * DAY + quiz * 15 * 60
+            t0 = time.perf_counter()
+            chosen = scheduler.select(QUIZ_LENGTH, now=now)
+            select_us.append((time.perf_counter() - t0) * 1e6)
+            t0 = time.perf_counter()
+            scheduler.select(QUIZ_LENGTH, subset, now=now, filter_key="subset")
+            filtered_us.append((time.perf_counter() - t0) * 1e6)
+            if quiz == 0:
+                t0 = time.perf_counter()
+                naive_select(scheduler, QUIZ_LENGTH, now)
+                naive_us.append((time.perf_counter() - t0) * 1e6)
+            for idx in chosen:
+                total += 1
+                early += int(scheduler.seen(idx) and scheduler.state["due"][idx] > now)
+                t0 = time.perf_counter()
+                scheduler.record(ids[idx], rng.random() < ACCURACY, rng.uniform(2000, 40000), now=now)
+                record_us.append((time.perf_counter() - t0) * 1e6)
+
+    t0 = time.perf_counter()
+    data = scheduler.encode()
+    encode_ms = (time.perf_counter() - t0) * 1e3
+    t0 = time.perf_counter()
+    restored = ReviewScheduler(ids, seed=0)
+    restored.load(data)
+    load_ms = (time.perf_counter() - t0) * 1e3
+    assert restored.state.tobytes() == scheduler.state.tobytes(), "불러온 상태가 저장한 상태와 다름"
+
+    seen = int(((scheduler.state["reps"] > 0) | (scheduler.state["lapses"] > 0)).sum())
+    return {
+        "n": n,
+        "build_ms": build_ms,
+        "select_p50": np.percentile(select_us, 50),
+        "select_p99": np.percentile(select_us, 99),
+        "filtered_p50": np.percentile(filtered_us[1:], 50),  # 첫 호출은 조건별 힙을 만듦
+        "naive_p50": np.percentile(naive_us, 50),
+        "record_p50": np.percentile(record_us, 50),
+        "record_p99": np.percentile(record_us, 99),
+        "seen": seen,
+        "bytes": len(data),
+        "memory_kb": scheduler.nbytes / 1024,
+        "encode_ms": encode_ms,
+        "load_ms": load_ms,
+        "early": early / max(total, 1),
+    }
+
+
+def main():
+    print(f"{DAYS}일 × 하루 {QUIZZES_PER_DAY}회 × {QUIZ_LENGTH}문제, 정답률 {ACCURACY:.0%}")
+    print(f"{'문제 수':>8} {'생성 ms':>8} {'select p50/p99 µs':>18} {'조건 select µs':>13} {'전체 정렬 µs':>12} "
+          f"{'record p50/p99 µs':>18} {'푼 문제':>7} {'저장 바이트':>10} {'enc/load ms':>12} {'메모리 KB':>9} "
+          f"{'때 이른 출제':>10}")
+    for n in SIZES:
+        r = simulate(n)
+        print(f"{r['n']:>8} {r['build_ms']:>8.1f} {r['select_p50']:>9.1f}/{r['select_p99']:<8.1f} "
+              f"{r['filtered_p50']:>13.1f} {r['naive_p50']:>12.1f} {r['record_p50']:>9.1f}/{r['record_p99']:<8.1f} {r['seen']:>7} "
+              f"{r['bytes']:>10} {r['encode_ms']:>5.2f}/{r['load_ms']:<6.2f} {r['memory_kb']:>9.0f} {r['early']:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
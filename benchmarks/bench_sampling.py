@@ -0,0 +1,68 @@
+"""고정 500점 격자와 적응형 샘플링의 점 수, 근사 오차, 렌더링 시간을 비교합니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_sampling``
+"""
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from trigkit.curves import split_at_poles, tan_asymptotes
+from trigkit.graph_figure import X_MAX, X_MIN, Y_MAX, Y_MIN
+from trigkit.sampling import sample_curve
+
+FUNCS = {"sin": np.sin, "cos": np.cos, "tan": np.tan}
+FREQUENCIES = (0.1, 1.0, 2.5, 5.0)
+X_SHIFT = 0.3
+AMPLITUDE = 1.0  # 슬라이더 기본값
+REPEAT = 20
+
+
+def fixed_grid(func, frequency):
+    x = np.linspace(X_MIN, X_MAX, 500)
+    y = FUNCS[func](frequency * x + X_SHIFT)
+    if func == "tan":
+        x, y = split_at_poles(x, y, tan_asymptotes(frequency, X_SHIFT, X_MIN, X_MAX))
+    return x, y
+
+
+def max_error(func, frequency, x, y):
+    """화면에 보이는 범위로 자른 뒤 선형 보간과 실제 곡선의 최대 차이 (데이터 단위)."""
+    dense = np.linspace(X_MIN, X_MAX, 200_001)
+    truth = np.clip(AMPLITUDE * FUNCS[func](frequency * dense + X_SHIFT), Y_MIN, Y_MAX)
+    approx = np.clip(AMPLITUDE * np.interp(dense, x, y), Y_MIN, Y_MAX)
+    err = np.abs(truth - approx)
+    return float(np.nanmax(err))
+
+
+def render_time(x, y):
+    fig = Figure(figsize=(10, 6))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlim(X_MIN, X_MAX)
+    ax.set_ylim(Y_MIN, Y_MAX)
+    (line,) = ax.plot(x, AMPLITUDE * y)
+    canvas.draw()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        line.set_data(x, AMPLITUDE * y)
+        canvas.draw()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    print(f"{'func':<5}{'B':>5} | {'fixed pts':>9}{'err':>8}{'ms':>7} | {'adapt pts':>9}{'err':>8}{'ms':>7}")
+    for func in FUNCS:
+        for frequency in FREQUENCIES:
+            fx, fy = fixed_grid(func, frequency)
+            ax_, ay = sample_curve(func, frequency, X_SHIFT, X_MIN, X_MAX)
+            print(
+                f"{func:<5}{frequency:>5.1f} | "
+                f"{len(fx):>9}{max_error(func, frequency, fx, fy):>8.3f}{render_time(fx, fy):>7.2f} | "
+                f"{len(ax_):>9}{max_error(func, frequency, ax_, ay):>8.3f}{render_time(ax_, ay):>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
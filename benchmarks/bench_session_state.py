@@ -0,0 +1,60 @@
+"""퀴즈 진행 중 세션 하나가 차지하는 세션 상태 바이트 수를 이전 방식과 압축 방식으로 비교합니다.
+
+이전 방식은 문제 dict 목록과 섞은 보기 목록을 세션마다 들고 있었고, 문제 목록이 매 실행마다
+새로 만들어졌기 때문에 세션마다 사본이 생겼습니다. 그래서 문제 dict를 깊은 복사한 상태로 잽니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_session_state``
+"""
+import copy
+import os
+import random
+
+from trigkit.question_bank import load_question_bank
+from trigkit.quiz_state import index_array, random_permutation_code
+from trigkit.session_utils import session_state_nbytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUIZ_LENGTH = 10
+SESSIONS = 300
+
+
+def legacy_state(bank, indices):
+    questions = [copy.deepcopy(bank[int(i)]) for i in indices]
+    return {
+        "quiz_started": True,
+        "current_question_index": 3,
+        "score": 2,
+        "quiz_questions_shuffled": questions,
+        "show_feedback": False,
+        "user_answer": None,
+        "current_options_shuffled": random.sample(questions[3]["options"], len(questions[3]["options"])),
+    }
+
+
+def compact_state(bank, indices):
+    return {
+        "quiz_started": True,
+        "current_question_index": 3,
+        "score": 2,
+        "quiz_order": index_array(indices, len(bank)),
+        "show_feedback": False,
+        "user_answer": None,
+        "option_perm": random_permutation_code(4),
+        "answer_bits": 0b0101,
+        "quiz_total": len(indices),
+    }
+
+
+def main():
+    bank = load_question_bank(os.path.join(ROOT, "data", "questions.jsonl"))
+    indices = bank.sample_indices(QUIZ_LENGTH)
+    legacy, _ = session_state_nbytes(legacy_state(bank, indices))
+    compact, per_key = session_state_nbytes(compact_state(bank, indices))
+    print(f"문제 {len(indices)}개 퀴즈 진행 중 세션 상태")
+    print(f"  이전 방식: {legacy:>7,} bytes/세션 → {SESSIONS}명 {legacy * SESSIONS / 1024:,.0f} KiB")
+    print(f"  압축 방식: {compact:>7,} bytes/세션 → {SESSIONS}명 {compact * SESSIONS / 1024:,.0f} KiB")
+    print("  압축 방식 키별:", ", ".join(f"{k}={v}" for k, v in per_key.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""작업 프로세스 수에 따라 세션 저장소를 쓰는 요청 처리량이 얼마나 늘어나는지 잽니다.
+
+작업 프로세스 W개가 SQLite 세션 저장소 하나를 공유합니다. 요청마다 임의의 사용자(sid)를
+골라 어느 프로세스든 그 요청을 처리합니다 (sticky 라우팅 없음). 처리 순서는 다음과 같습니다.
+
+1. 저장소에서 상태 복원
+2. 퀴즈 한 단계 진행 (스크립트 실행 비용은 ``WORK_MS``만큼 CPU를 써서 흉내 냄)
+3. 바뀐 상태 저장
+
+마지막에 저장된 version의 합이 처리한 요청 수와 같은지(모든 저장이 커밋됐는지) 확인합니다.
+CPU 코어가 W개 이상 있어야 처리량이 W에 비례해 늘어납니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_session_store``
+"""
+import array
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from trigkit.session_store import SID_COOKIE, MemorySessionStore, SessionSync, SQLiteSessionStore
+
+USERS = 1_000
+DURATION = 3.0
+WORK_MS = (0.0, 2.0)
+KEYS = (
+    "quiz_started", "current_question_index", "score", "quiz_order", "show_feedback", "user_answer",
+    "option_perm", "answer_bits", "quiz_total", "quiz_seed", "user_name", "question_shown_at", "learner_id",
+)
+
+
+def burn(ms):
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def handle_request(sync, sid, work_ms):
+    """새 연결 하나가 요청 하나를 처리하는 과정 (프로세스 안에 남은 세션 상태 없음)."""
+    state = {}
+    if not sync.restore(state, {}, {SID_COOKIE: sid}):
+        state.update(
+            quiz_started=True, current_question_index=0, score=0,
+            quiz_order=array.array("H", range(10)), show_feedback=False, user_answer=None,
+            option_perm=0, answer_bits=0, quiz_total=10, quiz_seed=None, user_name=sid, question_shown_at=0.0,
+            learner_id=sid,
+        )
+    burn(work_ms)
+    state["current_question_index"] += 1
+    state["question_shown_at"] = time.time()
+    sync.persist(state)
+
+
+def worker(store_spec, work_ms, seed, start_at, results):
+    store = SQLiteSessionStore(store_spec) if store_spec else MemorySessionStore()
+    sync = SessionSync("quiz", KEYS, store=store)
+    rng = random.Random(seed)
+    sids = [f"bench-user-{i:06d}" for i in range(USERS)]  # 쿠키 sid 형식(16자 이상)에 맞춤
+    while time.time() < start_at:
+        time.sleep(0.001)
+    count = 0
+    end = start_at + DURATION
+    while time.time() < end:
+        handle_request(sync, rng.choice(sids), work_ms)
+        count += 1
+    results.put(count)
+
+
+def run(workers, work_ms, path):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    start_at = time.time() + 1.0 + 0.2 * workers  # 모든 프로세스가 import를 마친 뒤 동시에 시작
+    procs = [ctx.Process(target=worker, args=(path, work_ms, seed, start_at, results)) for seed in range(workers)]
+    for p in procs:
+        p.start()
+    total = sum(results.get() for _ in procs)
+    for p in procs:
+        p.join()
+    return total
+
+
+def check_consistency(path, expected_requests):
+    """요청마다 저장이 한 번씩 커밋되었으면 version의 합이 요청 수와 같습니다."""
+    conn = sqlite3.connect(path)
+    versions = conn.execute("SELECT COALESCE(SUM(version), 0) FROM sessions").fetchone()[0]
+    conn.close()
+    return versions == expected_requests
+
+
+def main():
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"CPU {os.cpu_count()}개 · 사용자 {USERS}명 · 측정 {DURATION:.0f}초")
+    print(f"{'저장소':<10} {'작업 ms':>7} {'프로세스':>8} {'요청/s':>10} {'배율':>6} {'일관성':>6}")
+    for work_ms in WORK_MS:
+        with tempfile.TemporaryDirectory() as tmp:
+            single = None
+            for workers in worker_counts:
+                path = os.path.join(tmp, f"sessions-{workers}.sqlite3")
+                SQLiteSessionStore(path)  # 테이블 미리 만들기
+                total = run(workers, work_ms, path)
+                rate = total / DURATION
+                single = single or rate
+                ok = "OK" if check_consistency(path, total) else "불일치"
+                print(f"{'sqlite':<10} {work_ms:>7.1f} {workers:>8} {rate:>10,.0f} {rate / single:>5.1f}x {ok:>6}")
+        memory_rate = run(1, work_ms, None) / DURATION
+        print(f"{'memory':<10} {work_ms:>7.1f} {1:>8} {memory_rate:>10,.0f}      (프로세스 간 공유 불가)")
+
+
+if __name__ == "__main__":
+    main()
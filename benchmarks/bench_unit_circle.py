@@ -0,0 +1,57 @@
+"""단위원 그림의 클릭당 렌더링 비용을 전체 다시 그리기와 비교합니다.
+
+16개 특수각 × sin/cos/tan 강조를 모두 한 번씩 눌렀을 때의 p50/p99(ms)를 출력합니다.
+
+- 전체 다시 그리기: 배경까지 ``canvas.draw``로 매번 그린 뒤 동적 요소를 덧그리고 같은 방식으로 PNG 인코딩
+- 배경 캐시 + 덧그리기: ``render_unit_circle_png`` (배경 복사 → 동적 요소만 그리기 → PNG 인코딩)
+  와 그중 PNG 인코딩을 뺀 덧그리기 단계만의 시간
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_unit_circle``
+"""
+import time
+import warnings
+
+import numpy as np
+
+from trigkit.unit_circle import (
+    SPECIAL_DEGREES, UNITS, checkout_unit_circle, encode_png, get_background, get_palette, render_unit_circle_png,
+)
+
+FUNCS = ("sin", "cos", "tan")
+
+
+def full_redraw_png(figure, degrees, unit, highlight):
+    figure.render_background(unit)
+    figure._set_overlay(degrees, highlight)
+    for artist in figure.overlay:
+        figure.ax.draw_artist(artist)
+    return encode_png(np.asarray(figure.canvas.buffer_rgba()), get_palette(figure))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    warnings.filterwarnings("ignore")
+    clicks = [(degrees, unit, func) for unit in UNITS for degrees in SPECIAL_DEGREES for func in FUNCS]
+    with checkout_unit_circle() as figure:
+        for unit in UNITS:  # 글꼴/수식 캐시와 배경을 미리 만들어 둠
+            get_background(unit, figure)
+            full_redraw_png(figure, 0, unit, None)
+        full = [timed(full_redraw_png, figure, *click) for click in clicks]
+        blit = [timed(figure.blit, *click) for click in clicks]
+    cached = [timed(render_unit_circle_png, *click) for click in clicks]
+
+    print(f"클릭 {len(clicks)}번 (특수각 {len(SPECIAL_DEGREES)}개 × 함수 {len(FUNCS)}개 × 단위 {len(UNITS)}개)")
+    print(f"{'방식':<28} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, samples in (("전체 다시 그리기 + PNG", full), ("배경 캐시 + 덧그리기 + PNG", cached),
+                          ("  덧그리기만 (PNG 제외)", blit)):
+        print(f"{name:<28} {np.percentile(samples, 50):>8.2f} {np.percentile(samples, 99):>8.2f}")
+    print(f"클릭당 {np.median(full) / np.median(cached):.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""보기 범위 폭에 따른 곡선 점 수와 계산 시간, 이동 시 타일 캐시 효과를 잽니다.
+
+- 적응형: 기존 ``sample_curve``로 보기 범위 전체를 샘플링했을 때 (점 상한 MAX_POINTS)
+- 열 min/max: ``minmax_columns``로 픽셀 열마다 최솟값/최댓값만 남겼을 때 (캐시 없이 계산)
+
+넓은 범위에서 적응형은 점 상한에 걸려 반주기당 점 수가 줄어들고(에일리어싱), 열 min/max는
+범위와 상관없이 픽셀 폭에 비례하는 점 수를 유지합니다. "놓친 폭"은 픽셀 열마다 실제 y 범위 중
+그려지지 않은 길이의 최댓값입니다 (사인의 전체 폭은 2).
+
+실행: 저장소 루트에서 ``python -m benchmarks.bench_viewport``
+"""
+import time
+
+import numpy as np
+
+from trigkit.graph_figure import VIEW_COLUMNS
+from trigkit.sampling import sample_curve
+from trigkit.viewport import DEFAULT_VIEWPORT, TILES_PER_VIEW, minmax_columns, tile_cache_info, viewport_curve
+
+FREQUENCY = 5.0
+X_SHIFT = 0.3
+REPEAT = 20
+LEVELS = (-8, -4, 0, 2, 4, 6)
+
+
+def best_time(fn):
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def missed_extent(x, y, x_min, x_max, columns):
+    """픽셀 열마다 그려진 y 범위가 실제 범위(조밀한 샘플 기준)를 놓친 길이의 최댓값."""
+    edges = np.linspace(x_min, x_max, columns + 1)
+    dense = np.sin(FREQUENCY * np.linspace(edges[:-1], edges[1:], 64, axis=1) + X_SHIFT)
+    true_lo, true_hi = dense.min(axis=1), dense.max(axis=1)
+    # 선은 이웃한 점끼리 이어지므로 열 경계에서 보간한 값까지 포함해 그려진 범위를 구함
+    column = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, columns - 1)
+    drawn_lo, drawn_hi = np.interp(edges[:-1], x, y), np.interp(edges[1:], x, y)
+    drawn_lo, drawn_hi = np.minimum(drawn_lo, drawn_hi), np.maximum(drawn_lo, drawn_hi)
+    np.minimum.at(drawn_lo, column, y)
+    np.maximum.at(drawn_hi, column, y)
+    missed = np.maximum(drawn_lo - true_lo, 0) + np.maximum(true_hi - drawn_hi, 0)
+    return float(missed.max())
+
+
+def main():
+    print(f"sin({FREQUENCY}x + {X_SHIFT}), 픽셀 열 {VIEW_COLUMNS}개, {REPEAT}회 중 최솟값")
+    print(f"{'x 범위':>14} {'적응형 점':>9} {'ms':>7} {'놓친 폭':>7}   {'min/max 점':>10} {'ms':>7} {'놓친 폭':>7}")
+    for level in LEVELS:
+        viewport = DEFAULT_VIEWPORT.zoomed(dx=level)
+        x_min, x_max = viewport.x_min, viewport.x_max
+        ax, ay = sample_curve("sin", FREQUENCY, X_SHIFT, x_min, x_max)
+        mx, my = minmax_columns("sin", FREQUENCY, X_SHIFT, x_min, x_max, VIEW_COLUMNS)
+        adaptive_ms = best_time(lambda: sample_curve("sin", FREQUENCY, X_SHIFT, x_min, x_max)) * 1e3
+        minmax_ms = best_time(lambda: minmax_columns("sin", FREQUENCY, X_SHIFT, x_min, x_max, VIEW_COLUMNS)) * 1e3
+        print(f"{'±' + format(x_max / np.pi, '.4g') + 'π':>14} {len(ax):>9} {adaptive_ms:>7.2f} "
+              f"{missed_extent(ax.astype(float), ay.astype(float), x_min, x_max, VIEW_COLUMNS):>7.2f}   "
+              f"{len(mx):>10} {minmax_ms:>7.2f} {missed_extent(mx, my, x_min, x_max, VIEW_COLUMNS):>7.2f}")
+
+    # 오른쪽으로 네 칸 갔다가 되돌아오기: 새 칸 하나만 계산하고, 돌아올 때는 모두 캐시 적중
+    viewport = DEFAULT_VIEWPORT.zoomed(dx=4)
+    path = [viewport.panned(dx=i) for i in range(TILES_PER_VIEW + 1)]
+    path += path[-2::-1]
+    print(f"\n이동 경로 {len(path)}화면 (±{viewport.x_max / np.pi:.0f}π 폭, 탄젠트 포함)")
+    before = tile_cache_info()
+    for i, step in enumerate(path):
+        hits = tile_cache_info().hits
+        start = time.perf_counter()
+        for func in ("sin", "cos", "tan"):
+            viewport_curve(func, FREQUENCY, X_SHIFT, step, VIEW_COLUMNS)
+        elapsed = (time.perf_counter() - start) * 1e3
+        print(f"  {i:>2}: x {step.x_min / np.pi:>7.1f}π ~ {step.x_max / np.pi:>6.1f}π  "
+              f"{elapsed:>6.2f} ms  타일 적중 {tile_cache_info().hits - hits}/{3 * TILES_PER_VIEW}")
+    after = tile_cache_info()
+    print(f"합계: 적중 {after.hits - before.hits} · 실패 {after.misses - before.misses}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""세 페이지를 동시 접속 세션 N개로 오프라인 부하 테스트합니다.
+
+세션마다 작업 프로세스를 하나씩 띄워 ``AppTest``로 동시에 실행합니다. ``AppTest``는 실행할
+때마다 프로세스 전역 ``Runtime`` 인스턴스를 바꿔 끼우므로 한 프로세스 안에서 스레드로 여러
+세션을 돌릴 수 없습니다. 모든 프로세스가 import를 마친 뒤 한꺼번에 시작하므로, 세션 수가
+CPU 코어 수를 넘으면 실제 서버처럼 CPU를 나눠 쓰는 지연이 드러납니다. 각 세션은 실제 학생이
+하는 것과 비슷한 상호작용 시나리오를 반복합니다.
+
+- ``quiz``: ``main.py``에서 퀴즈를 시작해 끝까지 풀기
+- ``radian``: ``pages/00_radian.py``에서 각도 버튼을 차례로 누르고 삼각함수 바꾸기
+- ``graph``: ``pages/01_graph.py``에서 진폭/주파수 슬라이더 훑기
+
+재실행 지연 시간의 p50/p95/p99, 세션 프로세스의 최대 RSS, 초당 재실행 수를 출력하고 JSON으로
+저장합니다. ``--compare``로 이전 결과 파일을 주면 시나리오별 변화율을 함께 보여 줍니다.
+세션마다 프로세스가 따로라서 ``st.cache_resource`` 등은 세션끼리 공유되지 않습니다
+(시나리오의 ``rounds``를 늘리면 같은 세션 안에서 캐시가 데워진 뒤의 지연을 볼 수 있습니다).
+
+실행: 저장소 루트에서 ``python -m benchmarks.load_test --sessions 8 --rounds 2``
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+import warnings
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "load_test.json")
+PERCENTILES = (50, 95, 99)
+TIMEOUT = 120
+
+ANGLE_BUTTONS = (0, 30, 45, 60, 90, 120, 135, 150, 180, 270)
+TRIG_FUNCS = ("sin", "cos", "tan")
+SLIDER_SWEEP = (0.5, 1.0, 1.5, 2.0, 3.0)
+
+
+def _timed(at, samples):
+    """AppTest 재실행 한 번의 시간을 재서 기록합니다."""
+    start = time.perf_counter()
+    at.run(timeout=TIMEOUT)
+    samples.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at
+
+
+def quiz_scenario(samples):
+    """퀴즈 시작 → 문제마다 정답 확인 → 다음 문제를 퀴즈가 끝날 때까지 반복합니다."""
+    at = _timed(AppTest.from_file(os.path.join(ROOT, "main.py"), default_timeout=TIMEOUT), samples)
+    at.button[0].click()
+    _timed(at, samples)
+    while at.session_state.quiz_started:
+        at.button[0].click()  # 정답 확인
+        _timed(at, samples)
+        at.button[0].click()  # 다음 문제 / 퀴즈 종료
+        _timed(at, samples)
+
+
+def radian_scenario(samples):
+    """각도 버튼을 차례로 누르고, 누를 때마다 삼각함수를 바꿉니다."""
+    at = _timed(AppTest.from_file(os.path.join(ROOT, "pages", "00_radian.py"), default_timeout=TIMEOUT), samples)
+    for i, degrees in enumerate(ANGLE_BUTTONS):
+        at.button(key=f"angle_{degrees}_도 (Degrees)").click()
+        _timed(at, samples)
+        at.radio(key="selected_func").set_value(TRIG_FUNCS[i % len(TRIG_FUNCS)])
+        _timed(at, samples)
+
+
+def graph_scenario(samples):
+    """진폭 슬라이더와 주파수 슬라이더를 차례로 움직입니다."""
+    at = _timed(AppTest.from_file(os.path.join(ROOT, "pages", "01_graph.py"), default_timeout=TIMEOUT), samples)
+    for slider_index in (0, 1):
+        for value in SLIDER_SWEEP:
+            at.sidebar.slider[slider_index].set_value(value)
+            _timed(at, samples)
+
+
+SCENARIOS = {
+    "quiz": quiz_scenario,
+    "radian": radian_scenario,
+    "graph": graph_scenario,
+}
+
+
+def peak_rss_mib():
+    """이 프로세스의 최대 RSS (MiB). Linux는 KiB, macOS는 byte 단위로 돌려줍니다."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def session_worker(name, rounds, ready, start, results):
+    """작업 프로세스 하나 = 세션 하나. 모두 준비되면 동시에 시나리오를 실행합니다."""
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    samples = []
+    error = None
+    ready.wait()
+    start.wait()
+    try:
+        for _ in range(rounds):
+            SCENARIOS[name](samples)
+    except Exception as exc:  # 한 세션이 실패해도 나머지 세션 결과는 모음
+        error = f"{type(exc).__name__}: {exc}"
+    results.put((samples, peak_rss_mib(), error))
+
+
+def run_scenario(name, sessions, rounds):
+    """세션 N개가 시나리오를 rounds번씩 동시에 실행하고 지표를 모읍니다."""
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Barrier(sessions + 1)
+    start = ctx.Barrier(sessions + 1)
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=session_worker, args=(name, rounds, ready, start, results), daemon=True)
+        for _ in range(sessions)
+    ]
+    for worker in workers:
+        worker.start()
+    ready.wait()  # 모든 프로세스가 streamlit import를 마칠 때까지 대기
+
+    start.wait()
+    t0 = time.perf_counter()
+    samples, rss, errors = [], [], []
+    for _ in range(sessions):
+        session_samples, session_rss, error = results.get()
+        samples.extend(session_samples)
+        rss.append(session_rss)
+        if error:
+            errors.append(error)
+    wall = time.perf_counter() - t0
+    for worker in workers:
+        worker.join()
+
+    latencies = np.array(samples) * 1000
+    result = {
+        "sessions": sessions,
+        "rounds": rounds,
+        "reruns": int(latencies.size),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(latencies.size / wall, 2) if wall > 0 else 0.0,
+        "peak_rss_mib": round(max(rss), 1),
+        "total_rss_mib": round(sum(rss), 1),
+        "errors": errors,
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_ms"] = round(float(np.percentile(latencies, p)), 2) if latencies.size else None
+    result["mean_ms"] = round(float(latencies.mean()), 2) if latencies.size else None
+    return result
+
+
+def compare(current, previous):
+    """시나리오별 p95와 처리량의 변화율을 출력합니다."""
+    print("\n이전 결과 대비")
+    for name, now in current["scenarios"].items():
+        before = previous.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        for key in ("p95_ms", "throughput_rps"):
+            if before.get(key) and now.get(key) is not None:
+                change = (now[key] - before[key]) / before[key] * 100
+                print(f"  {name:<8} {key:<15} {before[key]:>10.2f} → {now[key]:>10.2f} ({change:+.1f}%)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8, help="동시 세션 수")
+    parser.add_argument("--rounds", type=int, default=1, help="세션마다 시나리오를 반복할 횟수")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "scenarios": {},
+    }
+    print(f"{'scenario':<8} {'reruns':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rerun/s':>8} {'RSS MiB':>8}")
+    for name in args.scenarios:
+        result = run_scenario(name, args.sessions, args.rounds)
+        report["scenarios"][name] = result
+        print(f"{name:<8} {result['reruns']:>7} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+              f"{result['p99_ms']:>8.1f} {result['throughput_rps']:>8.1f} {result['peak_rss_mib']:>8.1f}")
+        for error in result["errors"]:
+            print(f"  오류: {error}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+    return 1 if any(r["errors"] for r in report["scenarios"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
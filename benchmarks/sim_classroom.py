@@ -0,0 +1,131 @@
+"""수업 모드에 학생 수백 명이 동시에 제출하는 상황을 흉내 내 집계의 정확성과 지연을 확인합니다.
+
+학생 스레드 STUDENTS개가 문제마다 배리어에서 동시에 출발해 답을 내고(일부는 중복 제출도
+시도), 대시보드 스레드는 그동안 계속 스냅샷을 읽습니다. 문제마다 다음을 확인합니다.
+
+- 보기별 응답 수가 학생들이 실제로 낸 답의 개수와 정확히 같은지 (중복 제출은 세지 않음)
+- 대시보드가 본 응답 수가 줄어들거나 학생 수를 넘은 적이 없는지
+- 제출 p99 지연이 ``P99_LIMIT_MS`` 이하인지
+
+조각 1개(전역 락 하나와 같음)와 기본 조각 수를 비교하고, 확인에 실패하면 종료 코드 1을 돌려줍니다.
+같은 집계 정확성 확인과 제출 p99 기준은 ``tests/test_classroom.py``에도 있어 pytest로 매번 돌아갑니다.
+
+실행: 저장소 루트에서 ``python -m benchmarks.sim_classroom [학생 수]``
+"""
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+
+from trigkit.classroom import SHARDS, Classroom
+
+STUDENTS = 300
+QUESTIONS = 10
+DUPLICATE_RATE = 0.2  # 이 비율의 학생은 같은 문제에 한 번 더 제출을 시도
+P99_LIMIT_MS = 5.0
+
+OPTIONS = ["A", "B", "C", "D"]
+
+
+def simulate(shards, students):
+    questions = [{"question": f"Q{i}", "answer": "A", "options": OPTIONS} for i in range(QUESTIONS)]
+    room = Classroom("000000", "teacher", questions, shards=shards)
+    barrier = threading.Barrier(students + 1)
+    submit_ns = []
+    chosen = [[None] * students for _ in range(QUESTIONS)]
+    problems = []
+    lock = threading.Lock()
+
+    def student(sid):
+        rng = random.Random(sid)
+        student_id = f"student-{sid}"
+        room.join(student_id)
+        local = []
+        for position in range(QUESTIONS):
+            barrier.wait()
+            option = rng.choice(OPTIONS)
+            t0 = time.perf_counter_ns()
+            accepted = room.submit(student_id, position, option)
+            local.append(time.perf_counter_ns() - t0)
+            if accepted:
+                chosen[position][sid] = option
+            if rng.random() < DUPLICATE_RATE and room.submit(student_id, position, rng.choice(OPTIONS)):
+                with lock:
+                    problems.append(f"문제 {position}: {student_id}의 중복 제출이 받아들여짐")
+            barrier.wait()
+        with lock:
+            submit_ns.extend(local)
+
+    stop = threading.Event()
+    snapshot_ns = []
+
+    def dashboard():
+        last = (0, 0)
+        while not stop.is_set():
+            t0 = time.perf_counter_ns()
+            snapshot = room.snapshot()
+            snapshot_ns.append(time.perf_counter_ns() - t0)
+            answered = snapshot.answered
+            if answered > students:
+                problems.append(f"문제 {snapshot.position}: 응답 수 {answered}가 학생 수를 넘음")
+            if snapshot.position == last[0] and answered < last[1]:
+                problems.append(f"문제 {snapshot.position}: 응답 수가 {last[1]}에서 {answered}로 줄어듦")
+            last = (snapshot.position, answered)
+            time.sleep(0.001)
+
+    threads = [threading.Thread(target=student, args=(i,)) for i in range(students)]
+    watcher = threading.Thread(target=dashboard)
+    for t in threads:
+        t.start()
+    watcher.start()
+    start = time.perf_counter()
+    for position in range(QUESTIONS):
+        barrier.wait()  # 모두 출발
+        barrier.wait()  # 모두 제출 끝
+        snapshot = room.snapshot()
+        expected = Counter(option for option in chosen[position] if option is not None)
+        actual = dict(zip(OPTIONS, snapshot.counts))
+        if snapshot.answered != students or any(actual[o] != expected.get(o, 0) for o in OPTIONS):
+            problems.append(f"문제 {position}: 집계 {actual} ≠ 실제 {dict(expected)}")
+        room.advance("teacher")
+    wall = time.perf_counter() - start
+    stop.set()
+    for t in threads:
+        t.join()
+    watcher.join()
+
+    submit_ms = np.array(submit_ns) / 1e6
+    snapshot_ms = np.array(snapshot_ns) / 1e6
+    return {
+        "shards": shards,
+        "submits": len(submit_ms),
+        "p50": np.percentile(submit_ms, 50),
+        "p99": np.percentile(submit_ms, 99),
+        "max": submit_ms.max(),
+        "snapshot_p99": np.percentile(snapshot_ms, 99) if len(snapshot_ms) else 0.0,
+        "wall": wall,
+        "joined": room.snapshot().joined,
+        "problems": problems,
+    }
+
+
+def main(students=STUDENTS):
+    print(f"학생 {students}명 · 문제 {QUESTIONS}개 · 중복 제출 시도 {DUPLICATE_RATE:.0%}")
+    print(f"{'조각':>4} {'제출':>6} {'p50 ms':>8} {'p99 ms':>8} {'최대 ms':>8} {'스냅샷 p99':>10} {'참여':>5} {'결과':>6}")
+    failed = False
+    for shards in (1, SHARDS):
+        r = simulate(shards, students)
+        ok = not r["problems"] and r["joined"] == students and r["p99"] <= P99_LIMIT_MS
+        failed |= not ok
+        print(f"{r['shards']:>4} {r['submits']:>6} {r['p50']:>8.3f} {r['p99']:>8.3f} {r['max']:>8.2f} "
+              f"{r['snapshot_p99']:>10.3f} {r['joined']:>5} {'OK' if ok else '실패':>6}")
+        for problem in r["problems"][:10]:
+            print(f"  {problem}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else STUDENTS))
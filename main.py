@@ -1,5 +1,21 @@
+import os
+import secrets
+import time
+
+import pandas as pd
 import streamlit as st
-import random
+
+from trigkit import instrumentation
+from trigkit.admin_panel import render_admin_panel
+from trigkit.attempt_log import AttemptLog
+from trigkit.classroom import create_classroom_registry
+from trigkit.question_bank import load_question_bank
+from trigkit.question_gen import QuestionPool, stats_key
+from trigkit.review_schedule import ReviewRegistry, ReviewStore
+from trigkit.quiz_state import answer_bit, apply_permutation, index_array, random_permutation_code, set_answer_bit
+from trigkit.session_store import SessionSync
+
+instrumentation.begin_rerun("main")
 
 # --- 0. 페이지 설정 (가장 먼저 실행되어야 함) ---
 st.set_page_config(
@@ -10,228 +26,499 @@ st.set_page_config(
 )
 
 # --- CSS 스타일링 (배경색, 폰트 등) ---
-st.markdown(
-    """
-    <style>
-    /* 배경색 그라데이션 (고등학생들이 좋아할 만한 밝은 색상) */
-    .stApp {
-        background: linear-gradient(to right, #e0f2f7, #d4edda); /* 하늘색에서 연두색 그라데이션 */
-        color: #333333; /* 기본 텍스트 색상 */
-    }
-
-    /* 제목 스타일 */
-    h1 {
-        color: #2c3e50; /* 진한 파란색 */
-        text-align: center;
-        font-size: 3.5em; /* 제목 크기 키우기 */
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.1); /* 그림자 효과 */
-    }
-
-    /* 부제목 (문제 번호) 스타일 */
-    h2 {
-        color: #2980b9; /* 파란색 */
-        text-align: center;
-        font-size: 2em;
-    }
-
-    /* 문제 텍스트 스타일 */
-    h3 {
-        color: #34495e; /* 진한 회색 */
-        text-align: center;
-        font-size: 1.8em;
-        padding-bottom: 20px;
-    }
-
-    /* 라디오 버튼 텍스트 스타일 */
-    .stRadio > label {
-        font-size: 1.2em;
-        margin-bottom: 10px; /* 보기 간 간격 추가 */
-    }
-    .stRadio div[role="radiogroup"] {
-        padding: 10px;
-        background-color: rgba(255,255,255,0.7); /* 반투명 흰색 배경 */
-        border-radius: 10px;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1); /* 그림자 */
-    }
-    .stRadio div[role="radiogroup"] > label {
-        padding: 8px 15px;
-        border-radius: 8px;
-        margin: 5px 0;
-        transition: background-color 0.3s ease; /* 호버 효과 */
-    }
-    .stRadio div[role="radiogroup"] > label:hover {
-        background-color: rgba(200, 200, 200, 0.3); /* 호버 시 배경색 변경 */
-    }
+with instrumentation.phase("main.css_inject"):
+    st.markdown(
+        """
+        <style>
+        /* 배경색 그라데이션 (고등학생들이 좋아할 만한 밝은 색상) */
+        .stApp {
+            background: linear-gradient(to right, #e0f2f7, #d4edda); /* 하늘색에서 연두색 그라데이션 */
+            color: #333333; /* 기본 텍스트 색상 */
+        }
+
+        /* 제목 스타일 */
+        h1 {
+            color: #2c3e50; /* 진한 파란색 */
+            text-align: center;
+            font-size: 3.5em; /* 제목 크기 키우기 */
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.1); /* 그림자 효과 */
+        }
+
+        /* 부제목 (문제 번호) 스타일 */
+        h2 {
+            color: #2980b9; /* 파란색 */
+            text-align: center;
+            font-size: 2em;
+        }
+
+        /* 문제 텍스트 스타일 */
+        h3 {
+            color: #34495e; /* 진한 회색 */
+            text-align: center;
+            font-size: 1.8em;
+            padding-bottom: 20px;
+        }
+
+        /* 라디오 버튼 텍스트 스타일 */
+        .stRadio > label {
+            font-size: 1.2em;
+            margin-bottom: 10px; /* 보기 간 간격 추가 */
+        }
+        .stRadio div[role="radiogroup"] {
+            padding: 10px;
+            background-color: rgba(255,255,255,0.7); /* 반투명 흰색 배경 */
+            border-radius: 10px;
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1); /* 그림자 */
+        }
+        .stRadio div[role="radiogroup"] > label {
+            padding: 8px 15px;
+            border-radius: 8px;
+            margin: 5px 0;
+            transition: background-color 0.3s ease; /* 호버 효과 */
+        }
+        .stRadio div[role="radiogroup"] > label:hover {
+            background-color: rgba(200, 200, 200, 0.3); /* 호버 시 배경색 변경 */
+        }
     
-    /* 버튼 스타일 */
-    .stButton > button {
-        background-color: #2ecc71; /* 에메랄드 그린 */
-        color: white;
-        font-size: 1.2em;
-        padding: 10px 20px;
-        border-radius: 10px;
-        border: none;
-        cursor: pointer;
-        transition: background-color 0.3s ease;
-        display: block; /* 버튼 중앙 정렬을 위해 블록 요소로 변경 */
-        margin: 20px auto; /* 중앙 정렬 */
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-    }
-    .stButton > button:hover {
-        background-color: #27ae60; /* 호버 시 더 진한 그린 */
-    }
-    /* 점수 표시 */
-    .st-emotion-cache-1jmvejs { /* st.write로 출력되는 요소의 클래스 (버전별로 다를 수 있음) */
-        text-align: center;
-        font-size: 1.5em;
-        color: #3498db;
-        font-weight: bold;
-    }
-    /* 정보/성공/오류 메시지 */
-    .stAlert {
-        text-align: center;
-        font-size: 1.2em;
-    }
-    </style>
-    """,
-    unsafe_allow_html=True
-)
+        /* 버튼 스타일 */
+        .stButton > button {
+            background-color: #2ecc71; /* 에메랄드 그린 */
+            color: white;
+            font-size: 1.2em;
+            padding: 10px 20px;
+            border-radius: 10px;
+            border: none;
+            cursor: pointer;
+            transition: background-color 0.3s ease;
+            display: block; /* 버튼 중앙 정렬을 위해 블록 요소로 변경 */
+            margin: 20px auto; /* 중앙 정렬 */
+            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+        }
+        .stButton > button:hover {
+            background-color: #27ae60; /* 호버 시 더 진한 그린 */
+        }
+        /* 점수 표시 */
+        .st-emotion-cache-1jmvejs { /* st.write로 출력되는 요소의 클래스 (버전별로 다를 수 있음) */
+            text-align: center;
+            font-size: 1.5em;
+            color: #3498db;
+            font-weight: bold;
+        }
+        /* 정보/성공/오류 메시지 */
+        .stAlert {
+            text-align: center;
+            font-size: 1.2em;
+        }
+        </style>
+        """,
+        unsafe_allow_html=True
+    )
 
 
 # --- 1. 퀴즈 문제 데이터 정의 ---
-QUIZ_QUESTIONS = [
-    {
-        "question": r"$\cos(60^\circ)$의 값은 무엇인가요?",
-        "answer": r"$1/2$",
-        "options": [r"$1/2$", r"$\sqrt{3}/2$", r"$\sqrt{2}/2$", r"$0$"]
-    },
-    {
-        "question": r"$\sin(30^\circ)$의 값은 무엇인가요?",
-        "answer": r"$1/2$",
-        "options": [r"$1/2$", r"$\sqrt{3}/2$", r"$\sqrt{2}/2$", r"$0$"]
-    },
-    {
-        "question": r"$\tan(45^\circ)$의 값은 무엇인가요?",
-        "answer": r"$1$",
-        "options": [r"$1$", r"$0$", r"정의되지 않음", r"$\sqrt{3}$"]
-    },
-    {
-        "question": r"다음 중 $\sin^2\theta + \cos^2\theta$ 와 항상 같은 값은 무엇인가요?",
-        "answer": r"$1$",
-        "options": [r"$1$", r"$0$", r"$\tan^2\theta$", r"$\sec^2\theta$"]
-    },
-    {
-        "question": r"직각삼각형에서 빗변이 5이고 높이(대변)가 3일 때, $\sin$ 값은 무엇인가요?",
-        "answer": r"$3/5$",
-        "options": [r"$3/5$", r"$4/5$", r"$3/4$", r"$5/3$"]
-    },
-    {
-        "question": r"사인 함수의 주기는 얼마인가요?",
-        "answer": r"$2\pi$",
-        "options": [r"$2\pi$", r"$\pi$", r"$\pi/2$", r"$4\pi$"]
-    },
-    {
-        "question": r"탄젠트 함수가 정의되지 않는 $0^\circ$ ~ $360^\circ$ 사이의 각도는 무엇인가요?",
-        "answer": r"$90^\circ$",
-        "options": [r"$90^\circ$", r"$180^\circ$", r"$270^\circ$", r"$0^\circ$"]
-    },
-    {
-        "question": r"$y = \sin(x)$ 그래프의 최댓값은 무엇인가요?",
-        "answer": r"$1$",
-        "options": [r"$1$", r"$0$", r"$-1$", r"$2$"]
-    },
-    # 여기에 새로운 문제 추가
-    {
-        "question": r"사인 함수의 최솟값은 얼마인가요?",
-        "answer": r"$-1$",
-        "options": [r"$-1$", r"$0$", r"$1$", r"$-2$"]
-    }
-]
+# 문제는 외부 파일(JSONL 또는 SQLite)에 두고, 프로세스마다 한 번만 읽어 모든 세션이 공유합니다.
+QUESTION_BANK_PATH = os.environ.get(
+    "TRIG_QUESTION_BANK",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "questions.jsonl"),
+)
+# 답안 기록(리더보드, 문제별 정답률)을 남기는 SQLite 파일
+ATTEMPT_DB_PATH = os.environ.get(
+    "TRIG_ATTEMPT_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "attempts.sqlite3"),
+)
+QUIZ_LENGTH = 10 # 한 번의 퀴즈에서 푸는 최대 문제 수
+ALL_OPTION = "전체"
+PLAY_MODES = ("혼자 풀기", "수업 참여 (학생)", "수업 진행 (교사)")
+DASHBOARD_REFRESH_SECONDS = 1 # 교사 대시보드 갱신 주기
+STUDENT_POLL_SECONDS = 2 # 학생 화면이 다음 문제로 넘어갔는지 확인하는 주기
+
+@st.cache_resource(show_spinner="문제 은행을 불러오는 중...")
+def get_question_bank(path):
+    return load_question_bank(path)
+
+# 자동 생성 문제는 백그라운드에서 미리 만들어 두는 풀에서 꺼냄 (퀴즈 시작이 생성을 기다리지 않음)
+@st.cache_resource(show_spinner=False)
+def get_question_pool():
+    return QuestionPool()
+
+# 답안은 큐에 넣기만 하고 백그라운드 스레드가 모아서 씀 (정답 확인 클릭이 DB 쓰기를 기다리지 않음)
+@st.cache_resource(show_spinner=False)
+def get_attempt_log(path):
+    return AttemptLog(path)
+
+# 사용자별 복습 일정 (문제 은행 출제 순서를 정함). 상태는 답안 기록과 같은 SQLite 파일에 백그라운드로 저장
+@st.cache_resource(show_spinner=False)
+def get_review_registry(path):
+    return ReviewRegistry(ReviewStore(path))
+
+# 수업 모드: 진행 중인 수업들은 모든 세션이 함께 봄. 세션 저장소를 SQLite로 공유하는 여러 프로세스
+# 배포에서는 수업도 같은 파일에 두어 교사와 학생이 다른 프로세스에 붙어도 같은 수업을 봄
+@st.cache_resource(show_spinner=False)
+def get_classroom_registry():
+    return create_classroom_registry(os.environ.get("TRIG_SESSION_STORE", "memory"))
+
+question_bank = get_question_bank(QUESTION_BANK_PATH)
+question_pool = get_question_pool()
+attempt_log = get_attempt_log(ATTEMPT_DB_PATH)
+review_registry = get_review_registry(ATTEMPT_DB_PATH)
+classroom_registry = get_classroom_registry()
+
+QUIZ_SOURCES = ("문제 은행", "자동 생성 문제")
 
 # --- 2. Streamlit 앱 상태 관리 ---
+# 퀴즈 진행 상황은 세션 저장소에도 저장해 다른 서버 프로세스로 다시 연결되어도 이어서 풂
+session_sync = SessionSync("quiz", (
+    "quiz_started", "current_question_index", "score", "quiz_order", "show_feedback", "user_answer",
+    "option_perm", "answer_bits", "quiz_total", "quiz_seed", "user_name", "question_shown_at", "learner_id",
+))
+session_sync.restore(st.session_state, st.query_params, st.context.cookies)
+sid_cookie_script = session_sync.cookie_script(st.session_state)
+if sid_cookie_script: # 새 세션이면 sid를 주소가 아닌 쿠키에 넣어 둠 (링크를 공유해도 세션이 넘어가지 않게)
+    st.html(sid_cookie_script, unsafe_allow_javascript=True)
+
 if "quiz_started" not in st.session_state:
     st.session_state.quiz_started = False
 if "current_question_index" not in st.session_state:
     st.session_state.current_question_index = 0
 if "score" not in st.session_state:
     st.session_state.score = 0
-if "quiz_questions_shuffled" not in st.session_state:
-    st.session_state.quiz_questions_shuffled = []
+# 세션 상태는 작게 유지: 출제 순서는 문제 인덱스 배열, 보기 순서는 순열 번호, 채점 결과는 비트맵
+if "quiz_order" not in st.session_state:
+    st.session_state.quiz_order = index_array([], len(question_bank))
 if "show_feedback" not in st.session_state:
     st.session_state.show_feedback = False
 if "user_answer" not in st.session_state:
     st.session_state.user_answer = None
-if "current_options_shuffled" not in st.session_state:
-    st.session_state.current_options_shuffled = []
+if "option_perm" not in st.session_state:
+    st.session_state.option_perm = 0
+if "answer_bits" not in st.session_state:
+    st.session_state.answer_bits = 0
+if "quiz_total" not in st.session_state:
+    st.session_state.quiz_total = 0
+if "quiz_seed" not in st.session_state:
+    st.session_state.quiz_seed = None # None이면 문제 은행, 정수이면 자동 생성 묶음의 시드
+if "user_name" not in st.session_state:
+    st.session_state.user_name = f"익명-{secrets.token_hex(8)}" # 리더보드에 보이는 이름 (바꿀 수 있음)
+if "learner_id" not in st.session_state:
+    st.session_state.learner_id = secrets.token_hex(16) # 복습 일정의 키. 닉네임과 달리 겹치거나 바뀌지 않음
+if "question_shown_at" not in st.session_state:
+    st.session_state.question_shown_at = 0.0 # 현재 문제를 보여 준 시각 (응답 시간 계산용)
+# 수업 모드: 참여 중인 수업 코드, 교사 토큰(교사만), 학생 id, 마지막으로 낸 답 (문제 번호, 보기)
+if "classroom_code" not in st.session_state:
+    st.session_state.classroom_code = None
+if "classroom_token" not in st.session_state:
+    st.session_state.classroom_token = None
+if "classroom_student_id" not in st.session_state:
+    st.session_state.classroom_student_id = secrets.token_hex(8)
+if "classroom_answer" not in st.session_state:
+    st.session_state.classroom_answer = None
 
 
+# 현재 퀴즈의 문제 출처, 현재 문제와 현재 보기 순서
+def get_quiz_bank():
+    if st.session_state.quiz_seed is None:
+        return question_bank
+    return question_pool.get(st.session_state.quiz_seed)
+
+def get_current_question():
+    return get_quiz_bank()[st.session_state.quiz_order[st.session_state.current_question_index]]
+
+def get_current_options():
+    return apply_permutation(get_current_question()["options"], st.session_state.option_perm)
+
 # 퀴즈 시작 함수
-def start_quiz():
+def start_quiz(tag=None, difficulty=None, generated=False):
+    with instrumentation.phase("main.question_select"):
+        if generated:
+            # 자동 생성 문제는 매번 새 묶음이므로 인덱스만 무작위로 뽑음 (뽑힌 순서가 곧 출제 순서)
+            quiz_seed, bank = question_pool.take()
+            indices = bank.sample_indices(QUIZ_LENGTH, tag=tag, difficulty=difficulty)
+        else:
+            # 문제 은행은 복습 일정에 따라 복습할 때가 된 문제 → 새 문제 순으로 고름
+            quiz_seed, bank = None, question_bank
+            candidates = None if tag is None and difficulty is None else bank.candidate_indices(tag, difficulty)
+            # 다른 서버 프로세스에서 푼 기록이 있을 수 있으므로 퀴즈 시작 때만 저장소와 맞춰 봄
+            scheduler = review_registry.get(st.session_state.learner_id, bank, refresh=True)
+            indices = scheduler.select(QUIZ_LENGTH, candidates, filter_key=(tag, difficulty))
+    if len(indices) == 0:
+        st.session_state.quiz_started = False
+        return
+
     st.session_state.quiz_started = True
+    st.session_state.quiz_seed = quiz_seed
     st.session_state.current_question_index = 0
     st.session_state.score = 0
-    st.session_state.quiz_questions_shuffled = random.sample(QUIZ_QUESTIONS, len(QUIZ_QUESTIONS)) # 문제 순서 섞기
-    
+    st.session_state.quiz_order = index_array(indices, len(bank))
+    st.session_state.quiz_total = len(indices)
+    st.session_state.answer_bits = 0
+
     # 첫 번째 문제의 보기 순서 저장
-    current_q = st.session_state.quiz_questions_shuffled[st.session_state.current_question_index]
-    st.session_state.current_options_shuffled = random.sample(current_q["options"], len(current_q["options"]))
+    current_q = get_current_question()
+    st.session_state.option_perm = random_permutation_code(len(current_q["options"]))
 
     st.session_state.show_feedback = False
     st.session_state.user_answer = None
+    st.session_state.question_shown_at = time.time()
 
 # 다음 문제로 이동 함수
 def next_question():
     st.session_state.show_feedback = False
     st.session_state.user_answer = None
 
-    if st.session_state.current_question_index < len(st.session_state.quiz_questions_shuffled) - 1:
+    if st.session_state.current_question_index < len(st.session_state.quiz_order) - 1:
         st.session_state.current_question_index += 1
-        current_q = st.session_state.quiz_questions_shuffled[st.session_state.current_question_index]
-        st.session_state.current_options_shuffled = random.sample(current_q["options"], len(current_q["options"]))
+        current_q = get_current_question()
+        st.session_state.option_perm = random_permutation_code(len(current_q["options"]))
+        st.session_state.question_shown_at = time.time()
     else:
         st.session_state.quiz_started = False
         st.session_state.current_question_index = 0
-        st.session_state.quiz_questions_shuffled = []
-        st.session_state.current_options_shuffled = []
+        st.session_state.quiz_order = index_array([], len(question_bank))
+        st.session_state.option_perm = 0
+        st.session_state.quiz_seed = None
         st.rerun()
 
 # 답변 제출 함수
 def submit_answer(selected_option):
-    current_q = st.session_state.quiz_questions_shuffled[st.session_state.current_question_index]
+    current_q = get_current_question()
     st.session_state.user_answer = selected_option
     st.session_state.show_feedback = True
 
-    if selected_option == current_q["answer"]:
+    is_correct = selected_option == current_q["answer"]
+    latency_ms = (time.time() - st.session_state.question_shown_at) * 1000
+    # 생성 문제는 묶음마다 id가 새로 생기므로 문제 유형별로 모아 기록
+    attempt_log.record(st.session_state.user_name, stats_key(current_q), is_correct, latency_ms)
+    if st.session_state.quiz_seed is None:
+        # 중간에 그만둬도 복습 일정이 남도록 답할 때마다 저장을 맡김 (쓰기 스레드가 모아서 씀, 클릭은 기다리지 않음)
+        review_registry.get(st.session_state.learner_id, question_bank).record(current_q["id"], is_correct, latency_ms)
+        review_registry.save_later(st.session_state.learner_id)
+
+    if is_correct:
         st.session_state.score += 1
+        st.session_state.answer_bits = set_answer_bit(st.session_state.answer_bits, st.session_state.current_question_index)
         st.success("정답입니다! 🎉 정답을 맞히다니, 최고! 😎")
     else:
         st.error(f"오답입니다. 😢 정답은 '{current_q['answer']}' 이에요! 다음엔 꼭 맞춰봐요! ✨")
 
+# --- 수업 모드 ---
+def create_classroom():
+    indices = question_bank.sample_indices(QUIZ_LENGTH)
+    room, token = classroom_registry.create([question_bank[int(i)] for i in indices])
+    st.session_state.classroom_code = room.code
+    st.session_state.classroom_token = token
+
+def leave_classroom():
+    if st.session_state.classroom_token:
+        classroom_registry.close(st.session_state.classroom_code, st.session_state.classroom_token)
+    st.session_state.classroom_code = None
+    st.session_state.classroom_token = None
+    st.session_state.classroom_answer = None
+
+def teacher_action(action):
+    room = classroom_registry.get(st.session_state.classroom_code)
+    if room is not None:
+        getattr(room, action)(st.session_state.classroom_token)
+
+def submit_classroom_answer(code, position, option):
+    room = classroom_registry.get(code)
+    if option is None or room is None:
+        return
+    if room.submit(st.session_state.classroom_student_id, position, option):
+        st.session_state.classroom_answer = (position, option)
+
+def option_label(i):
+    return f"보기 {i + 1}"
+
+def teacher_view():
+    room = classroom_registry.get(st.session_state.classroom_code) if st.session_state.classroom_code else None
+    if room is None or not room.is_teacher(st.session_state.classroom_token):
+        st.info("수업을 만들면 학생들이 수업 코드로 참여해 같은 문제를 함께 풀어요. 문제는 선생님이 넘겨요.")
+        st.button("🏫 수업 만들기", on_click=create_classroom)
+        return
+    st.subheader(f"수업 코드: {room.code}")
+    classroom_dashboard(room.code)
+
+# 대시보드는 이 영역만 주기적으로 다시 그림 (집계 스냅샷 읽기는 조각별 합계뿐이라 가벼움)
+@st.fragment(run_every=DASHBOARD_REFRESH_SECONDS)
+def classroom_dashboard(code):
+    room = classroom_registry.get(code)
+    if room is None:
+        st.info("수업이 종료되었어요.")
+        return
+    snapshot = room.snapshot()
+    if snapshot.finished:
+        st.success(f"🎉 {snapshot.total_questions}문제를 모두 마쳤어요!")
+        st.button("수업 끝내기", on_click=leave_classroom)
+        return
+
+    question = room.question(snapshot.position)
+    st.markdown(f"**문제 {snapshot.position + 1} / {snapshot.total_questions}** · 참여 {snapshot.joined}명 · 응답 {snapshot.answered}명")
+    st.markdown(r"### " + question["question"])
+    for i, option in enumerate(question["options"]):
+        st.markdown(f"{option_label(i)}: {option}")
+    st.bar_chart(
+        pd.DataFrame({"응답 수": snapshot.counts}, index=[option_label(i) for i in range(len(snapshot.counts))]),
+        horizontal=True,
+    )
+    if snapshot.revealed:
+        st.success(f"정답: {question['answer']}")
+
+    reveal_col, next_col, end_col = st.columns(3)
+    with reveal_col:
+        st.button("👀 정답 공개", on_click=teacher_action, args=("reveal",), disabled=snapshot.revealed)
+    with next_col:
+        st.button("➡️ 다음 문제", on_click=teacher_action, args=("advance",))
+    with end_col:
+        st.button("수업 끝내기", on_click=leave_classroom)
+
+def student_view():
+    room = classroom_registry.get(st.session_state.classroom_code) if st.session_state.classroom_code else None
+    if room is None:
+        if st.session_state.classroom_code:
+            st.info("참여했던 수업이 종료되었어요. 함께해 줘서 고마워요! 👏")
+            st.session_state.classroom_code = None
+            st.session_state.classroom_answer = None
+        code = st.text_input("수업 코드", max_chars=6, placeholder="선생님이 알려 준 6자리 숫자").strip()
+        if st.button("🙋 참여하기"):
+            room = classroom_registry.get(code)
+            if room is None:
+                st.error("수업을 찾을 수 없어요. 코드를 다시 확인해 주세요.")
+                return
+            room.join(st.session_state.classroom_student_id)
+            st.session_state.classroom_code = room.code
+            st.rerun()
+        return
+    classroom_student_panel(room.code)
+
+# 학생 화면은 선생님이 다음 문제로 넘겼는지 주기적으로 확인
+@st.fragment(run_every=STUDENT_POLL_SECONDS)
+def classroom_student_panel(code):
+    room = classroom_registry.get(code)
+    if room is None:
+        st.info("수업이 종료되었어요. 함께해 줘서 고마워요! 👏")
+        st.button("나가기", on_click=leave_classroom)
+        return
+    snapshot = room.snapshot()
+    if snapshot.finished:
+        st.success("🎉 오늘 수업 퀴즈가 모두 끝났어요!")
+        st.button("나가기", on_click=leave_classroom)
+        return
+
+    question = room.question(snapshot.position)
+    st.subheader(f"문제 {snapshot.position + 1} / {snapshot.total_questions} 🧐")
+    st.markdown(r"### " + question["question"])
+
+    my_answer = st.session_state.classroom_answer
+    if my_answer is not None and my_answer[0] == snapshot.position:
+        if not snapshot.revealed:
+            st.info("제출 완료! 선생님이 정답을 공개할 때까지 기다려 주세요. ⏳")
+        elif my_answer[1] == question["answer"]:
+            st.success("정답입니다! 🎉")
+        else:
+            st.error(f"아쉬워요 😢 정답은 '{question['answer']}' 이에요!")
+    elif snapshot.revealed:
+        st.warning(f"정답이 공개되었어요: {question['answer']}")
+    else:
+        # 미리 골라 둔 보기 없이 시작해 학생이 직접 고르게 함
+        choice = st.radio("정답을 선택하세요:", question["options"], index=None,
+                          key=f"classroom_{code}_{snapshot.position}")
+        st.button("✨ 제출! ✨", on_click=submit_classroom_answer, args=(code, snapshot.position, choice),
+                  disabled=choice is None)
+
 # --- 3. 퀴즈 UI 렌더링 ---
-if not st.session_state.quiz_started:
+play_mode = PLAY_MODES[0] if st.session_state.quiz_started else st.radio("참여 방식", PLAY_MODES, horizontal=True)
+
+if play_mode == PLAY_MODES[2]:
+    teacher_view()
+
+elif play_mode == PLAY_MODES[1]:
+    student_view()
+
+elif not st.session_state.quiz_started:
     st.info("삼각함수 지식을 테스트해 볼 시간! 🚀 지금 바로 퀴즈를 시작해 볼까요? 궁금하면 500원 말고 버튼 클릭! 😅")
-    st.button("✨ 퀴즈 시작! ✨", on_click=start_quiz)
+
+    # 리더보드에 표시될 이름
+    user_name = st.text_input("닉네임", value=st.session_state.user_name, max_chars=20).strip()
+    if user_name:
+        st.session_state.user_name = user_name
+
+    # 출제 방식, 주제, 난이도를 골라 해당 문제만 출제
+    quiz_source = st.radio("출제 방식", QUIZ_SOURCES, horizontal=True)
+    generated = quiz_source == QUIZ_SOURCES[1]
+    source_bank = question_pool.peek() if generated else question_bank
+
+    tag_col, difficulty_col = st.columns(2)
+    with tag_col:
+        selected_tag = st.selectbox("주제", [ALL_OPTION] + source_bank.tags)
+    with difficulty_col:
+        selected_difficulty = st.selectbox("난이도", [ALL_OPTION] + source_bank.difficulties)
+    quiz_tag = None if selected_tag == ALL_OPTION else selected_tag
+    quiz_difficulty = None if selected_difficulty == ALL_OPTION else selected_difficulty
+
+    if len(source_bank.candidate_indices(quiz_tag, quiz_difficulty)) == 0:
+        st.warning("선택한 조건에 맞는 문제가 없어요. 다른 주제나 난이도를 골라 보세요!")
+    else:
+        st.button("✨ 퀴즈 시작! ✨", on_click=start_quiz, args=(quiz_tag, quiz_difficulty, generated))
 
     if (st.session_state.current_question_index == 0 and
-        not st.session_state.quiz_questions_shuffled and
+        not st.session_state.quiz_order and
         st.session_state.score > 0):
         st.balloons() # 퀴즈 종료 시 풍선 효과!
+        marks = "".join(
+            "⭕" if answer_bit(st.session_state.answer_bits, i) else "❌"
+            for i in range(st.session_state.quiz_total)
+        )
         st.success(
             f"🎉 퀴즈 종료! 🎉\n\n"
-            f"총 {len(QUIZ_QUESTIONS)}문제 중 **{st.session_state.score}개**를 맞혔습니다!\n"
+            f"총 {st.session_state.quiz_total}문제 중 **{st.session_state.score}개**를 맞혔습니다! {marks}\n"
             f"정말 훌륭해요! 👍 계속 도전해서 삼각함수 마스터가 되어보세요! 🎓"
         )
         st.session_state.score = 0
+        st.session_state.answer_bits = 0
+
+    # 리더보드와 문제별 정답률 (집계 테이블에서 읽고, 새 기록이 쓰였을 때만 다시 조회)
+    with st.expander("🏆 리더보드"):
+        leaders = attempt_log.leaderboard()
+        if leaders:
+            st.dataframe(
+                pd.DataFrame(
+                    [(rank, user, correct, attempts, correct / attempts)
+                     for rank, (user, correct, attempts) in enumerate(leaders, start=1)],
+                    columns=["순위", "닉네임", "맞힌 수", "푼 문제", "정답률"],
+                ),
+                hide_index=True,
+                column_config={"정답률": st.column_config.NumberColumn(format="percent")},
+            )
+        else:
+            st.caption("아직 기록이 없어요. 첫 번째 주인공이 되어 보세요!")
+
+    with st.expander("📊 문제별 정답률 (어려운 문제부터, 생성 문제는 유형별)"):
+        accuracy = attempt_log.question_accuracy()
+        if accuracy:
+            st.dataframe(
+                pd.DataFrame(
+                    [(qid, attempts, correct / attempts, latency_ms / 1000)
+                     for qid, attempts, correct, latency_ms in accuracy],
+                    columns=["문제", "시도", "정답률", "평균 풀이 시간(초)"],
+                ),
+                hide_index=True,
+                column_config={
+                    "정답률": st.column_config.NumberColumn(format="percent"),
+                    "평균 풀이 시간(초)": st.column_config.NumberColumn(format="%.1f"),
+                },
+            )
+        else:
+            st.caption("아직 기록이 없어요.")
 
 
 else:
     current_q_index = st.session_state.current_question_index
-    current_q = st.session_state.quiz_questions_shuffled[current_q_index]
+    current_q = get_current_question()
 
-    st.subheader(f"문제 {current_q_index + 1} / {len(QUIZ_QUESTIONS)} 🧐")
+    st.subheader(f"문제 {current_q_index + 1} / {st.session_state.quiz_total} 🧐")
     st.markdown(r"### " + current_q["question"])
 
-    options_to_display = st.session_state.current_options_shuffled
+    options_to_display = get_current_options()
 
     selected_option = st.radio(
         "정답을 선택하세요:",
@@ -243,10 +530,15 @@ else:
     if not st.session_state.show_feedback:
         st.button("✨ 정답 확인! ✨", on_click=submit_answer, args=(selected_option,))
     else:
-        if st.session_state.current_question_index < len(st.session_state.quiz_questions_shuffled) - 1:
+        if st.session_state.current_question_index < len(st.session_state.quiz_order) - 1:
             st.button("➡️ 다음 문제! ➡️", on_click=next_question)
         else:
             st.button("✅ 퀴즈 종료! ✅", on_click=next_question)
 
     st.markdown(f"---")
     st.write(f"현재 점수: **{st.session_state.score}** / {current_q_index + 1} 💯")
+
+session_sync.persist(st.session_state)
+
+render_admin_panel()
+instrumentation.end_rerun()
@@ -1,6 +1,13 @@
 import streamlit as st
 import numpy as np
 
+from trigkit import instrumentation
+from trigkit.admin_panel import render_admin_panel
+from trigkit.exact_values import EXACT_ANGLES, angle_index_from_degrees, angle_index_from_radians, exact_value_latex
+from trigkit.session_store import SessionSync
+from trigkit.trig_table import angle_grid, build_value_table
+from trigkit.unit_circle import render_unit_circle_png
+
 def get_trig_value(func, angle_rad):
     """주어진 함수와 라디안 각도에 대한 삼각함수 값을 반환합니다."""
     if func == "sin":
@@ -52,24 +59,107 @@ def format_value_latex(value):
 
 # 라디안 값을 LaTeX 문자열로 변환하는 헬퍼 함수
 def get_latex_rad_display(rad_val):
-    if np.isclose(rad_val, 0): return r"0"
-    elif np.isclose(rad_val, np.pi/6): return r"\frac{\pi}{6}"
-    elif np.isclose(rad_val, np.pi/4): return r"\frac{\pi}{4}"
-    elif np.isclose(rad_val, np.pi/3): return r"\frac{\pi}{3}"
-    elif np.isclose(rad_val, np.pi/2): return r"\frac{\pi}{2}"
-    elif np.isclose(rad_val, 2*np.pi/3): return r"\frac{2\pi}{3}"
-    elif np.isclose(rad_val, 3*np.pi/4): return r"\frac{3\pi}{4}"
-    elif np.isclose(rad_val, 5*np.pi/6): return r"\frac{5\pi}{6}"
-    elif np.isclose(rad_val, np.pi): return r"\pi"
-    elif np.isclose(rad_val, 7*np.pi/6): return r"\frac{7\pi}{6}"
-    elif np.isclose(rad_val, 5*np.pi/4): return r"\frac{5\pi}{4}"
-    elif np.isclose(rad_val, 4*np.pi/3): return r"\frac{4\pi}{3}"
-    elif np.isclose(rad_val, 3*np.pi/2): return r"\frac{3\pi}{2}"
-    elif np.isclose(rad_val, 5*np.pi/3): return r"\frac{5\pi}{3}"
-    elif np.isclose(rad_val, 7*np.pi/4): return r"\frac{7\pi}{4}"
-    elif np.isclose(rad_val, 11*np.pi/6): return r"\frac{11\pi}{6}"
-    elif np.isclose(rad_val, 2*np.pi): return r"2\pi"
-    else: return rf"{rad_val:.4f} \text{{ rad}}" # 일반적인 라디안 값
+    # π/12의 배수는 미리 만들어 둔 표에서 바로 꺼냄
+    angle_index = angle_index_from_radians(rad_val)
+    if angle_index is not None:
+        return EXACT_ANGLES[angle_index].rad_latex
+    return rf"{rad_val:.4f} \text{{ rad}}" # 일반적인 라디안 값
+
+# 선택한 각도는 세션 저장소에도 저장해 다른 서버 프로세스로 다시 연결되어도 유지
+session_sync = SessionSync("radian", (
+    "selected_angle_rad", "deg_for_display", "rad_for_display_latex", "current_selected_unit",
+))
+
+# 표 계산 결과는 모든 세션이 공유 (각도 목록이 같으면 다시 계산하지 않음)
+@st.cache_data(show_spinner=False)
+def get_value_table(degrees):
+    return build_value_table(degrees)
+
+# --- 부분 재실행 영역 (fragment) ---
+# 각도 버튼을 누르면 각도 선택 영역과 그 안의 결과 영역만, 삼각함수를 바꾸면 결과 영역만 다시 실행됩니다.
+@st.fragment
+@instrumentation.rerun_scope("radian.angle_panel")
+def angle_panel(angle_unit, angles_deg_values, func_slot):
+    st.markdown("---")
+    st.header("각도 선택")
+
+    # 각도 버튼 생성
+    # Streamlit의 columns는 컨테이너를 반환하므로, 리스트로 받아서 순회하며 사용합니다.
+    num_cols = 6
+    cols = st.columns(num_cols)
+
+    for idx, deg_val in enumerate(angles_deg_values):
+        rad_val = np.deg2rad(deg_val)
+
+        # 현재 버튼이 들어갈 컬럼 선택
+        with cols[idx % num_cols]: # idx를 num_cols로 나눈 나머지로 컬럼 인덱스를 결정하여 가로로 채웁니다.
+            if angle_unit == "도 (Degrees)":
+                button_label = rf"${deg_val}^\circ$"
+            else: # 라디안 선택 시
+                button_label = rf"${EXACT_ANGLES[angle_index_from_degrees(deg_val)].rad_latex}$"
+
+            # 버튼을 누르면 세션 상태 업데이트
+            if st.button(button_label, key=f"angle_{deg_val}_{angle_unit}"):
+                st.session_state.selected_angle_rad = rad_val
+                st.session_state.deg_for_display = deg_val
+                st.session_state.rad_for_display_latex = get_latex_rad_display(rad_val)
+                st.session_state.current_selected_unit = angle_unit
+
+    session_sync.persist(st.session_state)
+    result_panel(func_slot)
+
+@st.fragment
+@instrumentation.rerun_scope("radian.result_panel")
+def result_panel(func_slot):
+    # 삼각함수 선택은 사이드바 자리(func_slot)에 그리지만, 바꾸면 이 영역만 다시 실행됨
+    selected_func = func_slot.radio(
+        "삼각함수를 선택하세요:",
+        ("sin", "cos", "tan"),
+        index=0,
+        key="selected_func",
+    )
+
+    st.markdown("---")
+    st.header("계산 결과")
+
+    # 삼각함수 값 계산 (특수각은 정확한 값 표를 쓰고, 그 외의 각만 실수 계산)
+    with instrumentation.phase("radian.trig_value"):
+        selected_angle_index = angle_index_from_degrees(st.session_state.deg_for_display)
+        if selected_angle_index is not None:
+            formatted_trig_value_latex = exact_value_latex(selected_angle_index, selected_func)
+        else:
+            with instrumentation.phase("radian.get_trig_value"):
+                trig_value = get_trig_value(selected_func, st.session_state.selected_angle_rad)
+            with instrumentation.phase("radian.format_value_latex"):
+                formatted_trig_value_latex = format_value_latex(trig_value)
+
+    # 결과 출력
+    st.markdown(f"선택한 삼각함수: **{selected_func}**")
+
+    # 선택된 각도와 반대 단위의 각도 표시
+    st.markdown(f"선택된 각도: ")
+    if st.session_state.current_selected_unit == "도 (Degrees)":
+        # 도를 선택했으므로 라디안으로 표시
+        st.latex(rf"\text{{입력 각도: }} {st.session_state.deg_for_display}^\circ \quad (\text{{라디안: }} {st.session_state.rad_for_display_latex})")
+    else:
+        # 라디안을 선택했으므로 도로 표시
+        st.latex(rf"\text{{입력 각도: }} {st.session_state.rad_for_display_latex} \quad (\text{{도: }} {st.session_state.deg_for_display}^\circ)")
+
+
+    st.markdown(f"") # 간격 조절
+    st.markdown("결과:")
+    st.latex(rf"\text{{{selected_func}}}({st.session_state.rad_for_display_latex}) = {formatted_trig_value_latex}") # 함수 인자에는 라디안 LaTeX 사용
+
+    # 단위원 그림: 고정된 원과 눈금 배경 위에 동경과 sin/cos/tan 선분만 덧그림
+    with instrumentation.phase("radian.unit_circle"):
+        unit_circle_png = render_unit_circle_png(
+            st.session_state.deg_for_display,
+            "deg" if st.session_state.current_selected_unit == "도 (Degrees)" else "rad",
+            selected_func,
+        )
+    st.image(unit_circle_png, caption="단위원 위의 각과 삼각함수 값", width=420)
+
+instrumentation.begin_rerun("radian")
 
 st.set_page_config(layout="centered")
 
@@ -78,11 +168,8 @@ st.markdown("고등학교 2학년 학생들을 위한 삼각함수 값 확인 
 
 st.sidebar.header("설정")
 
-selected_func = st.sidebar.radio(
-    "삼각함수를 선택하세요:",
-    ("sin", "cos", "tan"),
-    index=0,
-)
+# 삼각함수 선택 위젯은 결과 영역(fragment)이 이 자리에 그림
+func_slot = st.sidebar.container()
 
 angle_unit = st.sidebar.radio(
     "각도 단위를 선택하세요:",
@@ -90,8 +177,11 @@ angle_unit = st.sidebar.radio(
     index=0
 )
 
-st.markdown("---")
-st.header("각도 선택")
+view_mode = st.sidebar.radio(
+    "보기 방식을 선택하세요:",
+    ("하나씩 확인", "전체 값 표"),
+    index=0
+)
 
 # 3. 각도 리스트 생성 (30, 45, 60의 배수)
 angles_deg_values = []
@@ -104,7 +194,38 @@ for i in range(1, 7):
 
 angles_deg_values = sorted(list(set(angles_deg_values)))
 
+# --- 전체 값 표 모드 ---
+if view_mode == "전체 값 표":
+    st.markdown("---")
+    st.header("전체 값 표")
+
+    table_step = st.selectbox(
+        "각도 간격을 선택하세요:",
+        ("특수각 (30°, 45°, 60°의 배수)", "15°", "5°", "1°"),
+        index=0
+    )
+    if table_step.startswith("특수각"):
+        table_degrees = tuple(angles_deg_values)
+    else:
+        table_degrees = tuple(angle_grid(int(table_step.rstrip("°"))))
+
+    value_table = get_value_table(table_degrees)
+    st.dataframe(value_table, hide_index=True, width="stretch")
+    st.download_button(
+        "📥 CSV로 내려받기",
+        value_table.to_csv(index=False).encode("utf-8-sig"), # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        file_name="trig_values.csv",
+        mime="text/csv",
+    )
+    render_admin_panel()
+    instrumentation.end_rerun()
+    st.stop()
+
 # --- 세션 상태 초기화 ---
+session_sync.restore(st.session_state, st.query_params, st.context.cookies)
+sid_cookie_script = session_sync.cookie_script(st.session_state)
+if sid_cookie_script: # 새 세션이면 sid를 주소가 아닌 쿠키에 넣어 둠 (링크를 공유해도 세션이 넘어가지 않게)
+    st.html(sid_cookie_script, unsafe_allow_javascript=True)
 if 'selected_angle_rad' not in st.session_state:
     initial_deg = 30
     initial_rad = np.deg2rad(initial_deg)
@@ -115,51 +236,10 @@ if 'selected_angle_rad' not in st.session_state:
     st.session_state.current_selected_unit = "도 (Degrees)" 
 # --- 세션 상태 초기화 끝 ---
 
-# 각도 버튼 생성
-# Streamlit의 columns는 컨테이너를 반환하므로, 리스트로 받아서 순회하며 사용합니다.
-num_cols = 6
-cols = st.columns(num_cols) 
-
-for idx, deg_val in enumerate(angles_deg_values):
-    rad_val = np.deg2rad(deg_val)
-
-    # 현재 버튼이 들어갈 컬럼 선택
-    with cols[idx % num_cols]: # idx를 num_cols로 나눈 나머지로 컬럼 인덱스를 결정하여 가로로 채웁니다.
-        if angle_unit == "도 (Degrees)":
-            button_label = rf"${deg_val}^\circ$"
-        else: # 라디안 선택 시
-            button_label = rf"${get_latex_rad_display(rad_val)}$"
-        
-        # 버튼을 누르면 세션 상태 업데이트
-        if st.button(button_label, key=f"angle_{deg_val}_{angle_unit}"):
-            st.session_state.selected_angle_rad = rad_val
-            st.session_state.deg_for_display = deg_val
-            st.session_state.rad_for_display_latex = get_latex_rad_display(rad_val)
-            st.session_state.current_selected_unit = angle_unit
-    
-st.markdown("---")
-st.header("계산 결과")
-
-# 삼각함수 값 계산
-trig_value = get_trig_value(selected_func, st.session_state.selected_angle_rad)
-formatted_trig_value_latex = format_value_latex(trig_value)
-
-# 결과 출력
-st.markdown(f"선택한 삼각함수: **{selected_func}**")
-
-# 선택된 각도와 반대 단위의 각도 표시
-st.markdown(f"선택된 각도: ")
-if st.session_state.current_selected_unit == "도 (Degrees)":
-    # 도를 선택했으므로 라디안으로 표시
-    st.latex(rf"\text{{입력 각도: }} {st.session_state.deg_for_display}^\circ \quad (\text{{라디안: }} {st.session_state.rad_for_display_latex})")
-else:
-    # 라디안을 선택했으므로 도로 표시
-    st.latex(rf"\text{{입력 각도: }} {st.session_state.rad_for_display_latex} \quad (\text{{도: }} {st.session_state.deg_for_display}^\circ)")
-
-
-st.markdown(f"") # 간격 조절
-st.markdown("결과:")
-st.latex(rf"\text{{{selected_func}}}({get_latex_rad_display(st.session_state.selected_angle_rad)}) = {formatted_trig_value_latex}") # 함수 인자에는 라디안 LaTeX 사용
+angle_panel(angle_unit, angles_deg_values, func_slot)
 
 st.markdown("---")
 st.markdown("궁금한 삼각함수 값을 선택하고 각도를 변경하여 확인해보세요!")
+
+render_admin_panel()
+instrumentation.end_rerun()
@@ -1,21 +1,114 @@
+import os
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
-
-def main():
-    st.set_page_config(layout="wide")
-    st.title("삼각함수 그래프 플로터")
-    st.write("원하는 삼각함수를 선택하여 그래프를 그려보세요!")
-
-    # 사이드바 입력 설정
-    st.sidebar.header("그래프 설정")
 
+from trigkit import instrumentation
+from trigkit.admin_panel import render_admin_panel
+from trigkit.animation import ANIMATION_FPS, MAX_FRAMES, SweepSpec, get_sweep_animation
+from trigkit.client_chart import build_vega_lite_spec
+from trigkit.expression import ExpressionError, compile_expression, expression_cache_info
+from trigkit.graph_figure import make_render_key, render_graph_png
+from trigkit.render_cache import get_render_cache
+from trigkit.viewport import DEFAULT_VIEWPORT, Viewport, format_range, tile_cache_info
+
+# 그래프 렌더링 방식: 서버에서 PNG로 그리기(matplotlib) 또는 브라우저에서 그리기(client)
+RENDER_BACKENDS = {
+    "matplotlib": "서버 이미지 (matplotlib)",
+    "client": "브라우저 (Vega-Lite)",
+}
+DEFAULT_RENDER_BACKEND = os.environ.get("TRIG_GRAPH_BACKEND", "matplotlib")
+
+VIEWPORT_KEY = "graph_viewport"
+
+# 애니메이션으로 바꿀 수 있는 파라미터: (라벨, 최솟값, 최댓값) — 위 슬라이더와 같은 범위
+SWEEP_RANGES = {
+    "A": ("진폭 (A)", 0.0, 4.0),
+    "B": ("주파수 (B)", 0.1, 5.0),
+    "C": ("X축 이동 (C)", float(-2 * np.pi), float(2 * np.pi)),
+    "D": ("Y축 이동 (D)", -5.0, 5.0),
+}
+
+
+def get_viewport():
+    return Viewport(*st.session_state.get(VIEWPORT_KEY, DEFAULT_VIEWPORT))
+
+
+def move_viewport(pan=(0, 0), zoom=(0, 0)):
+    """버튼 콜백: 보기 범위를 이동 칸/확대 단계 단위로 바꿉니다."""
+    viewport = get_viewport().panned(*pan).zoomed(*zoom)
+    st.session_state[VIEWPORT_KEY] = tuple(viewport)
+
+
+def reset_viewport():
+    st.session_state[VIEWPORT_KEY] = tuple(DEFAULT_VIEWPORT)
+
+
+def viewport_controls():
+    """사이드바의 이동/확대 버튼. 바뀐 보기 범위를 반환합니다."""
+    st.sidebar.subheader("보기 범위")
+    buttons = (
+        ("◀", "왼쪽으로 이동", {"pan": (-1, 0)}),
+        ("▶", "오른쪽으로 이동", {"pan": (1, 0)}),
+        ("↔＋", "가로 확대", {"zoom": (-1, 0)}),
+        ("↔－", "가로 축소", {"zoom": (1, 0)}),
+        ("▲", "위로 이동", {"pan": (0, 1)}),
+        ("▼", "아래로 이동", {"pan": (0, -1)}),
+        ("↕＋", "세로 확대", {"zoom": (0, -1)}),
+        ("↕－", "세로 축소", {"zoom": (0, 1)}),
+    )
+    columns = st.sidebar.columns(4)
+    for i, (label, help_text, kwargs) in enumerate(buttons):
+        columns[i % 4].button(label, help=help_text, key=f"viewport_{i}", on_click=move_viewport, kwargs=kwargs,
+                              width="stretch")
+    st.sidebar.button("원래 범위로", on_click=reset_viewport, width="stretch")
+
+    viewport = get_viewport()
+    st.sidebar.caption(
+        f"x: {format_range(viewport.x_min, viewport.x_max, 'π')} · y: {format_range(viewport.y_min, viewport.y_max)}"
+    )
+    return viewport
+
+
+def animation_controls(params):
+    """사이드바의 파라미터 애니메이션 설정. 꺼져 있으면 None, 켜져 있으면 SweepSpec을 반환합니다."""
+    st.sidebar.subheader("파라미터 애니메이션")
+    if not st.sidebar.toggle("파라미터를 바꾸며 재생", value=False):
+        return None
+    param = st.sidebar.selectbox("바꿀 파라미터", list(SWEEP_RANGES), format_func=lambda p: SWEEP_RANGES[p][0])
+    label, lo, hi = SWEEP_RANGES[param]
+    start, stop = st.sidebar.slider(f"{label} 범위", min_value=lo, max_value=hi, value=(lo, hi), step=0.1,
+                                    key=f"sweep_range_{param}")
+    frames = st.sidebar.slider("프레임 수", min_value=6, max_value=MAX_FRAMES, value=24, step=6)
+    return SweepSpec(*params, param, start, stop, frames)
+
+
+def expression_input():
+    """직접 입력한 식을 검사해 정규화한 텍스트를 반환합니다 (비었거나 잘못되었으면 빈 문자열)."""
+    text = st.sidebar.text_input(
+        "직접 입력한 식 (y =)",
+        placeholder="예: 2*sin(x) + cos(3*x)",
+        help="x, pi, e와 sin, cos, tan, sqrt, abs, exp, log, 사칙연산, 거듭제곱(** 또는 ^)을 쓸 수 있습니다.",
+    )
+    if not text.strip():
+        return ""
+    try:
+        return compile_expression(text).text
+    except ExpressionError as e:
+        st.sidebar.error(str(e))
+        return ""
+
+
+@st.fragment
+@instrumentation.rerun_scope("graph.figure_panel")
+def figure_panel():
+    """사이드바 위젯과 그래프를 그리는 부분 재실행 영역입니다."""
     st.sidebar.subheader("함수 선택")
     # 체크박스 형태로 함수 선택
     show_sin = st.sidebar.checkbox("사인 함수 (sin(x))", value=True) # 기본적으로 사인 함수는 보이게 설정
     show_cos = st.sidebar.checkbox("코사인 함수 (cos(x))", value=False)
     show_tan = st.sidebar.checkbox("탄젠트 함수 (tan(x))", value=False)
+    expression = expression_input()
 
     st.sidebar.subheader("공통 파라미터")
 
@@ -51,125 +144,71 @@ def main():
         step=0.1
     )
 
-    # X 값 생성 (고정 범위)
-    x_min_plot = -2 * np.pi
-    x_max_plot = 2 * np.pi
-    x = np.linspace(x_min_plot, x_max_plot, 500)
+    viewport = viewport_controls()
+    sweep = animation_controls((show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift))
 
-    st.subheader("그래프")
+    st.sidebar.subheader("렌더링")
+    backend_keys = list(RENDER_BACKENDS)
+    render_backend = st.sidebar.radio(
+        "그래프 렌더링 방식",
+        backend_keys,
+        index=backend_keys.index(DEFAULT_RENDER_BACKEND) if DEFAULT_RENDER_BACKEND in RENDER_BACKENDS else 0,
+        format_func=RENDER_BACKENDS.get,
+    )
 
-    # 그래프 그리기
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # 각 체크박스 상태에 따라 함수 그리기
-    if show_sin:
-        y_sin = amplitude * np.sin(frequency * x + x_shift) + y_shift
-        formula_sin = f"$y = {amplitude:.2f} \\sin({frequency:.2f}x + {x_shift:.2f}) + {y_shift:.2f}$"
-        ax.plot(x, y_sin, color='red', label=formula_sin)
-
-    if show_cos:
-        y_cos = amplitude * np.cos(frequency * x + x_shift) + y_shift
-        formula_cos = f"$y = {amplitude:.2f} \\cos({frequency:.2f}x + {x_shift:.2f}) + {y_shift:.2f}$"
-        ax.plot(x, y_cos, color='blue', label=formula_cos)
-
-    if show_tan:
-        angle_tan = frequency * x + x_shift
-        y_tan = amplitude * np.tan(angle_tan) + y_shift
-        formula_tan = f"$y = {amplitude:.2f} \\tan({frequency:.2f}x + {x_shift:.2f}) + {y_shift:.2f}$"
-        
-        # 탄젠트 함수 점근선 처리 (y_masked를 사용)
-        tolerance = 0.1
-        y_tan_masked = np.ma.masked_where(np.abs(np.cos(angle_tan)) < tolerance, y_tan)
-        ax.plot(x, y_tan_masked.filled(np.nan), color='green', label=formula_tan) # 마스킹된 데이터 플롯
-
-        # 탄젠트 함수 점근선 표시
-        cos_val = np.cos(frequency * x + x_shift)
-        asymptote_indices = np.where(np.isclose(cos_val, 0, atol=tolerance))[0]
-        
-        drawn_asymptotes = set()
-        for i in asymptote_indices:
-            asymptote_x = x[i]
-            if round(asymptote_x, 2) in drawn_asymptotes or not (x_min_plot <= asymptote_x <= x_max_plot):
-                continue
-            
-            ax.plot([asymptote_x, asymptote_x], [-8, 8], color='green', linestyle='--', linewidth=1, alpha=0.7) # 탄젠트와 같은 색상
-            drawn_asymptotes.add(round(asymptote_x, 2))
-
-    ax.set_xlabel("X축")
-    ax.set_ylabel("Y축")
-    ax.set_title("삼각함수 그래프")
-    ax.grid(True)
-    ax.axhline(0, color='black', linewidth=1.5) # x축 (y=0에 표현)
-    ax.axvline(0, color='black', linewidth=0.8) # y축
-    ax.spines['top'].set_visible(False)    # 위쪽 테두리 제거
-    ax.spines['right'].set_visible(False)  # 오른쪽 테두리 제거
-    ax.set_ylim(-8, 8) # Y축 범위 -8~8로 변경
-    ax.set_xlim(x_min_plot, x_max_plot) # X축 범위 설정
-
-    # X축 눈금을 파이/4의 배수로 설정
-    major_locator = ticker.MultipleLocator(np.pi / 4)
-    ax.xaxis.set_major_locator(major_locator)
-
-    # 눈금 라벨 포맷터 정의
-    def format_func(value, tick_pos):
-        if value == 0:
-            return "0"
-        
-        num = value / np.pi
-        
-        num_fraction = num * 4 
-        round_num = round(num_fraction) 
-        
-        if abs(num_fraction - round_num) < 1e-9: 
-            num = round_num / 4.0 
-        
-        if num == 1:
-            return r"$\pi$"
-        elif num == -1:
-            return r"$-\pi$"
-        elif num % 1 == 0: # 정수 파이 (예: 2pi)
-            return r"${}\pi$".format(int(num))
-        else: # 분수 파이 (예: pi/2, 3pi/4)
-            numerator = int(num * 4) 
-            denominator = 4
-            
-            gcd_val = np.gcd(numerator, denominator)
-            numerator //= gcd_val
-            denominator //= gcd_val
-            
-            if denominator == 1:
-                return r"${}\pi$".format(numerator)
-            else:
-                if numerator == 1:
-                    return r"$\frac{{\pi}}{{{}}}$".format(denominator)
-                else:
-                    return r"$\frac{{{}}}{{{}}}\pi$".format(numerator, denominator)
-
-    ax.xaxis.set_major_formatter(ticker.FuncFormatter(format_func))
-
-    # X축 눈금 라벨 위치 조정
-    ax.tick_params(axis='x', which='both', bottom=False, labelbottom=True)
-
-    # 텍스트 라벨 객체 가져오기
-    tick_labels = ax.get_xticklabels()
-
-    # 라벨의 y 위치를 데이터 좌표계 기준으로 조정 (y=0 바로 아래로)
-    label_y_offset_from_zero = -0.5 # 이 값을 조절하여 위치를 미세 조정하세요.
-
-    for label in tick_labels:
-        x_val = label.get_position()[0]
-        label.set_position((x_val, 0 + label_y_offset_from_zero)) # y=0에서 오프셋 적용
-        label.set_verticalalignment('top') # 텍스트의 상단이 지정된 y 위치에 닿도록
-
-    # 선택된 함수가 하나라도 있을 경우에만 범례 표시
-    if show_sin or show_cos or show_tan:
-        ax.legend(loc='upper right', frameon=True, fontsize='medium')
+    st.subheader("그래프")
 
     # 아무 함수도 선택되지 않았을 때 메시지 표시
-    if not (show_sin or show_cos or show_tan):
+    if not (show_sin or show_cos or show_tan or expression):
         st.warning("표시할 함수를 하나 이상 선택해주세요.")
 
-    st.pyplot(fig)
+    params = (show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift, viewport)
+    if sweep is not None:
+        # 모든 프레임을 한 번에 계산해 움직이는 GIF로 보냄 (같은 설정은 캐시에서 바로 꺼냄)
+        if sweep.show_sin or sweep.show_cos or sweep.show_tan:
+            with st.spinner("애니메이션을 만드는 중..."):
+                animation = get_sweep_animation(sweep)
+            st.image(animation, width="stretch")
+            st.caption(f"{SWEEP_RANGES[sweep.param][0]}: {sweep.start:.2f} → {sweep.stop:.2f} · "
+                       f"{sweep.frames}프레임 · 초당 {ANIMATION_FPS}프레임 재생 (기본 보기 범위)")
+    elif render_backend == "client":
+        # 곡선 좌표만 보내고 그리기는 브라우저에 맡김
+        st.vega_lite_chart(spec=build_vega_lite_spec(*params, expression=expression), width="stretch")
+    else:
+        # 같은 파라미터 조합은 프로세스 전체 캐시에서 바로 꺼내 씀
+        render_cache = get_render_cache()
+        png_bytes = render_cache.get_or_render(
+            make_render_key(*params, expression=expression),
+            lambda: render_graph_png(*params, expression=expression),
+        )
+        st.image(png_bytes, width="stretch")
+
+        with st.sidebar.expander("렌더링 캐시 통계"):
+            stats = render_cache.stats()
+            st.caption(
+                f"적중 {stats['hits']} · 실패 {stats['misses']} · 적중률 {stats['hit_rate']:.0%} · "
+                f"동시 요청 공유 {stats['shared']}\n\n"
+                f"항목 {stats['entries']}개 · {stats['bytes'] / 1024 / 1024:.1f} / "
+                f"{stats['max_bytes'] / 1024 / 1024:.0f} MB"
+            )
+            tiles = tile_cache_info()
+            st.caption(f"곡선 타일: 적중 {tiles.hits} · 실패 {tiles.misses} · 항목 {tiles.currsize}/{tiles.maxsize}개")
+            _, compiled = expression_cache_info()
+            st.caption(f"식 컴파일: 적중 {compiled.hits} · 실패 {compiled.misses} · "
+                       f"항목 {compiled.currsize}/{compiled.maxsize}개")
+
+
+@instrumentation.rerun_scope("graph")
+def main():
+    st.set_page_config(layout="wide")
+    st.title("삼각함수 그래프 플로터")
+    st.write("원하는 삼각함수를 선택하여 그래프를 그려보세요!")
+
+    # 사이드바 입력 설정
+    st.sidebar.header("그래프 설정")
+
+    # 위젯과 그래프는 부분 재실행 영역에서 그림 (슬라이더를 움직이면 이 영역만 다시 실행됨)
+    figure_panel()
 
     st.subheader("설명")
     st.write("""
@@ -181,9 +220,14 @@ def main():
     * **주파수 (B)**: 파동의 밀도를 조절합니다. 값이 클수록 파동이 더 조밀해집니다.
     * **X축 이동 (C)**: 그래프를 좌우로 이동시킵니다. 양수 값은 오른쪽으로 이동, 음수 값은 왼쪽으로 이동합니다.
     * **Y축 이동 (D)**: 그래프를 상하로 이동시킵니다.
+    * **파라미터 애니메이션**: 파라미터 하나를 범위에 걸쳐 바꾸며 그래프가 어떻게 변하는지 움직이는 그림으로 보여 줍니다.
+    * **직접 입력한 식**: `2*sin(x) + cos(3*x)`, `sin(x)^2`처럼 원하는 식을 입력하면 보라색 곡선으로 함께 그립니다.
+    * **보기 범위**: 화살표로 보이는 범위를 옮기고, ＋/－로 가로(최대 ±128π)와 세로를 확대·축소합니다.
 
     **일반적인 삼각함수 방정식:** $y = A \cdot \text{function}(B x + C) + D$
     """)
 
+    render_admin_panel()
+
 if __name__ == "__main__":
     main()
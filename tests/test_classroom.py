@@ -0,0 +1,184 @@
+import os
+import random
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from trigkit.classroom import SHARDS, Classroom, ClassroomRegistry, SQLiteClassroomRegistry, ShardedTally
+
+OPTIONS = ["A", "B", "C", "D"]
+QUESTIONS = [{"question": f"Q{i}", "answer": "A", "options": OPTIONS} for i in range(3)]
+SUBMIT_P99_LIMIT_MS = 5.0  # benchmarks/sim_classroom.py의 P99_LIMIT_MS와 같은 기준
+
+
+def submit_concurrently(room, students, position, duplicate_rate=0.3):
+    """학생 스레드들이 배리어에서 함께 출발해 답을 내고, 받아들여진 답을 {학생: 보기}로 반환합니다."""
+    barrier = threading.Barrier(students)
+    accepted = {}
+    lock = threading.Lock()
+
+    def student(sid):
+        rng = random.Random(sid * 1000 + position)
+        student_id = f"student-{sid}"
+        room.join(student_id)
+        option = rng.choice(OPTIONS)
+        barrier.wait()
+        if room.submit(student_id, position, option):
+            with lock:
+                accepted[student_id] = option
+        if rng.random() < duplicate_rate:
+            assert not room.submit(student_id, position, rng.choice(OPTIONS))
+
+    threads = [threading.Thread(target=student, args=(i,)) for i in range(students)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return accepted
+
+
+@pytest.mark.parametrize("shards", [1, SHARDS])
+def test_sharded_tally_totals_match_concurrent_submissions(shards):
+    room = Classroom("000000", "teacher", QUESTIONS, shards=shards)
+    for position in range(len(QUESTIONS)):
+        accepted = submit_concurrently(room, 200, position)
+        snapshot = room.snapshot()
+        expected = Counter(accepted.values())
+        assert len(accepted) == 200
+        assert snapshot.counts == tuple(expected.get(option, 0) for option in OPTIONS)
+        assert snapshot.answered == 200
+        assert snapshot.joined == 200
+        assert room.advance("teacher")
+    assert room.snapshot().finished
+
+
+def test_submit_p99_under_contention_with_dashboard_reads():
+    """학생 300명이 문제마다 동시에 제출하는 동안 대시보드가 계속 읽어도 제출 p99가 기준 이하이고 집계가 맞는지."""
+    students, positions = 300, 10
+    questions = [{"question": f"Q{i}", "answer": "A", "options": OPTIONS} for i in range(positions)]
+    room = Classroom("000000", "teacher", questions)
+    barrier = threading.Barrier(students + 1)
+    latencies_ns = []
+    accepted = [{} for _ in range(positions)]
+    lock = threading.Lock()
+    stop = threading.Event()
+    seen = []
+
+    def student(sid):
+        student_id = f"student-{sid}"
+        room.join(student_id)
+        local = []
+        for position in range(positions):
+            option = OPTIONS[(sid + position) % len(OPTIONS)]
+            barrier.wait()
+            start = time.perf_counter_ns()
+            ok = room.submit(student_id, position, option)
+            local.append(time.perf_counter_ns() - start)
+            room.submit(student_id, position, OPTIONS[0])  # 중복 제출은 세지 않음
+            if ok:
+                accepted[position][student_id] = option
+            barrier.wait()
+        with lock:
+            latencies_ns.extend(local)
+
+    def dashboard():
+        while not stop.is_set():
+            snapshot = room.snapshot()
+            seen.append((snapshot.position, snapshot.answered))
+            time.sleep(0.001)
+
+    watcher = threading.Thread(target=dashboard)
+    threads = [threading.Thread(target=student, args=(i,)) for i in range(students)]
+    for t in threads:
+        t.start()
+    watcher.start()
+    for position in range(positions):
+        barrier.wait()  # 모두 출발
+        barrier.wait()  # 모두 제출 끝
+        expected = Counter(accepted[position].values())
+        assert len(accepted[position]) == students
+        assert room.snapshot().counts == tuple(expected.get(option, 0) for option in OPTIONS)
+        assert room.advance("teacher")
+    stop.set()
+    for t in threads:
+        t.join()
+    watcher.join()
+
+    assert np.percentile(np.array(latencies_ns) / 1e6, 99) <= SUBMIT_P99_LIMIT_MS
+    assert seen == sorted(seen)  # 대시보드가 본 응답 수는 같은 문제 안에서 줄지 않음
+    assert all(answered <= students for _, answered in seen)
+
+
+def test_sharded_tally_counts_each_student_once():
+    tally = ShardedTally(len(OPTIONS), shards=4)
+    assert tally.add("s1", 0)
+    assert not tally.add("s1", 1)
+    assert tally.add("s2", 3)
+    assert tally.has_answered("s1")
+    assert not tally.has_answered("s3")
+    assert tally.counts() == [1, 0, 0, 1]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def registries(request, tmp_path):
+    """서로 다른 서버 프로세스 둘의 수업 목록 (memory는 같은 객체를 공유하는 단일 프로세스)."""
+    if request.param == "memory":
+        registry = ClassroomRegistry()
+        return registry, registry
+    path = os.path.join(tmp_path, "classrooms.sqlite3")
+    return SQLiteClassroomRegistry(path), SQLiteClassroomRegistry(path)
+
+
+def test_submit_rules(registries):
+    teacher_side, _ = registries
+    room, token = teacher_side.create(QUESTIONS)
+    assert not room.submit("s1", 1, "A")  # 아직 오지 않은 문제
+    assert not room.submit("s1", 0, None)  # 보기를 고르지 않음
+    assert not room.submit("s1", 0, "Z")
+    assert not room.has_answered("s1", 0)
+    assert room.submit("s1", 0, "B")
+    assert room.has_answered("s1", 0)
+    assert not room.advance("not-the-teacher")
+    assert room.reveal(token)
+    assert not room.submit("s2", 0, "A")  # 정답 공개 후
+    assert room.advance(token)
+    snapshot = room.snapshot()
+    assert (snapshot.position, snapshot.revealed, snapshot.counts) == (1, False, (0, 0, 0, 0))
+    assert not room.has_answered("s1", 1)
+    assert not room.submit("s1", 0, "A")  # 지난 문제
+
+
+def test_classroom_is_shared_across_registries(registries):
+    teacher_side, student_side = registries
+    room, token = teacher_side.create(QUESTIONS)
+
+    student_room = student_side.get(room.code)
+    assert student_room is not None
+    assert student_room.questions == room.questions
+    accepted = submit_concurrently(student_room, 50, 0)
+
+    snapshot = room.snapshot()
+    expected = Counter(accepted.values())
+    # 집계는 수업에 저장된(섞인) 보기 순서를 따름
+    assert snapshot.counts == tuple(expected.get(option, 0) for option in room.questions[0]["options"])
+    assert snapshot.joined == 50
+
+    assert room.advance(token)
+    assert student_side.get(room.code).snapshot().position == 1
+    assert not student_side.close(room.code, "not-the-teacher")
+    assert teacher_side.close(room.code, token)
+    assert student_side.get(room.code) is None
+
+
+def test_options_are_shuffled_once_per_room(registries):
+    teacher_side, student_side = registries
+    questions = [{"question": f"Q{i}", "answer": "A", "options": OPTIONS} for i in range(40)]
+    room, _ = teacher_side.create(questions)
+    orders = [tuple(q["options"]) for q in room.questions]
+    assert all(sorted(order) == OPTIONS for order in orders)
+    assert any(order[0] != "A" for order in orders)  # 정답이 늘 첫 보기에 있지 않음 (40문제가 모두 그대로일 확률 4^-40)
+    assert [tuple(q["options"]) for q in student_side.get(room.code).questions] == orders
+    assert questions[0]["options"] is OPTIONS  # 문제 은행의 원래 문제는 바꾸지 않음
@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+import pytest
+
+from trigkit.expression import ExpressionError, compile_expression, normalize_expression
+
+# {marker}는 테스트마다 tmp_path 안의 표시 파일 경로로 바뀜 (만들어지면 코드가 실행된 것)
+REJECTED = (
+    "__import__('os').system('touch {marker}')",
+    "open('{marker}', 'w')",
+    "eval('1')",
+    "exec('x = 1')",
+    "globals()",
+    "().__class__.__bases__[0].__subclasses__()",
+    "sin.__globals__",
+    "sin.__class__",
+    "x.__class__",
+    "(lambda: 1)()",
+    "[c for c in ()]",
+    "(y := 1)",
+    "x if x else 1",
+    "x[0]",
+    "'a' * 3",
+    "b'a'",
+    "f'{{x}}'",
+    "True + x",
+    "1j * x",
+    "None",
+    "...",
+    "print(x)",
+    "np.sin(x)",
+    "sin(x=1)",
+    "sin(*[x])",
+    "x < 1",
+    "x and 1",
+    "x % 2",
+    "x // 2",
+    "x @ x",
+    "~x",
+    "not x",
+    "9 ** 9 ** 9",
+    "10 ** 400 + x",
+    "1 / 0 + x",
+    "9999999 * x",
+    "x" + " + x" * 200,
+    "__builtins__",
+    "sin; import os",
+    "x\nimport os",
+    "",
+    "(-8)^(1/3)*x",  # 파이썬 실수 연산으로는 복소수가 되어 허수부를 버리면 y = x로 그려졌음
+    "(-1)**0.5 + x",
+    "0 ** -1 + x",
+)
+
+ACCEPTED = {
+    "2*sin(x) + cos(3*x)": lambda x: 2 * np.sin(x) + np.cos(3 * x),
+    "sin(x)^2": lambda x: np.sin(x) ** 2,
+    "  sin( x ) ** 2  ": lambda x: np.sin(x) ** 2,
+    "-tan(x/2) + pi": lambda x: -np.tan(x / 2) + np.pi,
+    "sqrt(abs(x)) * exp(-x^2/4)": lambda x: np.sqrt(np.abs(x)) * np.exp(-x ** 2 / 4),
+    "log(e) * x": lambda x: x,
+    "3": lambda x: np.full_like(x, 3.0),
+}
+
+
+@pytest.mark.parametrize("template", REJECTED)
+def test_rejects_code_outside_whitelist(template, tmp_path):
+    marker = tmp_path / "pwned"
+    text = template.format(marker=marker)
+    start = time.perf_counter()
+    with pytest.raises(ExpressionError):
+        compile_expression(text)
+    assert time.perf_counter() - start < 0.5  # 9**9**9 같은 식도 계산하지 않고 바로 거부
+    assert not marker.exists()
+
+
+@pytest.mark.parametrize("text", ACCEPTED)
+def test_accepted_expression_matches_numpy(text):
+    x = np.linspace(-2 * np.pi, 2 * np.pi, 1001)
+    y = compile_expression(text).evaluate(x)
+    want = ACCEPTED[text](x)
+    finite = np.isfinite(want) & (np.abs(want) < 1e6)  # tan의 극 근처는 비교하지 않음
+    np.testing.assert_allclose(y[finite], want[finite])
+
+
+def test_spelling_variants_share_one_compiled_expression():
+    assert normalize_expression("( sin( x ) ) ** 2") == normalize_expression("sin(x)^2") == "sin(x) ** 2"
+    assert compile_expression("sin(x)^2") is compile_expression("( sin( x ) ) ** 2")
+
+
+def test_non_real_powers_of_x_are_nan():
+    y = compile_expression("x^0.5 + (-8)^x").evaluate(np.array([-1.0, 0.0, 2.0]))
+    assert np.isnan(y[0])  # (-1)**0.5
+    np.testing.assert_allclose(y[1:], [1.0, 2 ** 0.5 + 64])
+
+
+def test_curve_breaks_at_tan_poles():
+    x, y = compile_expression("tan(x)").curve(-np.pi, np.pi, 1000)
+    assert len(x) == 1002  # ±π/2 두 곳에 NaN 점이 하나씩 끼어듦
+    assert np.isnan(y).sum() == 2
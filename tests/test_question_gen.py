@@ -0,0 +1,20 @@
+from trigkit.attempt_log import AttemptLog
+from trigkit.question_gen import generate_questions, stats_key
+
+
+def test_generated_questions_are_counted_by_skill_not_by_id(tmp_path):
+    log = AttemptLog(str(tmp_path / "attempts.sqlite3"))
+    try:
+        keys = set()
+        for seed in range(5):  # 묶음이 바뀌어도 같은 유형이면 같은 키
+            for q in generate_questions(200, seed):
+                keys.add(stats_key(q))
+                log.record("민지", stats_key(q), q["answer"] == q["options"][0], 1000)
+        assert log.flush()
+        rows = log.question_accuracy(limit=1000)
+    finally:
+        log.close()
+    assert len(keys) <= 16  # 특수각 6 + 그래프 7 + 직각삼각형 3
+    assert {qid for qid, *_ in rows} == keys
+    assert sum(attempts for _, attempts, _, _ in rows) == 1000
+    assert stats_key({"id": "q001", "question": "…"}) == "q001"  # 문제 은행 문제는 id 그대로
@@ -0,0 +1,154 @@
+import threading
+import time
+
+import numpy as np
+
+from trigkit.review_schedule import ReviewRegistry, ReviewScheduler, ReviewStore
+
+NOW = 1_700_000_000.0
+
+
+class Bank:
+    def __init__(self, n):
+        self.ids = tuple(f"q{i:04d}" for i in range(n))
+
+
+def reference_select(scheduler, k, candidates, now):
+    """전체를 정렬해 고르는 비교용: 복습 시각이 지난 문제 → 새 문제(섞인 순서) → 나머지 복습 순."""
+    due = scheduler.state["due"]
+    seen = [i for i in candidates if scheduler.seen(i)]
+    overdue = sorted((due[i], i) for i in seen if due[i] <= now)
+    new = sorted((scheduler._order[i], i) for i in candidates if not scheduler.seen(i))
+    later = sorted((due[i], i) for i in seen if due[i] > now)
+    return [i for _, i in overdue + new + later][:k]
+
+
+def test_filtered_select_matches_full_sort():
+    ids = Bank(500).ids
+    scheduler = ReviewScheduler(ids, seed=1)
+    candidates = np.arange(0, 500, 7)
+    now = NOW
+    for quiz in range(40):
+        chosen = scheduler.select(10, candidates, now=now, filter_key="sevens")
+        assert chosen == reference_select(scheduler, 10, candidates.tolist(), now)
+        for idx in chosen:
+            scheduler.record(ids[idx], (idx + quiz) % 3 != 0, 5000, now=now)
+        now += 15 * 60
+
+
+def test_filtered_and_unfiltered_heaps_see_the_same_records():
+    ids = Bank(50).ids
+    scheduler = ReviewScheduler(ids, seed=2)
+    candidates = np.arange(10)
+    scheduler.select(3, candidates, now=NOW, filter_key="first ten")  # 조건 힙을 먼저 만들어 둠
+    for idx in range(10):
+        scheduler.record(ids[idx], False, 1000, now=NOW)  # 모두 10분 뒤 복습
+    later = NOW + 3600
+    assert sorted(scheduler.select(10, candidates, now=later, filter_key="first ten")) == list(range(10))
+    assert sorted(scheduler.select(10, now=later)) == list(range(10))
+
+
+def test_encode_load_round_trip_rebuilds_filtered_heaps():
+    ids = Bank(100).ids
+    scheduler = ReviewScheduler(ids, seed=3)
+    for idx in scheduler.select(20, now=NOW):
+        scheduler.record(ids[idx], True, 3000, now=NOW)
+    restored = ReviewScheduler(ids, seed=4)
+    restored.select(5, np.arange(100), now=NOW, filter_key="all")
+    assert restored.load(scheduler.encode()) == 20
+    assert restored.state.tobytes() == scheduler.state.tobytes()
+    new = restored.select(80, np.arange(100), now=NOW, filter_key="all")
+    assert not any(restored.seen(i) for i in new)
+
+
+class CountingStore(ReviewStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.checks = 0
+
+    def updated(self, user):
+        self.checks += 1
+        return super().updated(user)
+
+
+def test_registry_checks_store_only_on_refresh_or_after_interval(tmp_path):
+    store = CountingStore(str(tmp_path / "review.sqlite3"))
+    registry = ReviewRegistry(store, check_interval=60)
+    bank = Bank(20)
+    scheduler = registry.get("kim", bank, refresh=True)
+    for _ in range(5):
+        assert registry.get("kim", bank) is scheduler
+    assert store.checks == 0
+    assert registry.get("kim", bank, refresh=True) is scheduler
+    assert store.checks == 1
+    registry.check_interval = 0
+    registry.get("kim", bank)
+    assert store.checks == 2
+
+
+def test_registry_writes_back_dirty_schedulers_on_eviction(tmp_path):
+    store = ReviewStore(str(tmp_path / "review.sqlite3"))
+    bank = Bank(20)
+    registry = ReviewRegistry(store, max_bytes=int(2.5 * ReviewScheduler(bank.ids).nbytes))  # 두 명까지
+    registry.get("a", bank).record(bank.ids[3], True, 2000)
+    registry.get("b", bank)
+    registry.get("c", bank)  # "a"가 밀려남
+    restored = registry.get("a", bank)  # 저장되기 전에 다시 와도 기다리던 상태를 씀
+    assert restored.seen(3)
+    assert registry.flush()
+    assert store.load("a") is not None
+
+
+def test_registry_save_after_each_answer_survives_new_process(tmp_path):
+    path = str(tmp_path / "review.sqlite3")
+    bank = Bank(20)
+    registry = ReviewRegistry(ReviewStore(path))
+    registry.get("lee", bank).record(bank.ids[5], False, 2000)
+    assert registry.save("lee")
+    assert not registry.save("lee")  # 바뀐 것이 없으면 쓰지 않음
+    other_process = ReviewRegistry(ReviewStore(path))
+    assert other_process.get("lee", bank, refresh=True).state["lapses"][5] == 1
+
+
+def test_registry_is_bounded_by_total_size(tmp_path):
+    bank = Bank(1000)
+    one = ReviewScheduler(bank.ids).nbytes
+    assert one < 40 * len(bank.ids)  # 문제당 상태 20바이트 + 순서 배열 8바이트 정도 (힙은 푼 문제만)
+    registry = ReviewRegistry(ReviewStore(str(tmp_path / "review.sqlite3")), max_bytes=10 * one)
+    for user in range(30):
+        scheduler = registry.get(f"u{user}", bank, refresh=True)
+        scheduler.select(5, np.arange(0, 1000, 3), now=NOW, filter_key="thirds")
+    assert registry.nbytes <= 10 * one
+    assert 5 <= len(registry) <= 10
+    assert registry.get("u29", bank) is scheduler  # 가장 최근 사용자는 남음
+
+
+class SlowStore(ReviewStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.release = threading.Event()
+        self.writes = 0
+
+    def save_many(self, items):
+        self.release.wait(5)
+        self.writes += 1
+        return super().save_many(items)
+
+
+def test_save_later_returns_before_the_write_and_coalesces_answers(tmp_path):
+    path = str(tmp_path / "review.sqlite3")
+    store = SlowStore(path)
+    registry = ReviewRegistry(store, save_interval=0.05)
+    bank = Bank(20)
+    start = time.perf_counter()
+    for idx in range(5):
+        registry.get("park", bank).record(bank.ids[idx], True, 2000)
+        assert registry.save_later("park")
+    assert time.perf_counter() - start < 1.0  # 쓰기가 막혀 있어도 답하는 쪽은 기다리지 않음
+    store.release.set()
+    assert registry.flush()
+    assert store.writes <= 2  # 답 다섯 번이 한두 번의 쓰기로 묶임
+    other_process = ReviewRegistry(ReviewStore(path))
+    assert other_process.get("park", bank, refresh=True).state["reps"][:5].tolist() == [1] * 5
+    registry.close()
+    other_process.close()
@@ -0,0 +1,59 @@
+from trigkit.session_store import SID_COOKIE, MemorySessionStore, SessionSync, SQLiteSessionStore
+
+KEYS = ("score", "user_name")
+
+
+def new_session(sync, cookies, query_params=None):
+    """새 연결 하나: 비어 있는 세션 상태로 restore하고 (상태, 주소 매개변수)를 반환합니다."""
+    state, query_params = {}, dict(query_params or {})
+    sync.restore(state, query_params, cookies)
+    return state, query_params
+
+
+def cookie_sid(script):
+    return script.split(f"{SID_COOKIE}=", 1)[1].split(";", 1)[0]
+
+
+def test_new_session_sets_cookie_not_url():
+    sync = SessionSync("quiz", KEYS, store=MemorySessionStore())
+    state, query_params = new_session(sync, {})
+    script = sync.cookie_script(state)
+    assert script is not None and "samesite=strict" in script
+    assert query_params == {}
+    assert sync.cookie_script(state) is None  # 한 번만 넣음
+
+
+def test_cookie_sid_continues_session_in_another_process(tmp_path):
+    path = str(tmp_path / "sessions.sqlite3")
+    first = SessionSync("quiz", KEYS, store=SQLiteSessionStore(path))
+    state, _ = new_session(first, {})
+    sid = cookie_sid(first.cookie_script(state))
+    state.update(score=3, user_name="민지")
+    assert first.persist(state)
+
+    other_process = SessionSync("quiz", KEYS, store=SQLiteSessionStore(path))
+    restored, _ = new_session(other_process, {SID_COOKIE: sid})
+    assert (restored["score"], restored["user_name"]) == (3, "민지")
+    assert other_process.cookie_script(restored) is None  # 이미 같은 쿠키가 있음
+
+
+def test_sid_in_url_is_ignored_and_removed():
+    store = MemorySessionStore()
+    sync = SessionSync("quiz", KEYS, store=store)
+    victim, _ = new_session(sync, {})
+    sid = cookie_sid(sync.cookie_script(victim))
+    victim.update(score=7, user_name="victim")
+    sync.persist(victim)
+
+    # 공유된 옛 링크(?sid=)나 다른 사람의 주소를 열어도 그 세션을 이어받지 않음
+    attacker, query_params = new_session(sync, {}, {"sid": sid})
+    assert "score" not in attacker
+    assert query_params == {}
+    assert cookie_sid(sync.cookie_script(attacker)) != sid
+
+
+def test_malformed_cookie_gets_a_new_sid():
+    sync = SessionSync("quiz", KEYS, store=MemorySessionStore())
+    state, _ = new_session(sync, {SID_COOKIE: "x'; alert(1)//"})
+    script = sync.cookie_script(state)
+    assert "alert" not in script
@@ -0,0 +1 @@
+"""삼각함수 학습 앱의 페이지들이 공유하는 계산/렌더링 도구 모음."""
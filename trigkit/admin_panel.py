@@ -0,0 +1,65 @@
+"""숨겨진 관리자 패널: 재실행 구간별 지연 시간 분포를 보여 줍니다.
+
+``TRIG_ADMIN_TOKEN`` 환경 변수를 정해 두고, 페이지 주소에 ``?admin=<토큰>``을 붙였을 때만
+페이지 맨 아래에 나타납니다. 링 버퍼는 프로세스 전체가 공유하므로 모든 세션의 기록이 보입니다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from trigkit import instrumentation
+
+HISTOGRAM_BINS = 20
+
+
+def admin_requested():
+    token = os.environ.get("TRIG_ADMIN_TOKEN")
+    return bool(token) and st.query_params.get("admin") == token
+
+
+def render_admin_panel():
+    """관리자 토큰이 맞을 때만 구간별 지연 시간 표와 히스토그램을 그립니다."""
+    if not admin_requested():
+        return
+
+    st.markdown("---")
+    st.header("🔧 성능 계측")
+    recorder = instrumentation.get_recorder()
+    if recorder is None:
+        st.info("계측이 꺼져 있습니다. `TRIG_INSTRUMENT=1`로 서버를 다시 시작하세요.")
+        return
+
+    grouped = instrumentation.latencies_by_phase(recorder.samples())
+    st.caption(f"재실행 {recorder.rerun_count}회 · 로그 `{recorder.log_path}`")
+    if not grouped:
+        st.info("아직 기록이 없습니다.")
+        return
+
+    summary = pd.DataFrame(
+        [
+            {
+                "페이지": page,
+                "구간": phase,
+                "횟수": len(ms),
+                "p50 ms": np.percentile(ms, 50),
+                "p95 ms": np.percentile(ms, 95),
+                "p99 ms": np.percentile(ms, 99),
+                "최대 ms": ms.max(),
+                "합계 ms": ms.sum(),
+            }
+            for (page, phase), ms in grouped.items()
+        ]
+    ).sort_values("합계 ms", ascending=False)
+    st.dataframe(summary, hide_index=True, width="stretch", column_config={
+        col: st.column_config.NumberColumn(format="%.2f")
+        for col in ("p50 ms", "p95 ms", "p99 ms", "최대 ms", "합계 ms")
+    })
+
+    for (page, phase), ms in grouped.items():
+        counts, edges = np.histogram(ms, bins=HISTOGRAM_BINS)
+        histogram = pd.DataFrame({"횟수": counts}, index=[f"{edge:.2f}" for edge in edges[:-1]])
+        histogram.index.name = "ms"
+        with st.expander(f"{page} · {phase} ({len(ms)}회)"):
+            st.bar_chart(histogram, x_label="지연 시간 (ms)", y_label="횟수")
@@ -0,0 +1,163 @@
+"""파라미터 하나(A, B, C, D)를 범위에 걸쳐 바꾸는 그래프 애니메이션.
+
+슬라이더를 조금씩 옮기며 재실행할 때마다 그래프를 새로 그리는 대신, 훑을 값 전체를
+(파라미터 값 × x) 2차원 배열 하나로 브로드캐스트해 모든 프레임의 곡선을 한 번에 계산합니다.
+프레임은 재사용 Figure 하나에서 곡선 데이터만 바꾸며 연달아 RGBA로 뽑고, Pillow로 움직이는
+GIF(또는 WebP)에 한 번에 담습니다.
+
+같은 애니메이션 설정(``SweepSpec``)은 렌더링 캐시에서 바로 꺼내므로 다시 요청하면 비용이 없습니다.
+"""
+import io
+from typing import NamedTuple
+
+import numpy as np
+
+from trigkit.curves import tan_asymptotes
+from trigkit.graph_figure import FIGURE_SIZE, X_MAX, X_MIN, checkout_figure, format_curve_label
+from trigkit.render_cache import get_render_cache
+
+SWEEP_PARAMS = ("A", "B", "C", "D")
+FUNCS = ("sin", "cos", "tan")
+
+# 프레임 곡선을 계산할 x 격자 점 수 (애니메이션 해상도에서 1픽셀보다 촘촘함)
+SWEEP_COLUMNS = 1200
+ANIMATION_DPI = 80
+ANIMATION_FPS = 12
+MAX_FRAMES = 60
+ANIMATION_FORMATS = ("gif", "webp")
+# GIF 팔레트 색 수: 곡선 3색, 격자, 글자와 그 사이 안티에일리어싱 색이면 충분함
+GIF_COLORS = 64
+
+
+class SweepSpec(NamedTuple):
+    show_sin: bool
+    show_cos: bool
+    show_tan: bool
+    amplitude: float
+    frequency: float
+    x_shift: float
+    y_shift: float
+    param: str  # 바꿀 파라미터: "A", "B", "C", "D" 중 하나
+    start: float
+    stop: float
+    frames: int
+
+    def values(self):
+        """프레임마다 쓸 파라미터 값."""
+        return np.linspace(self.start, self.stop, self.frames)
+
+    def key(self, fmt, dpi):
+        """렌더링 캐시 키. 실수 값의 미세한 오차는 반올림으로 흡수합니다."""
+        return (
+            "sweep", fmt, dpi, bool(self.show_sin), bool(self.show_cos), bool(self.show_tan),
+            *(round(v, 6) for v in (self.amplitude, self.frequency, self.x_shift, self.y_shift)),
+            self.param, round(self.start, 6), round(self.stop, 6), int(self.frames),
+        )
+
+
+def sweep_parameters(spec):
+    """(A, B, C, D)를 반환합니다. 바꾸는 파라미터는 (프레임 수, 1) 열 벡터, 나머지는 스칼라."""
+    if spec.param not in SWEEP_PARAMS:
+        raise ValueError(f"알 수 없는 파라미터: {spec.param!r}")
+    params = dict(zip(SWEEP_PARAMS, (spec.amplitude, spec.frequency, spec.x_shift, spec.y_shift)))
+    params[spec.param] = spec.values()[:, None]
+    return tuple(params[name] for name in SWEEP_PARAMS)
+
+
+def sweep_curves(spec, columns=SWEEP_COLUMNS):
+    """모든 프레임의 곡선을 한 번의 브로드캐스트로 계산합니다.
+
+    반환값은 (x, {함수: (프레임 수, columns) y 배열})이며, 탄젠트는 극을 지나는 칸을 NaN으로 끊습니다.
+    """
+    x = np.linspace(X_MIN, X_MAX, columns)
+    amplitude, frequency, x_shift, y_shift = sweep_parameters(spec)
+    shape = (spec.frames, columns)
+    phase = np.broadcast_to(frequency * x + x_shift, shape)
+
+    shown = {"sin": spec.show_sin, "cos": spec.show_cos, "tan": spec.show_tan}
+    curves = {}
+    for func in FUNCS:
+        if not shown[func]:
+            continue
+        y = getattr(np, func)(phase)
+        if func == "tan":
+            # 이웃한 두 점 사이에서 가지 번호 ⌊(u − π/2)/π⌋가 바뀌면 극을 건넌 것
+            branch = np.floor((phase - np.pi / 2) / np.pi)
+            y[:, 1:][branch[:, 1:] != branch[:, :-1]] = np.nan
+        y *= amplitude
+        y += y_shift
+        curves[func] = y
+    return x, curves
+
+
+def _frame_values(spec):
+    """프레임별 (A, B, C, D) 스칼라 값."""
+    columns = [np.broadcast_to(np.ravel(p), (spec.frames,)).tolist() for p in sweep_parameters(spec)]
+    return list(zip(*columns))
+
+
+def _savefig_rgba(figure, bbox, dpi):
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="rgba", dpi=dpi, bbox_inches=bbox)
+    return buffer.getvalue()
+
+
+def _frame_width(size, bbox, dpi):
+    """RGBA 바이트 수로 고정 bbox 프레임의 픽셀 폭을 알아냅니다 (matplotlib의 반올림 방식에 기대지 않음)."""
+    pixels = size // 4
+    exact_w, exact_h = bbox.width * dpi, bbox.height * dpi
+    candidates = {int(exact_w), int(round(exact_w)), int(np.ceil(exact_w))}
+    return min((w for w in candidates if w and pixels % w == 0), key=lambda w: abs(pixels // w - exact_h))
+
+
+def render_frames(spec, dpi=ANIMATION_DPI):
+    """모든 프레임을 (높이, 폭, 4) RGBA 배열 목록으로 그립니다."""
+    x, curves = sweep_curves(spec)
+    frames = []
+    with checkout_figure(FIGURE_SIZE, dpi) as graph:
+        for i, (amplitude, frequency, x_shift, y_shift) in enumerate(_frame_values(spec)):
+            graph.set_curves(
+                {func: (x, y[i], format_curve_label(func, amplitude, frequency, x_shift, y_shift))
+                 for func, y in curves.items()},
+                tan_asymptotes(frequency, x_shift, X_MIN, X_MAX) if spec.show_tan else (),
+            )
+            if i == 0:
+                # 눈금과 범례 위치는 프레임마다 같으므로 여백 계산(tight bbox)은 첫 프레임에서 한 번만
+                renderer = graph.figure.canvas.get_renderer()
+                bbox = graph.figure.get_tightbbox(renderer).padded(0.1)
+            data = _savefig_rgba(graph.figure, bbox, dpi)
+            if i == 0:
+                width = _frame_width(len(data), bbox, dpi)
+            frames.append(np.frombuffer(data, dtype=np.uint8).reshape(-1, width, 4))
+    return frames
+
+
+def encode_animation(frames, fmt="gif", fps=ANIMATION_FPS):
+    """RGBA 프레임 배열들을 반복 재생하는 GIF/WebP 바이트로 인코딩합니다."""
+    from PIL import Image
+
+    if fmt not in ANIMATION_FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt!r} ({', '.join(ANIMATION_FORMATS)})")
+    images = [Image.fromarray(frame[..., :3]) for frame in frames]
+    if fmt == "gif":
+        # 첫 프레임으로 만든 팔레트를 모든 프레임에 써서 프레임마다 색을 다시 고르지 않음
+        palette = images[0].quantize(GIF_COLORS, dither=Image.Dither.NONE)
+        images = [palette] + [image.quantize(palette=palette, dither=Image.Dither.NONE) for image in images[1:]]
+    buffer = io.BytesIO()
+    images[0].save(
+        buffer, format=fmt.upper(), save_all=True, append_images=images[1:],
+        duration=round(1000 / fps), loop=0,
+    )
+    return buffer.getvalue()
+
+
+def render_sweep(spec, fmt="gif", dpi=ANIMATION_DPI):
+    """애니메이션을 그려 인코딩된 바이트로 반환합니다 (캐시 없음)."""
+    if not 2 <= spec.frames <= MAX_FRAMES:
+        raise ValueError(f"프레임 수는 2~{MAX_FRAMES} 사이여야 합니다.")
+    return encode_animation(render_frames(spec, dpi), fmt)
+
+
+def get_sweep_animation(spec, fmt="gif", dpi=ANIMATION_DPI):
+    """같은 설정의 애니메이션은 프로세스 전체 렌더링 캐시에서 꺼냅니다."""
+    return get_render_cache().get_or_render(spec.key(fmt, dpi), lambda: render_sweep(spec, fmt, dpi))
@@ -0,0 +1,228 @@
+"""퀴즈 답안 기록을 SQLite에 남기는 write-behind 로그.
+
+``record``는 답안 하나를 프로세스 안의 큐에 넣기만 하고 바로 돌아오므로 클릭 응답 시간에
+영향을 주지 않습니다. 백그라운드 스레드가 큐를 모아 한 트랜잭션에 여러 건씩 씁니다.
+
+리더보드와 문제별 정답률은 원본 ``attempts`` 테이블을 매번 GROUP BY 하지 않고,
+같은 트랜잭션에서 증분으로 갱신하는 집계 테이블(``user_stats``, ``question_stats``)을
+인덱스로 읽습니다. 행이 수백만 개여도 조회 비용은 사용자/문제 수에만 비례합니다.
+조회 결과는 마지막으로 쓴 배치 번호와 함께 캐시해 두고, 새 배치가 쓰였을 때만 다시 읽습니다.
+``question_id``에는 문제 은행 id나 생성 문제의 유형 키(``question_gen.stats_key``)를 넘기므로
+``question_stats``의 행 수는 생성한 문제 묶음 수와 상관없이 일정합니다.
+
+같은 파일을 다른 연결(복습 일정 저장 등)이 쓰고 있어 ``database is locked`` 같은 오류가 나면
+배치를 버리지 않고 기록(로그)만 남긴 뒤 잠시 후 다시 씁니다. 쓰기 스레드는 오류로 멈추지 않습니다.
+"""
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+BATCH_SIZE = 2000
+FLUSH_INTERVAL = 1.0  # 초: 배치가 덜 찼어도 이 시간이 지나면 씀
+FLUSH_TIMEOUT = 10.0  # 초: flush가 커밋을 기다리는 기본 최대 시간
+RETRY_DELAY = 0.5  # 초: 쓰기에 실패한 배치를 다시 쓰기 전 대기 시간
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_ms INTEGER NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_user_ts ON attempts (user, ts);
+CREATE INDEX IF NOT EXISTS idx_attempts_question ON attempts (question_id);
+
+CREATE TABLE IF NOT EXISTS user_stats (
+    user TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    last_ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_user_stats_rank ON user_stats (correct DESC, attempts);
+
+CREATE TABLE IF NOT EXISTS question_stats (
+    question_id TEXT PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL,
+    latency_ms_sum INTEGER NOT NULL
+);
+"""
+
+UPSERT_USER = """
+INSERT INTO user_stats (user, attempts, correct, last_ts) VALUES (?, ?, ?, ?)
+ON CONFLICT (user) DO UPDATE SET
+    attempts = attempts + excluded.attempts,
+    correct = correct + excluded.correct,
+    last_ts = max(last_ts, excluded.last_ts)
+"""
+
+UPSERT_QUESTION = """
+INSERT INTO question_stats (question_id, attempts, correct, latency_ms_sum) VALUES (?, ?, ?, ?)
+ON CONFLICT (question_id) DO UPDATE SET
+    attempts = attempts + excluded.attempts,
+    correct = correct + excluded.correct,
+    latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum
+"""
+
+_FLUSH = object()  # 큐에 넣으면 쌓인 기록을 바로 쓰게 하는 표시
+_STOP = object()
+
+
+def connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")  # 쓰는 동안에도 리더보드를 읽을 수 있게
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def aggregate_batch(rows):
+    """(user, question_id, correct, latency_ms, ts) 목록을 사용자별/문제별 증분으로 묶습니다."""
+    users, questions = {}, {}
+    for user, question_id, correct, latency_ms, ts in rows:
+        u = users.setdefault(user, [0, 0, ts])
+        u[0] += 1
+        u[1] += correct
+        u[2] = max(u[2], ts)
+        q = questions.setdefault(question_id, [0, 0, 0])
+        q[0] += 1
+        q[1] += correct
+        q[2] += latency_ms
+    return (
+        [(user, *stats) for user, stats in users.items()],
+        [(question_id, *stats) for question_id, stats in questions.items()],
+    )
+
+
+class AttemptLog:
+    """답안 기록 큐와 배치 쓰기 스레드, 캐시된 집계 조회를 묶은 클래스입니다."""
+
+    def __init__(self, path, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        conn = connect(path)
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+        self._queue = queue.SimpleQueue()
+        self._version = 0  # 커밋된 배치 수: 조회 캐시의 유효성 판단에 사용
+        self.failed_writes = 0
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._write_loop, name="attempt-log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def record(self, user, question_id, correct, latency_ms, ts=None):
+        """답안 하나를 쓰기 큐에 넣고 바로 반환합니다."""
+        self._queue.put((user, question_id, int(bool(correct)), int(latency_ms), time.time() if ts is None else ts))
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """지금까지 넣은 기록이 모두 커밋될 때까지 최대 timeout초 기다립니다. 커밋되었으면 True."""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        return done.wait(timeout)
+
+    def close(self, timeout=FLUSH_TIMEOUT):
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join(timeout)
+
+    def _write_loop(self):
+        conn = connect(self.path)
+        rows, waiters = [], []
+        stop = False
+        while not stop:
+            deadline = time.monotonic() + self.flush_interval
+            while len(rows) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, tuple) and item[0] is _FLUSH:
+                    waiters.append(item[1])
+                    break
+                rows.append(item)
+            if rows and not self._try_write_batch(conn, rows):
+                if stop:
+                    logger.error("답안 기록 %d건을 쓰지 못하고 종료합니다.", len(rows))
+                    break
+                time.sleep(RETRY_DELAY)
+                continue  # 실패한 행은 다음 배치와 함께 다시 씀; flush 대기자는 커밋될 때까지 계속 기다림
+            rows = []
+            for done in waiters:
+                done.set()
+            waiters = []
+        conn.close()
+
+    def _try_write_batch(self, conn, rows):
+        """배치를 쓰고 True, SQLite 오류가 나면 기록만 남기고 False를 반환합니다."""
+        try:
+            self._write_batch(conn, rows)
+        except sqlite3.Error:
+            self.failed_writes += 1
+            logger.warning("답안 기록 %d건 쓰기 실패, %.1f초 뒤 다시 씁니다.", len(rows), RETRY_DELAY, exc_info=True)
+            return False
+        return True
+
+    def _write_batch(self, conn, rows):
+        user_deltas, question_deltas = aggregate_batch(rows)
+        with conn:  # 원본 행과 집계 갱신을 한 트랜잭션으로
+            conn.executemany(
+                "INSERT INTO attempts (user, question_id, correct, latency_ms, ts) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            conn.executemany(UPSERT_USER, user_deltas)
+            conn.executemany(UPSERT_QUESTION, question_deltas)
+        with self._cache_lock:
+            self._version += 1
+            self._cache.clear()
+
+    def _cached_query(self, name, sql, params=()):
+        """마지막 배치 이후 같은 조회를 이미 했다면 캐시된 결과를 돌려줍니다."""
+        key = (name, params)
+        with self._cache_lock:
+            version = self._version
+            hit = self._cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            result = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        with self._cache_lock:
+            self._cache[key] = (version, result)
+        return result
+
+    def leaderboard(self, limit=10):
+        """맞힌 개수 순(같으면 시도 수가 적은 순) 상위 사용자: (user, correct, attempts) 목록."""
+        return self._cached_query(
+            "leaderboard",
+            "SELECT user, correct, attempts FROM user_stats ORDER BY correct DESC, attempts LIMIT ?",
+            (limit,),
+        )
+
+    def question_accuracy(self, limit=50):
+        """문제별 (question_id, attempts, correct, 평균 응답 ms) 목록, 정답률이 낮은 문제부터."""
+        return self._cached_query(
+            "question_accuracy",
+            "SELECT question_id, attempts, correct, latency_ms_sum * 1.0 / attempts FROM question_stats "
+            "ORDER BY correct * 1.0 / attempts, attempts DESC LIMIT ?",
+            (limit,),
+        )
+
+    def user_stats(self, user):
+        """사용자 한 명의 (attempts, correct), 기록이 없으면 None."""
+        rows = self._cached_query("user_stats", "SELECT attempts, correct FROM user_stats WHERE user = ?", (user,))
+        return rows[0] if rows else None
@@ -0,0 +1,108 @@
+"""문제 생성기(``trigkit.question_gen``)로 문제 은행 파일을 만드는 명령줄 도구.
+
+기존 은행(``--base``)의 문제는 그대로 앞에 두고, 생성 문제 중 문제 문장이 겹치지 않는 것을
+최대 ``-n``개 덧붙입니다. 생성 문제의 id는 ``gen-<시드>-<번호>``라 같은 시드로 다시 만들어도
+바뀌지 않으므로, 문제 id로 저장하는 풀이 기록과 복습 일정이 그대로 이어집니다.
+출력 확장자가 ``.sqlite``/``.sqlite3``/``.db``면 SQLite, 아니면 JSONL로 씁니다.
+
+사용 예 (저장소 루트에서)::
+
+    python -m trigkit.build_bank --base data/questions.jsonl -o data/questions.jsonl
+    python -m trigkit.build_bank -n 500 --seed 7 -o /tmp/bank.sqlite
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+import numpy as np
+
+from trigkit.question_bank import QuestionBankError, load_question_bank
+from trigkit.question_gen import generate_questions
+
+DEFAULT_COUNT = 1000
+DEFAULT_SEED = 1
+BATCH_SIZE = 5000
+# 새 문제가 하나도 나오지 않는 묶음이 이만큼 이어지면 생성기가 만들 수 있는 문제를 다 쓴 것으로 봄
+MAX_EMPTY_BATCHES = 3
+FIELDS = ("id", "question", "answer", "options", "tags", "difficulty")
+
+
+def generated_questions(count, seed, seen):
+    """문제 문장이 seen에 없는 생성 문제를 최대 count개 만듭니다 (seen에 추가함).
+
+    생성기는 정답을 첫 보기로 두므로, 보기를 그대로 보여 주는 곳(수업 모드 대시보드 등)을 위해
+    시드로 정해지는 순서로 섞어 둡니다.
+    """
+    questions = []
+    empty_batches = 0
+    while len(questions) < count and empty_batches < MAX_EMPTY_BATCHES:
+        before = len(questions)
+        rng = np.random.default_rng(seed)
+        for q in generate_questions(BATCH_SIZE, seed):
+            if q["question"] not in seen:
+                seen.add(q["question"])
+                q["options"] = [q["options"][i] for i in rng.permutation(len(q["options"]))]
+                questions.append(q)
+                if len(questions) == count:
+                    break
+        empty_batches = empty_batches + 1 if len(questions) == before else 0
+        seed += 1
+    return questions
+
+
+def write_jsonl(path, questions):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for q in questions:
+            f.write(json.dumps({field: q[field] for field in FIELDS}, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+
+
+def write_sqlite(path, questions):
+    if os.path.exists(path):
+        os.remove(path)
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE questions (id TEXT PRIMARY KEY, question TEXT NOT NULL, answer TEXT NOT NULL, "
+            "options TEXT NOT NULL, tags TEXT, difficulty INTEGER)"
+        )
+        conn.executemany(
+            "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?)",
+            [(q["id"], q["question"], q["answer"], json.dumps(q["options"], ensure_ascii=False),
+              json.dumps(q["tags"], ensure_ascii=False), q["difficulty"]) for q in questions],
+        )
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m trigkit.build_bank", description="생성 문제로 문제 은행 만들기")
+    parser.add_argument("-o", "--output", required=True, help="만들 문제 은행 경로 (.jsonl 또는 .sqlite)")
+    parser.add_argument("--base", help="앞에 그대로 둘 기존 문제 은행 (JSONL 또는 SQLite)")
+    parser.add_argument("-n", "--count", type=int, default=DEFAULT_COUNT, help="덧붙일 생성 문제 최대 수")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="첫 생성 묶음의 시드")
+    args = parser.parse_args(argv)
+    if args.count < 0:
+        parser.error("-n/--count는 0 이상이어야 합니다.")
+
+    try:
+        base = load_question_bank(args.base) if args.base else []
+    except (QuestionBankError, OSError, sqlite3.Error) as e:
+        parser.error(str(e))
+    questions = [base[i] for i in range(len(base))]
+    seen = {q["question"] for q in questions}
+    added = generated_questions(args.count, args.seed, seen)
+    questions += added
+
+    if args.output.endswith((".sqlite", ".sqlite3", ".db")):
+        write_sqlite(args.output, questions)
+    else:
+        write_jsonl(args.output, questions)
+    load_question_bank(args.output)  # 쓴 파일을 앱과 같은 로더로 다시 검증
+    print(f"기존 {len(base)}개 + 생성 {len(added)}개 = {len(questions)}개 → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
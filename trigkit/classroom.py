@@ -0,0 +1,400 @@
+"""교사가 진행하는 수업 퀴즈 모드의 공유 상태.
+
+수업(Classroom) 하나는 모든 학생 세션이 함께 보는 객체이며, ``st.cache_resource``로
+프로세스 전체가 공유하는 수업 목록(registry)에 들어 있습니다. 목록은 세션 저장소와 같은
+``TRIG_SESSION_STORE`` 설정으로 고릅니다.
+
+- ``memory`` (기본): ``ClassroomRegistry``. 프로세스 안에만 있으므로 서버 프로세스 하나로 실행할 때만 씁니다.
+- ``sqlite:<경로>``: ``SQLiteClassroomRegistry``. 진행 상태와 응답을 SQLite 파일에 두어, 교사와
+  학생이 서로 다른 서버 프로세스에 연결되어도 같은 수업을 봅니다.
+
+학생 수백 명이 거의 동시에 제출하므로 보기별 응답 수는 하나의 전역 락 대신 학생 id의
+해시로 나눈 여러 조각(shard)에 나눠 셉니다. 제출은 자기 조각의 락만 잡고, 대시보드는
+조각별 합계를 잠깐씩 읽어 더합니다. 교사가 다음 문제로 넘기면 (문제 위치, 공개 여부,
+집계) 묶음을 통째로 새 튜플로 바꾸므로, 제출 쪽은 문제 전환용 락을 잡지 않습니다.
+
+문제 은행에는 정답이 첫 보기인 문제가 많으므로, 수업을 만들 때 문제마다 보기 순서를 한 번 섞어
+수업의 문제 목록에 함께 저장합니다. 그래서 교사 대시보드와 모든 학생(다른 프로세스 포함)이 같은 순서를 봅니다.
+"""
+import json
+import random
+import secrets
+import sqlite3
+import threading
+import time
+from typing import NamedTuple
+
+SHARDS = 16
+ROOM_TTL = 3 * 60 * 60  # 초: 이 시간 동안 조작이 없던 수업은 새 수업을 만들 때 정리
+
+
+def shuffle_options(questions):
+    """문제마다 보기 순서를 섞은 복사본 목록을 반환합니다 (원래 문제 dict는 그대로 둠)."""
+    rng = random.Random(secrets.randbits(64))
+    shuffled = []
+    for question in questions:
+        options = list(question["options"])
+        rng.shuffle(options)
+        shuffled.append({**question, "options": options})
+    return shuffled
+
+
+class ShardedTally:
+    """학생당 한 번만 세는 보기별 응답 수. 학생 id의 해시로 조각을 고릅니다."""
+
+    def __init__(self, num_options, shards=SHARDS):
+        self.num_options = num_options
+        self._shards = [(threading.Lock(), [0] * num_options, set()) for _ in range(shards)]
+
+    def _shard(self, student_id):
+        return self._shards[hash(student_id) % len(self._shards)]
+
+    def add(self, student_id, option_index):
+        """응답을 셉니다. 이미 응답한 학생이면 False를 반환합니다."""
+        lock, counts, answered = self._shard(student_id)
+        with lock:
+            if student_id in answered:
+                return False
+            answered.add(student_id)
+            counts[option_index] += 1
+        return True
+
+    def has_answered(self, student_id):
+        lock, _, answered = self._shard(student_id)
+        with lock:
+            return student_id in answered
+
+    def counts(self):
+        """조각별 응답 수를 더한 목록 (조각마다 잠깐씩만 락을 잡음)."""
+        total = [0] * self.num_options
+        for lock, counts, _ in self._shards:
+            with lock:
+                shard_counts = list(counts)
+            for i, count in enumerate(shard_counts):
+                total[i] += count
+        return total
+
+
+class ShardedSet:
+    """참여 학생 id 집합 (조각별 락)."""
+
+    def __init__(self, shards=SHARDS):
+        self._shards = [(threading.Lock(), set()) for _ in range(shards)]
+
+    def add(self, item):
+        lock, items = self._shards[hash(item) % len(self._shards)]
+        with lock:
+            items.add(item)
+
+    def __len__(self):
+        return sum(len(items) for _, items in self._shards)
+
+
+class ClassroomSnapshot(NamedTuple):
+    position: int  # 현재 문제 번호 (0부터), 문제 수와 같으면 수업 종료
+    total_questions: int
+    revealed: bool
+    counts: tuple
+    joined: int
+
+    @property
+    def finished(self):
+        return self.position >= self.total_questions
+
+    @property
+    def answered(self):
+        return sum(self.counts)
+
+
+class Classroom:
+    """문제 목록과 현재 진행 상태를 가진 수업 하나."""
+
+    def __init__(self, code, teacher_token, questions, shards=SHARDS):
+        self.code = code
+        self.questions = tuple(questions)
+        self.shards = shards
+        self._teacher_token = teacher_token
+        self._lock = threading.Lock()  # 교사 조작(다음 문제, 정답 공개)끼리만 사용
+        self._students = ShardedSet(shards)
+        self._state = (0, False, self._new_tally(0))
+        self.last_active = time.monotonic()
+
+    def _new_tally(self, position):
+        if position >= len(self.questions):
+            return ShardedTally(0, self.shards)
+        return ShardedTally(len(self.questions[position]["options"]), self.shards)
+
+    def is_teacher(self, token):
+        return secrets.compare_digest(token or "", self._teacher_token)
+
+    def question(self, position):
+        return self.questions[position] if position < len(self.questions) else None
+
+    def join(self, student_id):
+        self._students.add(student_id)
+
+    def snapshot(self):
+        position, revealed, tally = self._state
+        return ClassroomSnapshot(position, len(self.questions), revealed, tuple(tally.counts()), len(self._students))
+
+    def has_answered(self, student_id, position):
+        current, _, tally = self._state
+        return current == position and tally.has_answered(student_id)
+
+    def submit(self, student_id, position, option):
+        """현재 문제에 대한 학생의 답을 셉니다. 지난 문제, 공개 후, 중복 제출, 고르지 않은 답은 무시합니다."""
+        current, revealed, tally = self._state
+        if current != position or revealed:
+            return False
+        options = self.questions[position]["options"]
+        if option not in options:
+            return False
+        return tally.add(student_id, options.index(option))
+
+    def reveal(self, token):
+        if not self.is_teacher(token):
+            return False
+        with self._lock:
+            position, _, tally = self._state
+            self._state = (position, True, tally)
+            self.last_active = time.monotonic()
+        return True
+
+    def advance(self, token):
+        if not self.is_teacher(token):
+            return False
+        with self._lock:
+            position = min(self._state[0] + 1, len(self.questions))
+            self._state = (position, False, self._new_tally(position))
+            self.last_active = time.monotonic()
+        return True
+
+
+class ClassroomRegistry:
+    """수업 코드 → 수업. 프로세스 안의 dict라 서버 프로세스가 하나일 때만 씁니다."""
+
+    def __init__(self):
+        self._rooms = {}
+        self._lock = threading.Lock()
+
+    def create(self, questions):
+        """보기 순서를 섞은 새 수업을 만들고 (수업, 교사 토큰)을 반환합니다."""
+        token = secrets.token_urlsafe(16)
+        questions = shuffle_options(questions)
+        now = time.monotonic()
+        with self._lock:
+            for code in [c for c, room in self._rooms.items() if now - room.last_active > ROOM_TTL]:
+                del self._rooms[code]
+            code = f"{secrets.randbelow(1_000_000):06d}"
+            while code in self._rooms:
+                code = f"{secrets.randbelow(1_000_000):06d}"
+            room = self._rooms[code] = Classroom(code, token, questions)
+        return room, token
+
+    def get(self, code):
+        return self._rooms.get(code)
+
+    def close(self, code, token):
+        with self._lock:
+            room = self._rooms.get(code)
+            if room is not None and room.is_teacher(token):
+                del self._rooms[code]
+                return True
+        return False
+
+
+def _new_code():
+    return f"{secrets.randbelow(1_000_000):06d}"
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classrooms (
+    code TEXT PRIMARY KEY,
+    teacher_token TEXT NOT NULL,
+    questions TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    revealed INTEGER NOT NULL,
+    last_active REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS classroom_students (
+    code TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    PRIMARY KEY (code, student_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS classroom_answers (
+    code TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    student_id TEXT NOT NULL,
+    option INTEGER NOT NULL,
+    PRIMARY KEY (code, position, student_id)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteClassroom:
+    """SQLite에 상태를 둔 수업 하나. ``Classroom``과 같은 메서드를 가집니다.
+
+    문제 목록은 바뀌지 않으므로 프로세스마다 한 번만 읽고, 진행 상태와 응답 수는 매번 파일에서 읽습니다.
+    학생당 한 번만 세는 것은 (수업, 문제, 학생) 기본 키가 맡습니다.
+    """
+
+    def __init__(self, registry, code, teacher_token, questions):
+        self.code = code
+        self.questions = tuple(questions)
+        self._registry = registry
+        self._teacher_token = teacher_token
+
+    def _execute(self, sql, params):
+        return self._registry._connection().execute(sql, params)
+
+    def is_teacher(self, token):
+        return secrets.compare_digest(token or "", self._teacher_token)
+
+    def question(self, position):
+        return self.questions[position] if position < len(self.questions) else None
+
+    def join(self, student_id):
+        self._execute("INSERT OR IGNORE INTO classroom_students VALUES (?, ?)", (self.code, student_id))
+
+    def snapshot(self):
+        conn = self._registry._connection()
+        conn.execute("BEGIN")  # 세 조회가 같은 시점을 보도록 한 읽기 트랜잭션으로
+        try:
+            row = conn.execute("SELECT position, revealed FROM classrooms WHERE code = ?", (self.code,)).fetchone()
+            position, revealed = row if row else (len(self.questions), False)  # 다른 프로세스에서 닫힘
+            counts = [0] * (len(self.questions[position]["options"]) if position < len(self.questions) else 0)
+            for option, count in conn.execute(
+                "SELECT option, COUNT(*) FROM classroom_answers WHERE code = ? AND position = ? GROUP BY option",
+                (self.code, position),
+            ):
+                counts[option] = count
+            (joined,) = conn.execute(
+                "SELECT COUNT(*) FROM classroom_students WHERE code = ?", (self.code,)
+            ).fetchone()
+        finally:
+            conn.execute("COMMIT")
+        return ClassroomSnapshot(position, len(self.questions), bool(revealed), tuple(counts), joined)
+
+    def has_answered(self, student_id, position):
+        row = self._execute(
+            "SELECT 1 FROM classrooms c JOIN classroom_answers a ON a.code = c.code AND a.position = c.position "
+            "WHERE c.code = ? AND c.position = ? AND a.student_id = ?",
+            (self.code, position, student_id),
+        ).fetchone()
+        return row is not None
+
+    def submit(self, student_id, position, option):
+        """현재 문제에 대한 학생의 답을 셉니다. 지난 문제, 공개 후, 중복 제출, 고르지 않은 답은 무시합니다."""
+        if position >= len(self.questions) or option not in self.questions[position]["options"]:
+            return False
+        option_index = self.questions[position]["options"].index(option)
+        cursor = self._execute(
+            "INSERT OR IGNORE INTO classroom_answers (code, position, student_id, option) "
+            "SELECT code, position, ?, ? FROM classrooms WHERE code = ? AND position = ? AND revealed = 0",
+            (student_id, option_index, self.code, position),
+        )
+        return cursor.rowcount == 1
+
+    def reveal(self, token):
+        if not self.is_teacher(token):
+            return False
+        self._execute("UPDATE classrooms SET revealed = 1, last_active = ? WHERE code = ?", (time.time(), self.code))
+        return True
+
+    def advance(self, token):
+        if not self.is_teacher(token):
+            return False
+        self._execute(
+            "UPDATE classrooms SET position = min(position + 1, ?), revealed = 0, last_active = ? WHERE code = ?",
+            (len(self.questions), time.time(), self.code),
+        )
+        return True
+
+
+class SQLiteClassroomRegistry:
+    """수업 코드 → 수업. SQLite 파일을 공유하는 모든 서버 프로세스가 같은 수업을 봅니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._rooms = {}  # 이 프로세스에서 문제 목록을 읽어 둔 수업
+        self._lock = threading.Lock()
+        self._connection().executescript(SQLITE_SCHEMA)
+
+    def _connection(self):
+        # 연결은 스레드마다 하나씩 열어 두고 재사용 (자동 커밋)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _delete(self, conn, codes):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ("classroom_answers", "classroom_students", "classrooms"):
+                conn.executemany(f"DELETE FROM {table} WHERE code = ?", [(code,) for code in codes])
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        with self._lock:
+            for code in codes:
+                self._rooms.pop(code, None)
+
+    def create(self, questions):
+        """보기 순서를 섞은 새 수업을 만들고 (수업, 교사 토큰)을 반환합니다."""
+        token = secrets.token_urlsafe(16)
+        questions = tuple(shuffle_options(questions))
+        conn = self._connection()
+        now = time.time()
+        expired = [code for (code,) in conn.execute(
+            "SELECT code FROM classrooms WHERE last_active < ?", (now - ROOM_TTL,)
+        )]
+        if expired:
+            self._delete(conn, expired)
+        while True:
+            code = _new_code()
+            try:
+                conn.execute(
+                    "INSERT INTO classrooms VALUES (?, ?, ?, 0, 0, ?)",
+                    (code, token, json.dumps(questions, ensure_ascii=False), now),
+                )
+                break
+            except sqlite3.IntegrityError:  # 다른 수업이 쓰는 코드
+                continue
+        room = SQLiteClassroom(self, code, token, questions)
+        with self._lock:
+            self._rooms[code] = room
+        return room, token
+
+    def get(self, code):
+        row = self._connection().execute(
+            "SELECT teacher_token, questions FROM classrooms WHERE code = ?", (code,)
+        ).fetchone()
+        if row is None:
+            with self._lock:
+                self._rooms.pop(code, None)
+            return None
+        with self._lock:
+            room = self._rooms.get(code)
+            if room is None:
+                room = self._rooms[code] = SQLiteClassroom(self, code, row[0], json.loads(row[1]))
+        return room
+
+    def close(self, code, token):
+        room = self.get(code)
+        if room is None or not room.is_teacher(token):
+            return False
+        self._delete(self._connection(), [code])
+        return True
+
+
+def create_classroom_registry(spec):
+    """``memory`` 또는 ``sqlite:<경로>`` 설정 문자열로 수업 목록을 만듭니다 (세션 저장소와 같은 형식)."""
+    if spec == "memory":
+        return ClassroomRegistry()
+    if spec.startswith("sqlite:"):
+        return SQLiteClassroomRegistry(spec[len("sqlite:"):])
+    raise ValueError(f"알 수 없는 수업 저장소 설정: {spec!r} (memory 또는 sqlite:<경로>)")
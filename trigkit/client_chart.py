@@ -0,0 +1,135 @@
+"""그래프를 브라우저에서 그리도록 Vega-Lite 스펙을 만드는 클라이언트 렌더링 백엔드.
+
+서버는 PNG를 래스터화하지 않고, 적응형으로 솎아 낸 곡선 좌표와 점근선·축 정보만
+간결한 JSON으로 보냅니다.
+"""
+import numpy as np
+
+from trigkit.curves import tan_asymptotes
+from trigkit.expression import compile_expression
+from trigkit.graph_figure import CURVE_COLORS, MAX_ASYMPTOTES, X_MAX, X_MIN
+from trigkit.sampling import base_curve
+from trigkit.viewport import DEFAULT_VIEWPORT, viewport_curve
+
+# 좌표 반올림 자릿수 (전송 바이트를 줄이기 위함)
+COORD_DECIMALS = 4
+
+CHART_HEIGHT = 420
+
+# 보기 범위를 옮기거나 확대했을 때 곡선을 계산할 픽셀 열 수 (전송량을 위해 서버 이미지보다 적게)
+CLIENT_COLUMNS = 800
+
+
+def _pi_tick_label(k, denominator=4):
+    """π/denominator의 k배를 유니코드 라벨로 바꿉니다 (브라우저 쪽은 LaTeX를 쓰지 않음)."""
+    if k == 0:
+        return "0"
+    gcd_val = np.gcd(abs(k), denominator)
+    numerator = k // gcd_val
+    denominator //= gcd_val
+    sign = "-" if numerator < 0 else ""
+    coeff = "" if abs(numerator) == 1 else str(abs(numerator))
+    if denominator == 1:
+        return f"{sign}{coeff}π"
+    return f"{sign}{coeff}π/{denominator}"
+
+
+def _x_axis(viewport):
+    # 눈금 간격은 π/4 · 2^x_level: 확대하면 π/8, π/16 ..., 축소하면 π/2, π, 2π ...
+    numerator_step = 2 ** max(viewport.x_level, 0)
+    denominator = 4 * 2 ** max(-viewport.x_level, 0)
+    spacing = np.pi * numerator_step / denominator
+    k_values = range(int(np.ceil(viewport.x_min / spacing - 1e-9)), int(np.floor(viewport.x_max / spacing + 1e-9)) + 1)
+    decimals = COORD_DECIMALS + max(-viewport.x_level, 0)
+    ticks = [round(k * spacing, decimals) for k in k_values]
+    # 눈금 값 → 라벨을 Vega 식의 삼항 연산 체인으로 표현
+    label_expr = "''"
+    for k, tick in reversed(list(zip(k_values, ticks))):
+        label = _pi_tick_label(k * numerator_step, denominator)
+        label_expr = f"abs(datum.value - {tick}) < {spacing / 100:.3g} ? '{label}' : {label_expr}"
+    return {"title": "X축", "values": ticks, "labelExpr": label_expr, "grid": True}
+
+
+def _curve_rows(func, x, y, rows, decimals=COORD_DECIMALS):
+    # NaN(탄젠트 극)에서 선을 끊기 위해 구간 번호를 붙이고 NaN 점은 버림
+    gaps = np.isnan(y)
+    segment = np.cumsum(gaps)
+    keep = ~gaps
+    xs = np.round(x[keep].astype(float), decimals).tolist()
+    ys = np.round(y[keep].astype(float), COORD_DECIMALS).tolist()
+    segs = segment[keep].tolist()
+    rows.extend({"x": xv, "y": yv, "f": func, "s": sv} for xv, yv, sv in zip(xs, ys, segs))
+
+
+def build_vega_lite_spec(show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift,
+                         viewport=DEFAULT_VIEWPORT, expression=""):
+    """현재 파라미터의 그래프를 그리는 Vega-Lite 스펙(dict)을 반환합니다. expression은 직접 입력한 식."""
+    shown = [func for func, flag in (("sin", show_sin), ("cos", show_cos), ("tan", show_tan)) if flag]
+    # 확대할수록 x 좌표를 더 세밀하게 보내야 픽셀 열이 뭉개지지 않음
+    x_decimals = COORD_DECIMALS + max(-viewport.x_level, 0)
+    rows = []
+    for func in shown:
+        if viewport == DEFAULT_VIEWPORT:
+            x, base_y = base_curve(func, frequency, x_shift, X_MIN, X_MAX)
+        else:
+            x, base_y = viewport_curve(func, frequency, x_shift, viewport, CLIENT_COLUMNS)
+        _curve_rows(func, x, amplitude * base_y + y_shift, rows, x_decimals)
+
+    labels = {
+        func: f"y = {amplitude:.2f} {func}({frequency:.2f}x + {x_shift:.2f}) + {y_shift:.2f}"
+        for func in shown
+    }
+    if expression:
+        compiled = compile_expression(expression)
+        x, y = compiled.curve(viewport.x_min, viewport.x_max, CLIENT_COLUMNS)
+        _curve_rows("expr", x, y, rows, x_decimals)
+        shown.append("expr")
+        labels["expr"] = f"y = {compiled.text}"  # 숫자, 이름, 연산자만 있어 따옴표가 들어가지 않음
+    legend_expr = "datum.label"
+    for func, label in labels.items():
+        legend_expr = f"datum.label == '{func}' ? '{label}' : {legend_expr}"
+
+    x_encoding = {
+        "field": "x", "type": "quantitative",
+        "scale": {"domain": [viewport.x_min, viewport.x_max]}, "axis": _x_axis(viewport),
+    }
+    y_encoding = {
+        "field": "y", "type": "quantitative",
+        "scale": {"domain": [viewport.y_min, viewport.y_max]}, "axis": {"title": "Y축"},
+    }
+
+    layers = [
+        {"mark": {"type": "rule", "color": "black", "strokeWidth": 1.5}, "encoding": {"y": {"datum": 0}}},
+        {"mark": {"type": "rule", "color": "black", "strokeWidth": 0.8}, "encoding": {"x": {"datum": 0}}},
+        {
+            "data": {"values": rows},
+            "mark": {"type": "line", "clip": True},
+            "encoding": {
+                "x": x_encoding,
+                "y": y_encoding,
+                "color": {
+                    "field": "f",
+                    "type": "nominal",
+                    "scale": {"domain": shown, "range": [CURVE_COLORS[f] for f in shown]},
+                    "legend": {"title": None, "orient": "top-right", "labelExpr": legend_expr, "labelLimit": 400},
+                },
+                "detail": {"field": "s"},
+            },
+        },
+    ]
+
+    poles = tan_asymptotes(frequency, x_shift, viewport.x_min, viewport.x_max) if show_tan else ()
+    if 0 < len(poles) <= MAX_ASYMPTOTES:
+        poles = np.round(poles, x_decimals).tolist()
+        layers.append({
+            "data": {"values": [{"x": p} for p in poles]},
+            "mark": {"type": "rule", "color": CURVE_COLORS["tan"], "strokeDash": [4, 4], "opacity": 0.7},
+            "encoding": {"x": {"field": "x", "type": "quantitative"}},
+        })
+
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": "삼각함수 그래프",
+        "height": CHART_HEIGHT,
+        "layer": layers,
+    }
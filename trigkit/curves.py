@@ -0,0 +1,45 @@
+"""y = A·f(Bx + C) + D 곡선 계산에 쓰는 보조 함수들."""
+import numpy as np
+
+
+def tan_asymptotes(frequency, x_shift, x_min, x_max):
+    """보이는 범위 안의 탄젠트 점근선 위치를 닫힌 식으로 구합니다.
+
+    Bx + C = π/2 + kπ 이므로 x = (π/2 + kπ − C) / B 입니다.
+    """
+    if frequency == 0:
+        return np.empty(0)
+    lo, hi = sorted((frequency * x_min + x_shift, frequency * x_max + x_shift))
+    k_min = np.ceil((lo - np.pi / 2) / np.pi)
+    k_max = np.floor((hi - np.pi / 2) / np.pi)
+    k = np.arange(k_min, k_max + 1)
+    poles = (np.pi / 2 + k * np.pi - x_shift) / frequency
+    poles.sort()
+    return poles
+
+
+def split_at_poles(x, y, poles):
+    """극 위치에 NaN 점을 끼워 넣어 곡선이 점근선을 가로질러 이어지지 않게 합니다."""
+    if len(poles) == 0:
+        return x, y
+    idx = np.searchsorted(x, poles)
+    return np.insert(x, idx, poles), np.insert(y, idx, np.nan)
+
+
+def asymptote_segments(poles, y_min, y_max):
+    """점근선 위치를 LineCollection용 (n, 2, 2) 선분 배열로 바꿉니다."""
+    segments = np.empty((len(poles), 2, 2))
+    segments[:, :, 0] = np.asarray(poles)[:, None]
+    segments[:, 0, 1] = y_min
+    segments[:, 1, 1] = y_max
+    return segments
+
+
+def apply_amplitude_shift(base_y, amplitude, y_shift, out=None):
+    """A·f + D 를 계산합니다. out을 주면 그 버퍼에 제자리로 쓰고, 없으면 새 배열 하나만 만듭니다.
+
+    base_y는 캐시된 기본 곡선이므로 직접 바꾸지 않습니다.
+    """
+    out = np.multiply(base_y, amplitude, out=out)
+    out += y_shift
+    return out
@@ -0,0 +1,136 @@
+"""특수각의 정확한 값 표.
+
+각을 π의 유리수 배 kπ/12 (k = 0 … 24, 즉 0° … 360°를 15° 간격)로 나타냅니다.
+π/4의 배수(= 3kπ/12)도 모두 포함됩니다. 라디안 LaTeX, sin/cos/tan의 정확한 LaTeX,
+탄젠트 정의 여부를 모듈을 불러올 때 한 번만 계산해 정수 인덱스 표로 둡니다.
+"""
+from math import gcd, isclose, pi
+from typing import NamedTuple
+
+# 각 인덱스 단위: π/12 (= 15°)
+STEP_DEGREES = 15
+STEPS_PER_TURN = 24
+
+UNDEFINED = "정의되지 않음"
+
+# 0° ~ 90° (k = 0 … 6) 기본 값
+_SIN_FIRST_QUADRANT = (
+    (r"0", 0.0),
+    (r"\frac{\sqrt{6}-\sqrt{2}}{4}", 0.25881904510252074),
+    (r"\frac{1}{2}", 0.5),
+    (r"\frac{\sqrt{2}}{2}", 0.7071067811865476),
+    (r"\frac{\sqrt{3}}{2}", 0.8660254037844386),
+    (r"\frac{\sqrt{6}+\sqrt{2}}{4}", 0.9659258262890683),
+    (r"1", 1.0),
+)
+
+# 0° ~ 75° (k = 0 … 5) 탄젠트 기본 값과 음수일 때의 표기
+_TAN_FIRST_QUADRANT = (
+    (r"0", r"0", 0.0),
+    (r"2-\sqrt{3}", r"\sqrt{3}-2", 0.2679491924311227),
+    (r"\frac{\sqrt{3}}{3}", r"-\frac{\sqrt{3}}{3}", 0.5773502691896257),
+    (r"1", r"-1", 1.0),
+    (r"\sqrt{3}", r"-\sqrt{3}", 1.7320508075688772),
+    (r"2+\sqrt{3}", r"-2-\sqrt{3}", 3.7320508075688772),
+)
+
+
+class ExactAngle(NamedTuple):
+    index: int
+    degrees: int
+    radians: float
+    rad_latex: str
+    sin_latex: str
+    cos_latex: str
+    tan_latex: str
+    tan_defined: bool
+    sin: float
+    cos: float
+    tan: float
+
+
+def _rad_latex(k):
+    numerator, denominator = k, 12
+    g = gcd(numerator, denominator) or 1
+    numerator //= g
+    denominator //= g
+    if numerator == 0:
+        return r"0"
+    coeff = "" if numerator == 1 else str(numerator)
+    if denominator == 1:
+        return rf"{coeff}\pi"
+    return rf"\frac{{{coeff}\pi}}{{{denominator}}}"
+
+
+def _sin_exact(k):
+    k %= STEPS_PER_TURN
+    if k <= 6:
+        latex, value = _SIN_FIRST_QUADRANT[k]
+        return latex, value
+    if k <= 12:
+        return _sin_exact(12 - k)
+    latex, value = _sin_exact(k - 12)
+    if value == 0:
+        return latex, value
+    return "-" + latex, -value
+
+
+def _tan_exact(k):
+    k %= 12
+    if k == 6:
+        return UNDEFINED, False, float("nan")
+    if k < 6:
+        latex, _, value = _TAN_FIRST_QUADRANT[k]
+        return latex, True, value
+    _, negative_latex, value = _TAN_FIRST_QUADRANT[12 - k]
+    return negative_latex, True, -value
+
+
+def _build_table():
+    table = []
+    for k in range(STEPS_PER_TURN + 1):
+        sin_latex, sin_value = _sin_exact(k)
+        cos_latex, cos_value = _sin_exact(k + 6)
+        tan_latex, tan_defined, tan_value = _tan_exact(k)
+        table.append(ExactAngle(
+            index=k,
+            degrees=k * STEP_DEGREES,
+            radians=k * pi / 12,
+            rad_latex=_rad_latex(k),
+            sin_latex=sin_latex,
+            cos_latex=cos_latex,
+            tan_latex=tan_latex,
+            tan_defined=tan_defined,
+            sin=sin_value,
+            cos=cos_value,
+            tan=tan_value,
+        ))
+    return tuple(table)
+
+
+# k → ExactAngle (k = 0 … 24)
+EXACT_ANGLES = _build_table()
+
+
+def angle_index_from_degrees(degrees):
+    """15°의 배수(0° ~ 360°)이면 표 인덱스를, 아니면 None을 반환합니다."""
+    q = degrees / STEP_DEGREES
+    k = round(q)
+    if 0 <= k <= STEPS_PER_TURN and isclose(q, k, abs_tol=1e-9):
+        return k
+    return None
+
+
+def angle_index_from_radians(radians):
+    """π/12의 배수(0 ~ 2π)이면 표 인덱스를, 아니면 None을 반환합니다."""
+    q = radians * 12 / pi
+    k = round(q)
+    if 0 <= k <= STEPS_PER_TURN and isclose(q, k, abs_tol=1e-9):
+        return k
+    return None
+
+
+def exact_value_latex(index, func):
+    """표 인덱스의 정확한 sin/cos/tan LaTeX를 반환합니다 (탄젠트가 정의되지 않으면 안내 문구)."""
+    angle = EXACT_ANGLES[index]
+    return getattr(angle, f"{func}_latex")
@@ -0,0 +1,326 @@
+"""여러 (함수, A, B, C, D) 조합의 그래프를 한꺼번에 PDF 학습지/PNG 파일로 내보내는 명령줄 도구.
+
+그래프는 그래프 페이지와 같은 ``render_graph_png``로 그립니다 (Streamlit 없이 동작). 작업은
+프로세스 풀에 나눠 주며, 작업 프로세스는 Agg 백엔드와 재사용 Figure 하나로 그린 뒤 PNG 파일을
+직접 쓰고, PDF용으로는 PNG 바이트를 돌려줍니다. 부모 프로세스는 결과를 순서대로 받아 A4 쪽 Figure
+하나에 배치하고, 쪽이 찰 때마다 matplotlib ``PdfPages``로 바로 씁니다.
+
+학습지 제목과 문항 설명에는 설치된 한글 글꼴(나눔고딕, Noto Sans CJK KR 등)을 쓰고 PDF에 글꼴을
+넣습니다(TrueType). 한글 글꼴이 없으면 ``--font``로 글꼴 파일을 지정해 주세요.
+파라미터 범위는 그래프 페이지 슬라이더와 같으며(A 0~4, B 0.1~5, C ±2π, D ±5), 벗어나면 그리기 전에
+사용법 오류로 끝납니다.
+
+사용 예 (저장소 루트에서)::
+
+    python -m trigkit.export --grid "func=sin,cos,tan A=1,2 B=0.5,1,2 C=0 D=0" -o worksheet.pdf
+    python -m trigkit.export --jobs jobs.csv --png-dir graphs/ --workers 4
+    python -m trigkit.export --grid "func=sin A=1,2,3" --title "진폭 비교" --font NanumGothic.ttf -o amp.pdf
+
+``--jobs`` CSV는 ``func,A,B,C,D`` 머리글을 가지며, func에는 ``sin+cos``처럼 여러 함수를 ``+``로
+이어 쓸 수 있습니다.
+"""
+import argparse
+import csv
+import itertools
+import math
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from typing import NamedTuple
+
+FUNCS = ("sin", "cos", "tan")
+GRID_KEYS = ("func", "A", "B", "C", "D")
+# 그래프 페이지 슬라이더와 같은 범위 (B가 0이면 주기 계산이 0으로 나누기가 됨)
+PARAM_RANGES = {"A": (0.0, 4.0), "B": (0.1, 5.0), "C": (-2 * math.pi, 2 * math.pi), "D": (-5.0, 5.0)}
+RANGE_TOLERANCE = 1e-6  # C=6.283185처럼 2π를 반올림해 적은 값은 받아들임
+
+EXPORT_DPI = 150
+PAGE_SIZE = (8.27, 11.69)  # A4 세로, 인치
+PAGE_COLUMNS = 2
+PAGE_ROWS = 3
+PAGE_MARGIN = 0.5  # 인치
+TITLE_SIZE = 14  # pt
+CAPTION_SIZE = 9  # pt
+WORKSHEET_TITLE = "삼각함수 그래프 학습지"
+KOREAN_FONTS = ("NanumGothic", "Noto Sans CJK KR", "Noto Sans KR", "Malgun Gothic", "AppleGothic")
+
+
+class ExportJob(NamedTuple):
+    number: int  # 1부터 매기는 학습지 문항 번호
+    funcs: tuple
+    amplitude: float
+    frequency: float
+    x_shift: float
+    y_shift: float
+
+    @property
+    def params(self):
+        """``render_graph_png``에 넘길 그래프 파라미터."""
+        return (*(func in self.funcs for func in FUNCS), self.amplitude, self.frequency, self.x_shift, self.y_shift)
+
+    @property
+    def caption(self):
+        curves = ", ".join(
+            f"y = {self.amplitude:g} {func}({self.frequency:g}x + {self.x_shift:g}) + {self.y_shift:g}"
+            for func in self.funcs
+        )
+        return f"{self.number}. {curves}"
+
+
+def parse_funcs(text):
+    funcs = tuple(func.strip() for func in text.split("+") if func.strip())
+    unknown = [func for func in funcs if func not in FUNCS]
+    if not funcs or unknown:
+        raise ValueError(f"알 수 없는 함수: {text!r} (sin, cos, tan을 +로 이어 씀)")
+    return funcs
+
+
+def parse_param(key, text):
+    """파라미터 값 하나를 실수로 읽고 슬라이더 범위 안인지 확인합니다 (아니면 ValueError)."""
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} 값이 숫자가 아닙니다: {text!r}") from None
+    low, high = PARAM_RANGES[key]
+    if not low - RANGE_TOLERANCE <= value <= high + RANGE_TOLERANCE:
+        raise ValueError(f"{key}={text}: {key}는 {low:g} 이상 {high:g} 이하여야 합니다.")
+    return value
+
+
+def make_job(number, func, a, b, c, d):
+    return ExportJob(number, parse_funcs(func), parse_param("A", a), parse_param("B", b),
+                     parse_param("C", c), parse_param("D", d))
+
+
+def parse_grid(spec):
+    """``"func=sin,cos A=1,2 B=1 C=0 D=0"`` 형식의 격자를 모든 조합의 작업 목록으로 펼칩니다.
+
+    값이 잘못되었거나 범위를 벗어나면 그리기 전에 ValueError를 냅니다.
+    """
+    values = {"func": ["sin"], "A": ["1"], "B": ["1"], "C": ["0"], "D": ["0"]}
+    for part in spec.split():
+        key, _, items = part.partition("=")
+        if key not in values or not items:
+            raise ValueError(f"격자 항목 형식이 잘못되었습니다: {part!r} ({', '.join(GRID_KEYS)} 중 하나=값,값...)")
+        values[key] = items.split(",")
+        for item in values[key]:
+            if key == "func":
+                parse_funcs(item)
+            else:
+                parse_param(key, item)  # 조합으로 펼치기 전에 값마다 한 번씩 확인
+    combos = itertools.product(*(values[key] for key in GRID_KEYS))
+    return [make_job(number, *combo) for number, combo in enumerate(combos, start=1)]
+
+
+def read_jobs_csv(path):
+    """``func,A,B,C,D`` CSV를 작업 목록으로 읽습니다. 잘못된 행이 있으면 행 번호와 함께 ValueError."""
+    jobs = []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = [key for key in GRID_KEYS if key not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"{path}: 머리글에 {', '.join(missing)} 열이 없습니다.")
+        for number, row in enumerate(reader, start=1):
+            try:
+                jobs.append(make_job(number, *(row[key] for key in GRID_KEYS)))
+            except ValueError as e:
+                raise ValueError(f"{path} {reader.line_num}행: {e}") from None
+    return jobs
+
+
+# --- 작업 프로세스 ---
+_worker_options = {}
+
+
+def init_worker(dpi, png_dir, want_pdf):
+    """작업 프로세스 초기화: Agg 백엔드를 고정하고 재사용할 Figure를 미리 만듭니다."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from trigkit.graph_figure import FIGURE_SIZE, checkout_figure
+
+    _worker_options.update(dpi=dpi, png_dir=png_dir, want_pdf=want_pdf)
+    with checkout_figure(FIGURE_SIZE, dpi):
+        pass
+
+
+def render_job(job):
+    """그래프 하나를 그려 PNG는 파일로 쓰고, PDF용 PNG 바이트(또는 None)를 반환합니다."""
+    from trigkit.graph_figure import FIGURE_SIZE, render_graph_png
+
+    png = render_graph_png(*job.params, figsize=FIGURE_SIZE, dpi=_worker_options["dpi"])
+    if _worker_options["png_dir"]:
+        with open(os.path.join(_worker_options["png_dir"], f"graph_{job.number:04d}.png"), "wb") as f:
+            f.write(png)
+    return png if _worker_options["want_pdf"] else None
+
+
+# --- 부모 프로세스 ---
+def worksheet_font(font_path=None):
+    """학습지 글자에 쓸 FontProperties와 한글 글꼴을 찾았는지 여부를 반환합니다.
+
+    font_path가 있으면 그 글꼴을 먼저 등록해 쓰고, 그다음 설치된 한글 글꼴, 마지막으로 DejaVu Sans 순으로
+    글자마다 대체합니다.
+    """
+    from matplotlib import font_manager
+
+    families = []
+    if font_path:
+        font_manager.fontManager.addfont(font_path)
+        families.append(font_manager.FontProperties(fname=font_path).get_name())
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    families += [name for name in KOREAN_FONTS if name in installed]
+    return font_manager.FontProperties(family=[*families, "DejaVu Sans"]), bool(families)
+
+
+class WorksheetWriter:
+    """A4 쪽 Figure 하나를 재사용해 그래프를 columns × rows 칸에 배치하고 ``PdfPages``에 씁니다."""
+
+    def __init__(self, pdf, title, font, columns=PAGE_COLUMNS, rows=PAGE_ROWS):
+        from matplotlib.figure import Figure
+
+        self.pdf = pdf
+        self.title = title
+        self.page_count = 0
+        self.figure = Figure(figsize=PAGE_SIZE)
+        margin_x, margin_y = PAGE_MARGIN / PAGE_SIZE[0], PAGE_MARGIN / PAGE_SIZE[1]
+        title_font, caption_font = font.copy(), font.copy()
+        title_font.set_size(TITLE_SIZE)
+        caption_font.set_size(CAPTION_SIZE)
+        self._title = self.figure.text(0.5, 1 - margin_y, "", ha="center", va="top", fontproperties=title_font)
+        grid = self.figure.add_gridspec(
+            rows, columns, left=margin_x, right=1 - margin_x, bottom=margin_y, top=1 - 2 * margin_y,
+            wspace=0.05, hspace=0.2,
+        )
+        self.axes = [self.figure.add_subplot(grid[row, col]) for row in range(rows) for col in range(columns)]
+        self._captions = []
+        for ax in self.axes:
+            ax.set_axis_off()
+            self._captions.append(ax.set_title("", loc="left", fontproperties=caption_font))
+        self._images = [None] * len(self.axes)
+
+    @property
+    def cells(self):
+        return len(self.axes)
+
+    def add_page(self, entries):
+        """[(작업, RGB 배열), ...]을 한 쪽에 배치해 씁니다. 남는 칸은 비워 둡니다."""
+        for i, ax in enumerate(self.axes):
+            if self._images[i] is not None:
+                self._images[i].remove()  # 그래프마다 그림 크기가 조금씩 달라 새로 놓음
+                self._images[i] = None
+            if i < len(entries):
+                job, rgb = entries[i]
+                self._images[i] = ax.imshow(rgb, interpolation="none")
+                self._captions[i].set_text(job.caption)
+            else:
+                self._captions[i].set_text("")
+        self.page_count += 1
+        self._title.set_text(f"{self.title} · {self.page_count}쪽")
+        self.pdf.savefig(self.figure)
+
+
+def decode_png(png):
+    from matplotlib.image import imread
+
+    return imread(BytesIO(png), format="png")
+
+
+def iter_results(jobs, workers, dpi, png_dir, want_pdf, chunksize=1):
+    """(작업, 결과)를 작업 순서대로 내놓습니다. workers가 1이면 현재 프로세스에서 그립니다."""
+    if workers <= 1:
+        init_worker(dpi, png_dir, want_pdf)
+        for job in jobs:
+            yield job, render_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(dpi, png_dir, want_pdf)) as executor:
+        yield from zip(jobs, executor.map(render_job, jobs, chunksize=chunksize))
+
+
+def export(jobs, pdf_path=None, png_dir=None, workers=None, dpi=EXPORT_DPI,
+           columns=PAGE_COLUMNS, rows=PAGE_ROWS, progress=None, title=WORKSHEET_TITLE, font_path=None):
+    """작업 목록을 내보내고 (그래프 수, PDF 페이지 수)를 반환합니다."""
+    workers = workers or os.cpu_count() or 1
+    if png_dir:
+        os.makedirs(png_dir, exist_ok=True)
+    # 작업이 적으면 잘게, 많으면 조금씩 묶어 보내 프로세스 간 왕복을 줄임
+    chunksize = max(1, len(jobs) // (workers * 8))
+    results = iter_results(jobs, workers, dpi, png_dir, pdf_path is not None, chunksize)
+
+    if pdf_path is None:
+        done = 0
+        for done, _ in enumerate(results, start=1):
+            if progress:
+                progress(done, len(jobs))
+        return done, 0
+
+    import matplotlib
+    from matplotlib.backends.backend_pdf import PdfPages
+
+    font, has_korean = worksheet_font(font_path)
+    if not has_korean:
+        warnings.warn("한글 글꼴을 찾지 못해 학습지의 한글이 빈칸으로 나올 수 있습니다. --font로 글꼴 파일을 지정해 주세요.")
+    done = 0
+    # 글꼴을 Type 3 대신 TrueType(42)으로 넣어 한글 글자가 PDF 안에서 그대로 검색·복사되게 함
+    with matplotlib.rc_context({"pdf.fonttype": 42}), PdfPages(pdf_path, metadata={"Title": title}) as pdf:
+        writer = WorksheetWriter(pdf, title, font, columns, rows)
+        pending = []
+        for job, png in results:
+            pending.append((job, decode_png(png)))
+            done += 1
+            if len(pending) == writer.cells:
+                writer.add_page(pending)
+                pending = []
+            if progress:
+                progress(done, len(jobs))
+        if pending:
+            writer.add_page(pending)
+    return done, writer.page_count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m trigkit.export", description="삼각함수 그래프 일괄 내보내기")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--grid", help='조합 격자, 예: "func=sin,cos A=1,2 B=0.5,1 C=0 D=0"')
+    source.add_argument("--jobs", help="func,A,B,C,D 머리글을 가진 CSV 파일")
+    parser.add_argument("-o", "--output", help="만들 PDF 학습지 경로")
+    parser.add_argument("--png-dir", help="그래프별 PNG를 저장할 폴더")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--dpi", type=int, default=EXPORT_DPI)
+    parser.add_argument("--columns", type=int, default=PAGE_COLUMNS, help="PDF 한 쪽의 열 수")
+    parser.add_argument("--rows", type=int, default=PAGE_ROWS, help="PDF 한 쪽의 행 수")
+    parser.add_argument("--title", default=WORKSHEET_TITLE, help="PDF 학습지 제목")
+    parser.add_argument("--font", help="학습지 글자에 쓸 한글 글꼴 파일(.ttf/.otf) 경로")
+    args = parser.parse_args(argv)
+    if not args.output and not args.png_dir:
+        parser.error("-o/--output 또는 --png-dir 중 하나는 있어야 합니다.")
+    if args.columns < 1 or args.rows < 1 or args.dpi < 1:
+        parser.error("--columns, --rows, --dpi는 1 이상이어야 합니다.")
+    if args.font and not os.path.isfile(args.font):
+        parser.error(f"글꼴 파일이 없습니다: {args.font}")
+
+    try:
+        jobs = parse_grid(args.grid) if args.grid else read_jobs_csv(args.jobs)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if not jobs:
+        parser.error("내보낼 그래프가 없습니다.")
+
+    def progress(done, total):
+        print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    count, pages = export(jobs, args.output, args.png_dir, args.workers, args.dpi, args.columns, args.rows, progress,
+                          args.title, args.font)
+    elapsed = time.perf_counter() - start
+    print(file=sys.stderr)
+    print(f"그래프 {count}개 ({pages}쪽) · {elapsed:.1f}초 · 작업 프로세스 {args.workers}개 · "
+          f"{count / elapsed:.1f}개/초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
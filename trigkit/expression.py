@@ -0,0 +1,251 @@
+"""그래프 페이지에 직접 입력한 식(예: ``2*sin(x) + cos(3*x)``, ``sin(x)^2``)을 안전하게 계산하는 엔진.
+
+입력은 ``ast``로 파싱한 뒤 허용 목록에 있는 노드(숫자, ``x``/``pi``/``e``, 사칙연산과 거듭제곱,
+허용한 수학 함수 호출)만 남아 있는지 검사합니다. 속성 접근, 첨자, 문자열, 람다, 내장 함수 같은 것은
+모두 거부하므로 임의의 코드는 실행되지 않습니다. 검사를 통과한 트리는 ``lambda x: ...``로 한 번만
+컴파일하며, 이름 공간에는 NumPy 함수만 있고 내장 함수는 비워 둡니다. 계산은 x 배열 전체에 대한
+NumPy 연산 한 번이라 격자가 커도 파이썬 반복이 없습니다.
+
+컴파일 결과는 정규화한 식 텍스트(``ast.unparse``)를 키로 하는 LRU 캐시에 두므로 공백이나 괄호만
+다른 같은 식은 한 번만 컴파일합니다. 입력 텍스트 그대로도 앞단 LRU 캐시에 두어, 슬라이더를 움직일 때마다
+같은 식이 다시 들어와도 파싱하지 않습니다.
+
+거듭제곱은 실수 범위에서만 계산합니다. ``(-8)**(1/3)``처럼 x가 없는 부분이 실수가 아니거나 넘치면
+컴파일할 때 거부하고, ``x**0.5``처럼 x에 따라 실수가 아닌 점은 NaN으로 둡니다.
+
+탄젠트 항과 나눗셈은 따로 컴파일해 두었다가, 이웃한 두 점 사이에서 탄젠트 인자가 π/2 + kπ를
+지나거나 분모의 부호가 바뀌면 그 사이에 NaN을 끼워 곡선이 극을 가로질러 이어지지 않게 합니다.
+"""
+import ast
+import copy
+from functools import lru_cache
+
+import numpy as np
+
+MAX_EXPRESSION_LENGTH = 200
+MAX_NODES = 120
+MAX_CONSTANT = 1e6
+EXPRESSION_CACHE_SIZE = 256
+
+FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "sqrt": np.sqrt,
+    "abs": np.abs,
+    "exp": np.exp,
+    "log": np.log,
+}
+CONSTANTS = {"pi": np.pi, "e": np.e}
+VARIABLE = "x"
+
+_BIN_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_UNARY_OPS = (ast.UAdd, ast.USub)
+
+
+class ExpressionError(ValueError):
+    """식을 받아들일 수 없을 때 사용자에게 보여 줄 메시지와 함께 발생합니다."""
+
+
+def _check_node(node):
+    """허용 목록에 없는 노드가 있으면 ExpressionError를 냅니다."""
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _BIN_OPS):
+            raise ExpressionError("+, -, *, /, ** 연산만 쓸 수 있습니다.")
+        _check_node(node.left)
+        _check_node(node.right)
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _UNARY_OPS):
+            raise ExpressionError("부호는 +, -만 쓸 수 있습니다.")
+        _check_node(node.operand)
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            raise ExpressionError(f"쓸 수 있는 함수: {', '.join(FUNCTIONS)}")
+        if len(node.args) != 1 or node.keywords:
+            raise ExpressionError(f"{node.func.id}()에는 인자를 하나만 넣어 주세요.")
+        _check_node(node.args[0])
+    elif isinstance(node, ast.Name):
+        if node.id != VARIABLE and node.id not in CONSTANTS:
+            raise ExpressionError(f"알 수 없는 이름: {node.id} (변수는 x, 상수는 pi, e)")
+    elif isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ExpressionError("숫자만 쓸 수 있습니다.")
+        if abs(value) > MAX_CONSTANT:
+            raise ExpressionError(f"숫자는 절댓값 {MAX_CONSTANT:g} 이하만 쓸 수 있습니다.")
+    else:
+        raise ExpressionError(f"쓸 수 없는 문법입니다: {type(node).__name__}")
+
+
+def parse_expression(text):
+    """식 텍스트를 검사한 AST(식 본문)로 바꿉니다. ``^``는 거듭제곱으로 읽습니다."""
+    text = text.strip()
+    if not text:
+        raise ExpressionError("식을 입력해 주세요.")
+    if len(text) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"식은 {MAX_EXPRESSION_LENGTH}자 이하로 입력해 주세요.")
+    try:
+        tree = ast.parse(text.replace("^", "**"), mode="eval")
+    except SyntaxError:
+        raise ExpressionError("식의 형식이 올바르지 않습니다. 곱셈은 2*x처럼 *를 써 주세요.") from None
+    if sum(1 for _ in ast.walk(tree)) > MAX_NODES:
+        raise ExpressionError("식이 너무 깁니다.")
+    _check_node(tree.body)
+    return tree.body
+
+
+def normalize_expression(text):
+    """공백, 중복 괄호, ``^`` 표기와 상관없이 같은 식이면 같은 텍스트를 반환합니다."""
+    return ast.unparse(parse_expression(text))
+
+
+def _float_constants(node):
+    # 정수 상수를 실수로 바꿔 9**9**9 같은 식이 큰 정수 계산으로 멈추지 않게 함 (실수는 곧바로 넘침 오류)
+    for child in ast.walk(node):
+        if isinstance(child, ast.Constant):
+            child.value = float(child.value)
+    return node
+
+
+def _real_power(base, exponent):
+    # 파이썬 실수의 **는 음수의 분수 거듭제곱을 복소수로 만들므로, NumPy 실수 거듭제곱(결과 NaN)으로 계산
+    return np.asarray(base, dtype=float) ** exponent
+
+
+class _RealPower(ast.NodeTransformer):
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.Pow):
+            return node
+        return ast.Call(func=ast.Name(_POWER, ast.Load()), args=[node.left, node.right], keywords=[])
+
+
+_POWER = "_power"  # 사용자가 쓸 수 있는 이름(x, pi, e, 함수)과 겹치지 않음
+
+
+def _compile_lambda(node):
+    """검사를 통과한 식 노드를 ``lambda x: 식`` 함수로 컴파일합니다."""
+    tree = ast.Expression(ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(VARIABLE)], kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=_RealPower().visit(copy.deepcopy(node)),
+    ))
+    code = compile(ast.fix_missing_locations(tree), "<식>", "eval")
+    namespace = {"__builtins__": {}, _POWER: _real_power, **FUNCTIONS, **CONSTANTS}
+    return eval(code, namespace)  # noqa: S307 - 허용 목록을 통과한 트리만 옴
+
+
+def _pole_terms(node):
+    """극을 만들 수 있는 항: ('tan', 탄젠트 인자 함수)와 ('div', 분모 함수) 목록.
+
+    음수 지수의 거듭제곱(``x**-2``)은 밑을 분모로 봅니다.
+    """
+    terms = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Call) and child.func.id == "tan":
+            terms.append(("tan", _compile_lambda(child.args[0])))
+        elif isinstance(child, ast.BinOp) and isinstance(child.op, ast.Div):
+            terms.append(("div", _compile_lambda(child.right)))
+        elif isinstance(child, ast.BinOp) and isinstance(child.op, ast.Pow) and _is_negative_constant(child.right):
+            terms.append(("div", _compile_lambda(child.left)))
+    return terms
+
+
+def _is_negative_constant(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return isinstance(node.operand, ast.Constant) and node.operand.value > 0
+    return isinstance(node, ast.Constant) and node.value < 0
+
+
+def _check_constant_powers(node):
+    """x가 없는 거듭제곱이 유한한 실수인지 확인합니다. 허수가 되거나 넘치면 ExpressionError."""
+    for child in ast.walk(node):
+        if not isinstance(child, ast.BinOp) or not isinstance(child.op, ast.Pow):
+            continue
+        if any(isinstance(n, ast.Name) and n.id == VARIABLE for n in ast.walk(child)):
+            continue
+        with np.errstate(all="ignore"):
+            try:
+                value = _compile_lambda(child)(None)
+            except ArithmeticError:
+                value = np.nan
+        if not np.isfinite(value):
+            raise ExpressionError(f"실수로 계산할 수 없는 거듭제곱입니다: {ast.unparse(child)}")
+
+
+class CompiledExpression:
+    """컴파일된 식 하나. ``evaluate``로 y를, ``curve``로 극에서 끊긴 (x, y)를 계산합니다."""
+
+    __slots__ = ("text", "_function", "_pole_terms")
+
+    def __init__(self, text, function, pole_terms):
+        self.text = text
+        self._function = function
+        self._pole_terms = pole_terms
+
+    def __repr__(self):
+        return f"CompiledExpression({self.text!r})"
+
+    def _call(self, function, x):
+        with np.errstate(all="ignore"):
+            try:
+                value = function(x)
+            except ArithmeticError:
+                # 상수끼리의 나눗셈(1/0 등)은 파이썬 실수 연산이라 예외가 남
+                raise ExpressionError(f"계산할 수 없는 식입니다: {self.text}") from None
+        return np.broadcast_to(np.asarray(value, dtype=float), x.shape)
+
+    def evaluate(self, x):
+        """x 배열에서 식의 값을 계산합니다. 정의되지 않거나 넘친 값은 NaN입니다."""
+        x = np.asarray(x, dtype=float)
+        y = np.array(self._call(self._function, x))
+        y[~np.isfinite(y)] = np.nan
+        return y
+
+    def pole_breaks(self, x):
+        """이웃한 점 x[i], x[i+1] 사이에 극이 있으면 True인 길이 len(x)-1 배열."""
+        breaks = np.zeros(max(len(x) - 1, 0), dtype=bool)
+        for kind, function in self._pole_terms:
+            u = self._call(function, x)
+            if kind == "tan":
+                branch = np.floor((u - np.pi / 2) / np.pi)
+                breaks |= branch[1:] != branch[:-1]
+            else:
+                breaks |= np.sign(u[1:]) * np.sign(u[:-1]) < 0
+        return breaks
+
+    def curve(self, x_min, x_max, points):
+        """[x_min, x_max]의 균등 격자에서 계산하고, 극 사이에 NaN 점을 끼운 (x, y)를 반환합니다."""
+        x = np.linspace(x_min, x_max, points)
+        y = self.evaluate(x)
+        gaps = np.flatnonzero(self.pole_breaks(x)) + 1
+        if len(gaps):
+            x = np.insert(x, gaps, (x[gaps - 1] + x[gaps]) / 2)
+            y = np.insert(y, gaps, np.nan)
+        return x, y
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_normalized(text):
+    node = _float_constants(ast.parse(text, mode="eval").body)
+    _check_constant_powers(node)
+    compiled = CompiledExpression(text, _compile_lambda(node), _pole_terms(node))
+    # 1/0처럼 상수 부분에서 나는 계산 오류는 x와 상관없으므로 점 두 개로 미리 확인
+    probe = np.zeros(2)
+    compiled.evaluate(probe)
+    compiled.pole_breaks(probe)
+    return compiled
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(text):
+    """식 텍스트를 검사하고 컴파일합니다. 잘못된 식이면 ExpressionError.
+
+    입력 그대로의 텍스트로 한 번, 정규화한 텍스트로 한 번 캐시하므로 같은 입력이 다시 오면 파싱도 하지 않고,
+    표기만 다른 식은 파싱과 검사만 하고 컴파일 결과를 함께 씁니다.
+    """
+    return _compile_normalized(normalize_expression(text))
+
+
+def expression_cache_info():
+    """(입력 텍스트 캐시, 정규화 텍스트 캐시)의 ``cache_info``."""
+    return compile_expression.cache_info(), _compile_normalized.cache_info()
@@ -0,0 +1,256 @@
+"""그래프 페이지용 재사용 Figure 풀.
+
+pyplot 전역 상태를 쓰지 않고 객체지향 ``Figure`` API로 그림을 만듭니다.
+격자, 축선, 테두리, π/4 눈금 같은 고정 장식은 Figure를 만들 때 한 번만 적용하고,
+매 실행에서는 곡선 데이터만 ``set_data``로 바꾼 뒤 다시 그립니다. ``set_data``는 받은 배열을
+복사하고 그릴 때 경로를 새로 만들므로, 곡선 y 값을 위한 버퍼를 따로 들고 있지 않습니다.
+
+Streamlit은 재실행마다 새 스크립트 스레드를 띄우므로 Figure는 스레드가 아니라 프로세스
+전체의 풀에 두고, 렌더링하는 동안만 빌려 씁니다. 동시에 그리는 세션 수만큼만 만들어집니다.
+
+matplotlib은 처음 Figure를 만들 때 불러옵니다. 범위 상수와 포맷터만 쓰는 쪽(브라우저 렌더링,
+퀴즈 페이지)은 matplotlib import 비용을 내지 않습니다.
+"""
+import contextlib
+import io
+import threading
+import time
+
+import numpy as np
+
+from trigkit import instrumentation
+from trigkit.curves import apply_amplitude_shift, asymptote_segments, tan_asymptotes
+from trigkit.expression import compile_expression
+from trigkit.sampling import base_curve
+from trigkit.viewport import DEFAULT_VIEWPORT, viewport_curve
+
+# 기본 그래프 표시 범위 (다른 보기 범위는 trigkit.viewport 참고)
+X_MIN = -2 * np.pi
+X_MAX = 2 * np.pi
+Y_MIN = -8
+Y_MAX = 8
+
+# 함수별 선 색상 ("expr"는 직접 입력한 식)
+CURVE_COLORS = {"sin": "red", "cos": "blue", "tan": "green", "expr": "purple"}
+
+# 그래프 페이지 렌더링 설정 (캐시 키에도 포함됨)
+FIGURE_SIZE = (10, 6)
+FIGURE_DPI = 200  # st.pyplot의 기본 dpi와 동일
+
+# 보기 범위를 옮기거나 확대했을 때 곡선을 계산할 픽셀 열 수 (축 영역의 대략적인 픽셀 폭)
+VIEW_COLUMNS = 1600
+# 점근선이 이보다 많으면 화면을 덮기만 하므로 그리지 않음
+MAX_ASYMPTOTES = VIEW_COLUMNS // 8
+
+# π 눈금 라벨에서 찾아볼 가장 큰 분모 (가장 많이 확대했을 때의 눈금 간격 π/4 · 2^−12)
+MAX_TICK_DENOMINATOR = 4 * 2 ** 12
+
+
+# 눈금 라벨 포맷터 정의
+def format_pi_tick(value, tick_pos):
+    if value == 0:
+        return "0"
+
+    num = value / np.pi
+
+    # π/4, π/8, π/16 ... 중 값을 정확히 나타내는 가장 작은 분모를 찾음 (확대했을 때의 눈금)
+    denominator = 4
+    while abs(num * denominator - round(num * denominator)) >= 1e-9 * denominator \
+            and denominator < MAX_TICK_DENOMINATOR:
+        denominator *= 2
+    numerator = int(round(num * denominator))
+
+    gcd_val = np.gcd(numerator, denominator)
+    numerator //= gcd_val
+    denominator //= gcd_val
+
+    if denominator == 1:
+        if numerator == 1:
+            return r"$\pi$"
+        elif numerator == -1:
+            return r"$-\pi$"
+        return r"${}\pi$".format(numerator) # 정수 파이 (예: 2pi)
+    elif numerator == 1: # 분수 파이 (예: pi/2, 3pi/4)
+        return r"$\frac{{\pi}}{{{}}}$".format(denominator)
+    else:
+        return r"$\frac{{{}}}{{{}}}\pi$".format(numerator, denominator)
+
+
+def format_curve_label(func, amplitude, frequency, x_shift, y_shift):
+    """범례에 들어갈 수식 라벨을 만듭니다."""
+    return f"$y = {amplitude:.2f} \\{func}({frequency:.2f}x + {x_shift:.2f}) + {y_shift:.2f}$"
+
+
+class GraphFigure:
+    """고정 장식이 미리 적용된 Figure/Axes와 재사용 가능한 곡선 객체를 묶은 클래스입니다."""
+
+    def __init__(self, figsize=(10, 6), dpi=200):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection
+        from matplotlib.figure import Figure
+
+        self.figsize = tuple(figsize)
+        self.dpi = dpi
+        self.figure = Figure(figsize=self.figsize)
+        FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot()
+        self._tick_seconds = 0.0
+        self._apply_static_decorations()
+
+        # 곡선과 점근선은 한 번만 만들고 이후에는 데이터만 교체
+        self.curves = {}
+        for func, color in CURVE_COLORS.items():
+            (line,) = self.ax.plot([], [], color=color, visible=False)
+            self.curves[func] = line
+        # 탄젠트 점근선은 개수와 상관없이 하나의 LineCollection으로 그림
+        self.asymptotes = LineCollection(
+            [], colors=CURVE_COLORS["tan"], linestyles='--', linewidths=1, alpha=0.7, visible=False
+        )
+        self.ax.add_collection(self.asymptotes, autolim=False)
+        self._viewport = DEFAULT_VIEWPORT
+
+    def _apply_static_decorations(self):
+        import matplotlib.ticker as ticker
+
+        ax = self.ax
+        ax.set_xlabel("X축")
+        ax.set_ylabel("Y축")
+        ax.set_title("삼각함수 그래프")
+        ax.grid(True)
+        ax.axhline(0, color='black', linewidth=1.5) # x축 (y=0에 표현)
+        ax.axvline(0, color='black', linewidth=0.8) # y축
+        ax.spines['top'].set_visible(False)    # 위쪽 테두리 제거
+        ax.spines['right'].set_visible(False)  # 오른쪽 테두리 제거
+        ax.set_ylim(Y_MIN, Y_MAX) # Y축 범위 -8~8로 변경
+        ax.set_xlim(X_MIN, X_MAX) # X축 범위 설정
+
+        # X축 눈금을 파이/4의 배수로 설정 (확대 단계에 따라 간격만 바뀜)
+        self._x_locator = ticker.MultipleLocator(np.pi / 4)
+        ax.xaxis.set_major_locator(self._x_locator)
+        ax.xaxis.set_major_formatter(ticker.FuncFormatter(
+            self._timed_format_tick if instrumentation.is_enabled() else format_pi_tick
+        ))
+
+        # X축 눈금 라벨 위치 조정
+        ax.tick_params(axis='x', which='both', bottom=False, labelbottom=True)
+
+        # 라벨의 y 위치를 데이터 좌표계 기준으로 조정 (y=0 바로 아래로)
+        label_y_offset_from_zero = -0.5 # 이 값을 조절하여 위치를 미세 조정하세요.
+
+        for label in ax.get_xticklabels():
+            x_val = label.get_position()[0]
+            label.set_position((x_val, 0 + label_y_offset_from_zero)) # y=0에서 오프셋 적용
+            label.set_verticalalignment('top') # 텍스트의 상단이 지정된 y 위치에 닿도록
+
+    def _timed_format_tick(self, value, tick_pos):
+        """계측용 눈금 포맷터: 호출마다 걸린 시간을 모아 두었다가 렌더링 후 한 번에 기록합니다."""
+        start = time.perf_counter()
+        label = format_pi_tick(value, tick_pos)
+        self._tick_seconds += time.perf_counter() - start
+        return label
+
+    def _set_viewport(self, viewport):
+        if viewport == self._viewport:
+            return
+        self.ax.set_xlim(viewport.x_min, viewport.x_max)
+        self.ax.set_ylim(viewport.y_min, viewport.y_max)
+        self._x_locator.set_params(base=np.pi / 4 * 2.0 ** viewport.x_level)
+        self._viewport = viewport
+
+    def update(self, show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift,
+               viewport=DEFAULT_VIEWPORT, expression=""):
+        """곡선 데이터와 라벨만 갱신합니다. expression은 직접 입력한 식 (없으면 빈 문자열)."""
+        shown = {"sin": show_sin, "cos": show_cos, "tan": show_tan}
+        curves = {}
+        for func, flag in shown.items():
+            if not flag:
+                continue
+            # (함수, B, C)별 캐시된 기본 곡선에 A, D만 적용 (탄젠트는 극에서 끊겨 있음)
+            if viewport == DEFAULT_VIEWPORT:
+                x, base_y = base_curve(func, frequency, x_shift, X_MIN, X_MAX)
+            else:
+                x, base_y = viewport_curve(func, frequency, x_shift, viewport, VIEW_COLUMNS)
+            y = apply_amplitude_shift(base_y, amplitude, y_shift)
+            curves[func] = (x, y, format_curve_label(func, amplitude, frequency, x_shift, y_shift))
+        if expression:
+            # 직접 입력한 식은 컴파일 캐시에서 꺼낸 함수로 픽셀 열 격자 전체를 한 번에 계산
+            compiled = compile_expression(expression)
+            x, y = compiled.curve(viewport.x_min, viewport.x_max, VIEW_COLUMNS)
+            curves["expr"] = (x, y, f"y = {compiled.text}")
+
+        poles = tan_asymptotes(frequency, x_shift, viewport.x_min, viewport.x_max) if show_tan else ()
+        self.set_curves(curves, poles, viewport)
+
+    def set_curves(self, curves, poles=(), viewport=DEFAULT_VIEWPORT):
+        """계산해 둔 곡선을 그대로 올립니다. curves: {함수: (x, y, 범례 라벨)}, 빠진 함수는 숨깁니다."""
+        self._set_viewport(viewport)
+        for func, line in self.curves.items():
+            data = curves.get(func)
+            line.set_visible(data is not None)
+            if data is not None:
+                line.set_data(data[0], data[1])
+                line.set_label(data[2])
+
+        self.asymptotes.set_visible(0 < len(poles) <= MAX_ASYMPTOTES)
+        if self.asymptotes.get_visible():
+            self.asymptotes.set_segments(asymptote_segments(poles, viewport.y_min, viewport.y_max))
+
+        # 선택된 함수가 하나라도 있을 경우에만 범례 표시
+        visible_lines = [line for line in self.curves.values() if line.get_visible()]
+        if visible_lines:
+            self.ax.legend(handles=visible_lines, loc='upper right', frameon=True, fontsize='medium')
+        elif self.ax.get_legend() is not None:
+            self.ax.get_legend().remove()
+
+    def render_png(self, *params):
+        """곡선을 갱신하고 PNG 바이트로 인코딩합니다."""
+        with instrumentation.phase("graph.figure_update"):
+            self.update(*params)
+        buffer = io.BytesIO()
+        self._tick_seconds = 0.0
+        with instrumentation.phase("graph.png_encode"):  # 눈금 포맷 시간도 이 안에 포함됨
+            self.figure.savefig(buffer, format="png", dpi=self.dpi, bbox_inches="tight")
+        instrumentation.record("graph.tick_format", self._tick_seconds)
+        return buffer.getvalue()
+
+
+_idle_figures = {}
+_idle_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def checkout_figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI):
+    """쉬고 있는 GraphFigure를 빌려 주고, 다 쓰면 풀에 돌려놓습니다 (없으면 새로 만듦)."""
+    key = (tuple(figsize), dpi)
+    with _idle_lock:
+        idle = _idle_figures.setdefault(key, [])
+        graph = idle.pop() if idle else None
+    if graph is None:
+        with instrumentation.phase("graph.figure_build"):
+            graph = GraphFigure(figsize, dpi)
+    try:
+        yield graph
+    finally:
+        with _idle_lock:
+            _idle_figures[key].append(graph)
+
+
+def make_render_key(show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift,
+                    viewport=DEFAULT_VIEWPORT, figsize=FIGURE_SIZE, dpi=FIGURE_DPI, expression=""):
+    """렌더링 캐시 키를 만듭니다. 슬라이더 실수 값의 미세한 오차는 반올림으로 흡수합니다.
+
+    expression은 정규화한 식 텍스트(``CompiledExpression.text``)를 넘겨야 같은 식이 같은 키가 됩니다.
+    """
+    return (
+        bool(show_sin), bool(show_cos), bool(show_tan),
+        round(amplitude, 6), round(frequency, 6), round(x_shift, 6), round(y_shift, 6),
+        tuple(viewport), tuple(figsize), dpi, expression,
+    )
+
+
+def render_graph_png(show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift,
+                     viewport=DEFAULT_VIEWPORT, figsize=FIGURE_SIZE, dpi=FIGURE_DPI, expression=""):
+    """풀에서 빌린 재사용 Figure에 그래프를 그려 PNG 바이트로 반환합니다."""
+    with checkout_figure(figsize, dpi) as graph:
+        return graph.render_png(show_sin, show_cos, show_tan, amplitude, frequency, x_shift, y_shift, viewport,
+                                expression)
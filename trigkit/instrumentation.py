@@ -0,0 +1,182 @@
+"""재실행 구간별 시간 계측 (기본은 꺼져 있음).
+
+``TRIG_INSTRUMENT=1``일 때만 켜집니다. 꺼져 있으면 ``phase``는 아무것도 하지 않는 컨텍스트를
+돌려주고 나머지 함수도 바로 반환하므로, 계측 코드를 그대로 두어도 비용이 거의 없습니다.
+
+- ``phase(name)``: 구간 하나의 시간을 재서 기록합니다.
+- ``begin_rerun(page)`` / ``end_rerun()``: 스크립트 한 번의 재실행 전체 시간을 잽니다.
+  함수로 감쌀 수 없는 최상위 스크립트용입니다.
+- ``rerun_scope(page)``: 같은 일을 하는 컨텍스트/데코레이터입니다. fragment만 다시 실행될 때도
+  재실행으로 잡히도록 fragment 본문에 붙입니다. 이미 재실행 안이면 아무것도 하지 않습니다.
+
+기록은 프로세스 전체가 공유하는 링 버퍼에 쌓이고(관리자 패널이 읽음), 재실행이 끝날 때마다
+JSONL 파일에 한꺼번에 덧붙입니다. ``TRIG_PROFILE_EVERY=N``이면 N번째 재실행마다 cProfile
+결과를 ``.prof`` 파일로 남깁니다.
+"""
+import contextlib
+import cProfile
+import json
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENABLED = os.environ.get("TRIG_INSTRUMENT", "") not in ("", "0")
+BUFFER_SIZE = int(os.environ.get("TRIG_INSTRUMENT_BUFFER", "10000"))
+LOG_PATH = os.environ.get("TRIG_INSTRUMENT_LOG", os.path.join(ROOT, "logs", "instrumentation.jsonl"))
+PROFILE_EVERY = int(os.environ.get("TRIG_PROFILE_EVERY", "0"))
+PROFILE_DIR = os.environ.get("TRIG_PROFILE_DIR", os.path.join(ROOT, "logs", "profiles"))
+
+RERUN_PHASE = "rerun"
+
+
+class Recorder:
+    """계측 기록을 링 버퍼에 쌓고, 재실행이 끝날 때 JSONL 파일로 내보냅니다."""
+
+    def __init__(self, capacity=BUFFER_SIZE, log_path=LOG_PATH, profile_every=PROFILE_EVERY,
+                 profile_dir=PROFILE_DIR):
+        self.log_path = log_path
+        self.profile_every = profile_every
+        self.profile_dir = profile_dir
+        self._samples = deque(maxlen=capacity)
+        self._pending = []
+        self._reruns = 0
+        self._lock = threading.Lock()
+
+    def record(self, phase, seconds, page=None):
+        sample = {"ts": round(time.time(), 3), "page": page, "phase": phase, "ms": round(seconds * 1000, 3)}
+        with self._lock:
+            self._samples.append(sample)
+            self._pending.append(sample)
+
+    def next_rerun_number(self):
+        with self._lock:
+            self._reruns += 1
+            return self._reruns
+
+    def flush(self):
+        """아직 파일에 쓰지 않은 기록을 JSONL로 덧붙입니다."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending or not self.log_path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.log_path)), exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(s, ensure_ascii=False) + "\n" for s in pending)
+
+    def samples(self):
+        with self._lock:
+            return list(self._samples)
+
+    @property
+    def rerun_count(self):
+        return self._reruns
+
+
+_recorder = Recorder() if ENABLED else None
+_local = threading.local()
+
+
+def is_enabled():
+    return _recorder is not None
+
+
+def get_recorder():
+    """계측이 켜져 있으면 프로세스 공용 Recorder를, 아니면 None을 반환합니다."""
+    return _recorder
+
+
+def _current_page():
+    rerun = getattr(_local, "rerun", None)
+    return rerun["page"] if rerun is not None else None
+
+
+def record(phase_name, seconds):
+    """직접 잰 시간을 구간 기록으로 남깁니다 (여러 번 나눠 잰 시간을 합쳐 남길 때 사용)."""
+    if _recorder is not None:
+        _recorder.record(phase_name, seconds, _current_page())
+
+
+@contextlib.contextmanager
+def _timed_phase(phase_name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _recorder.record(phase_name, time.perf_counter() - start, _current_page())
+
+
+def phase(phase_name):
+    """구간 시간을 재는 컨텍스트를 반환합니다. 계측이 꺼져 있으면 빈 컨텍스트입니다."""
+    if _recorder is None:
+        return contextlib.nullcontext()
+    return _timed_phase(phase_name)
+
+
+def _start_profiler(number):
+    if not _recorder.profile_every or number % _recorder.profile_every:
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # 다른 프로파일러가 이미 켜져 있음 (Python 3.12+는 동시에 하나만 가능)
+        return None
+    return profiler
+
+
+def begin_rerun(page):
+    """현재 스레드에서 재실행 하나의 계측을 시작합니다."""
+    if _recorder is None:
+        return
+    stale = getattr(_local, "rerun", None)
+    if stale is not None and stale["profiler"] is not None:
+        # st.stop() 등으로 끝나지 못한 이전 재실행은 기록하지 않고 정리만 함
+        stale["profiler"].disable()
+    number = _recorder.next_rerun_number()
+    _local.rerun = {
+        "page": page,
+        "number": number,
+        "start": time.perf_counter(),
+        "profiler": _start_profiler(number),
+    }
+
+
+def end_rerun():
+    """재실행 전체 시간을 기록하고, 필요하면 프로파일을 저장한 뒤 JSONL로 내보냅니다."""
+    if _recorder is None:
+        return
+    rerun = getattr(_local, "rerun", None)
+    if rerun is None:
+        return
+    _local.rerun = None
+    _recorder.record(RERUN_PHASE, time.perf_counter() - rerun["start"], rerun["page"])
+    profiler = rerun["profiler"]
+    if profiler is not None:
+        profiler.disable()
+        os.makedirs(_recorder.profile_dir, exist_ok=True)
+        profiler.dump_stats(os.path.join(_recorder.profile_dir, f"{rerun['page']}-{rerun['number']:06d}.prof"))
+    _recorder.flush()
+
+
+@contextlib.contextmanager
+def rerun_scope(page):
+    """감싼 코드를 재실행 하나로 계측합니다. 이미 재실행 계측 중이면 그 안에 포함됩니다."""
+    if _recorder is None or getattr(_local, "rerun", None) is not None:
+        yield
+        return
+    begin_rerun(page)
+    try:
+        yield
+    finally:
+        end_rerun()
+
+
+def latencies_by_phase(samples):
+    """기록 목록을 (페이지, 구간)별 밀리초 배열로 묶습니다."""
+    grouped = {}
+    for s in samples:
+        grouped.setdefault((s["page"] or "-", s["phase"]), []).append(s["ms"])
+    return {key: np.array(values) for key, values in sorted(grouped.items())}
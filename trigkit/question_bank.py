@@ -0,0 +1,165 @@
+"""퀴즈 문제 은행 로더.
+
+문제는 JSONL(한 줄에 문제 하나) 또는 SQLite 파일에 저장합니다. 프로세스마다 한 번만
+읽고 검증한 뒤, 주제 태그와 난이도별 인덱스(정수 배열)를 만들어 둡니다.
+퀴즈는 문제 자체가 아니라 인덱스만 무작위로 뽑습니다.
+
+JSONL 한 줄의 형식::
+
+    {"id": "q001", "question": "...", "answer": "...", "options": ["...", ...],
+     "tags": ["특수각"], "difficulty": 1}
+
+SQLite는 ``questions(id, question, answer, options, tags, difficulty)`` 테이블을 쓰며
+``options``와 ``tags``는 JSON 배열 문자열입니다.
+"""
+import json
+import os
+import sqlite3
+
+import numpy as np
+
+REQUIRED_FIELDS = ("question", "answer", "options")
+DEFAULT_DIFFICULTY = 1
+
+
+class QuestionBankError(ValueError):
+    """문제 은행 파일의 형식이 잘못되었을 때 발생합니다."""
+
+
+def validate_question(raw, where):
+    """문제 dict 하나를 검증하고 정규화한 사본을 반환합니다."""
+    if not isinstance(raw, dict):
+        raise QuestionBankError(f"{where}: 문제는 객체(dict)여야 합니다.")
+    for field in REQUIRED_FIELDS:
+        if field not in raw:
+            raise QuestionBankError(f"{where}: '{field}' 항목이 없습니다.")
+    options = raw["options"]
+    if not isinstance(options, list) or len(options) < 2 or not all(isinstance(o, str) for o in options):
+        raise QuestionBankError(f"{where}: 'options'는 문자열 보기가 2개 이상인 목록이어야 합니다.")
+    if len(set(options)) != len(options):
+        raise QuestionBankError(f"{where}: 보기에 중복이 있습니다.")
+    if raw["answer"] not in options:
+        raise QuestionBankError(f"{where}: 정답이 보기 안에 없습니다.")
+    tags = raw.get("tags", [])
+    if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+        raise QuestionBankError(f"{where}: 'tags'는 문자열 목록이어야 합니다.")
+    difficulty = raw.get("difficulty", DEFAULT_DIFFICULTY)
+    if not isinstance(difficulty, int) or isinstance(difficulty, bool):
+        raise QuestionBankError(f"{where}: 'difficulty'는 정수여야 합니다.")
+    return {
+        "id": str(where if raw.get("id") is None else raw["id"]),
+        "question": raw["question"],
+        "answer": raw["answer"],
+        "options": options,
+        "tags": tags,
+        "difficulty": difficulty,
+    }
+
+
+def check_unique_id(question, where, seen):
+    """seen(id → 위치)에 같은 id가 이미 있으면 QuestionBankError를 냅니다.
+
+    풀이 기록과 복습 일정이 문제 id로 저장되므로, id가 겹치면 서로 다른 문제의 기록이 섞입니다.
+    """
+    first = seen.setdefault(question["id"], where)
+    if first != where:
+        raise QuestionBankError(f"{where}: id '{question['id']}'가 {first}에서 이미 쓰였습니다.")
+
+
+class QuestionBank:
+    """검증된 문제 목록과 태그/난이도 인덱스를 가진 읽기 전용 문제 은행입니다.
+
+    여러 세션이 공유하므로 만든 뒤에는 내용을 바꾸지 않습니다.
+    """
+
+    def __init__(self, questions):
+        self._questions = tuple(questions)
+        self.ids = tuple(q["id"] for q in self._questions)
+        by_tag, by_difficulty = {}, {}
+        for idx, q in enumerate(self._questions):
+            for tag in q["tags"]:
+                by_tag.setdefault(tag, []).append(idx)
+            by_difficulty.setdefault(q["difficulty"], []).append(idx)
+        self._by_tag = {tag: np.array(ids, dtype=np.int64) for tag, ids in by_tag.items()}
+        self._by_difficulty = {d: np.array(ids, dtype=np.int64) for d, ids in by_difficulty.items()}
+        self._all = np.arange(len(self._questions), dtype=np.int64)
+
+    def __len__(self):
+        return len(self._questions)
+
+    def __getitem__(self, idx):
+        return self._questions[idx]
+
+    @property
+    def tags(self):
+        return sorted(self._by_tag)
+
+    @property
+    def difficulties(self):
+        return sorted(self._by_difficulty)
+
+    def candidate_indices(self, tag=None, difficulty=None):
+        """조건에 맞는 문제 인덱스 배열을 반환합니다 (None은 조건 없음)."""
+        indices = self._all
+        if tag is not None:
+            indices = self._by_tag.get(tag, self._all[:0])
+        if difficulty is not None:
+            indices = np.intersect1d(indices, self._by_difficulty.get(difficulty, self._all[:0]), assume_unique=True)
+        return indices
+
+    def sample_indices(self, k, tag=None, difficulty=None, rng=None):
+        """조건에 맞는 문제 중 최대 k개의 인덱스를 중복 없이 무작위로 뽑습니다."""
+        candidates = self.candidate_indices(tag, difficulty)
+        rng = rng if rng is not None else np.random.default_rng()
+        k = min(k, len(candidates))
+        return rng.choice(candidates, size=k, replace=False)
+
+
+def load_jsonl(path):
+    questions = []
+    seen = {}
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            where = f"{os.path.basename(path)}:{line_no}"
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise QuestionBankError(f"{where}: JSON 형식 오류 ({exc.msg})") from exc
+            question = validate_question(raw, where)
+            check_unique_id(question, where, seen)
+            questions.append(question)
+    return QuestionBank(questions)
+
+
+def load_sqlite(path):
+    questions = []
+    seen = {}
+    with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+        rows = conn.execute("SELECT id, question, answer, options, tags, difficulty FROM questions ORDER BY rowid")
+        for qid, question, answer, options, tags, difficulty in rows:
+            where = f"{os.path.basename(path)}:{len(questions) + 1}:{qid}"
+            try:
+                raw = {
+                    "id": qid,
+                    "question": question,
+                    "answer": answer,
+                    "options": json.loads(options),
+                    "tags": json.loads(tags) if tags else [],
+                    "difficulty": DEFAULT_DIFFICULTY if difficulty is None else difficulty,
+                }
+            except json.JSONDecodeError as exc:
+                raise QuestionBankError(f"{where}: JSON 형식 오류 ({exc.msg})") from exc
+            question = validate_question(raw, where)
+            check_unique_id(question, where, seen)
+            questions.append(question)
+    return QuestionBank(questions)
+
+
+def load_question_bank(path):
+    """확장자에 따라 JSONL 또는 SQLite 문제 은행을 불러옵니다."""
+    if path.endswith((".sqlite", ".sqlite3", ".db")):
+        return load_sqlite(path)
+    return load_jsonl(path)
@@ -0,0 +1,303 @@
+"""삼각함수 퀴즈 문제 자동 생성기.
+
+정확한 값 표(``trigkit.exact_values``)를 바탕으로 세 종류의 문제를 만듭니다.
+
+- 특수각의 sin/cos/tan 값
+- y = A·f(Bx) + D 의 주기, 최댓값, 최솟값
+- 직각삼각형(피타고라스 수)의 삼각비
+
+오답 보기는 정답과 값이 가장 가까운 정확한 값들 중에서 고르며, 한 묶음 전체를 NumPy로
+한꺼번에 계산합니다. 같은 시드는 항상 같은 문제 묶음을 만들므로, 세션에는 시드만 저장해도
+다른 프로세스에서 같은 묶음을 다시 만들 수 있습니다. 결과는 문제 은행과 같은
+``question``/``answer``/``options`` dict 형식입니다.
+
+생성 문제의 id(``gen-시드-번호``)는 묶음마다 새로 생기므로 풀이 통계에 쓰지 않습니다. 대신
+문제마다 유형(템플릿과 함수, 각의 단위 등)을 나타내는 ``skill`` 키를 붙여 두고, 답안 기록은
+``stats_key``로 이 키에 모아 집계합니다. 키의 종류는 몇십 개로 고정되어 있어 문제별 통계가
+묶음 수에 따라 늘어나지 않습니다.
+"""
+import threading
+from collections import OrderedDict
+from fractions import Fraction
+
+import numpy as np
+
+from trigkit.exact_values import EXACT_ANGLES, UNDEFINED
+from trigkit.question_bank import QuestionBank
+
+NUM_OPTIONS = 4
+FUNCS = ("sin", "cos", "tan")
+
+# 정의되지 않음(탄젠트 90°, 270°)을 값 비교에 쓰기 위한 대체 값 (가장 큰 값들과 가깝게)
+UNDEFINED_VALUE = 10.0
+
+PYTHAGOREAN_TRIPLES = np.array([
+    (3, 4, 5), (5, 12, 13), (8, 15, 17), (7, 24, 25), (20, 21, 29), (9, 40, 41), (12, 35, 37),
+])
+
+
+def _option(latex):
+    return latex if latex == UNDEFINED else f"${latex}$"
+
+
+def _pi_fraction_latex(fraction):
+    if fraction.numerator == 0:
+        return "0"
+    coeff = "" if fraction.numerator == 1 else str(fraction.numerator)
+    if fraction.denominator == 1:
+        return rf"{coeff}\pi"
+    return rf"\frac{{{coeff}\pi}}{{{fraction.denominator}}}"
+
+
+def _value_universe(funcs):
+    """funcs 값으로 나올 수 있는 서로 다른 정확한 값들의 (LaTeX 배열, 수치 배열)."""
+    values = {}
+    for angle in EXACT_ANGLES:
+        for func in funcs:
+            latex = getattr(angle, f"{func}_latex")
+            values[latex] = UNDEFINED_VALUE if latex == UNDEFINED else round(getattr(angle, func), 12)
+    latex = np.array(list(values), dtype=object)
+    return latex, np.array(list(values.values()))
+
+
+_SINCOS_UNIVERSE = _value_universe(("sin", "cos"))
+_TAN_UNIVERSE = _value_universe(("tan",))
+
+# 주기 보기 후보: π의 유리수 배
+_PERIOD_FRACTIONS = [Fraction(n, d) for n, d in
+                     ((1, 4), (1, 3), (1, 2), (2, 3), (1, 1), (4, 3), (3, 2), (2, 1), (3, 1), (4, 1), (6, 1), (8, 1))]
+_PERIOD_UNIVERSE = (
+    np.array([_pi_fraction_latex(f) for f in _PERIOD_FRACTIONS], dtype=object),
+    np.array([float(f) for f in _PERIOD_FRACTIONS]),
+)
+
+# 최댓값/최솟값 보기 후보: 정수
+_INTEGER_UNIVERSE = (np.array([str(i) for i in range(-10, 11)], dtype=object), np.arange(-10, 11, dtype=float))
+
+
+def nearest_distractors(answer_values, universe_values, k, rng):
+    """각 정답 값과 가장 가까운(같은 값은 제외) 후보 k개의 인덱스를 (n, k) 배열로 반환합니다.
+
+    universe_values는 모든 문제가 공유하는 (m,) 배열 또는 문제별 (n, m) 배열입니다.
+    거리가 같은 후보끼리는 작은 난수로 순서를 섞습니다.
+    """
+    answer_values = np.asarray(answer_values, dtype=float)
+    universe_values = np.broadcast_to(universe_values, (len(answer_values), np.shape(universe_values)[-1]))
+    distance = np.abs(universe_values - answer_values[:, None])
+    distance = np.where(np.isclose(distance, 0), np.inf, distance)
+    distance = distance + rng.uniform(0, 1e-6, size=distance.shape)
+    nearest = np.argpartition(distance, k, axis=1)[:, :k]
+    return nearest
+
+
+def _value_questions(n, rng):
+    funcs = rng.integers(0, 3, size=n)
+    angles = rng.integers(0, 24, size=n)  # 0° ~ 345°
+    use_radians = rng.random(n) < 0.5
+
+    questions = []
+    for func_id, universe in ((0, _SINCOS_UNIVERSE), (1, _SINCOS_UNIVERSE), (2, _TAN_UNIVERSE)):
+        rows = np.flatnonzero(funcs == func_id)
+        if len(rows) == 0:
+            continue
+        func = FUNCS[func_id]
+        answer_latex = np.array([getattr(EXACT_ANGLES[k], f"{func}_latex") for k in angles[rows]], dtype=object)
+        lookup = dict(zip(universe[0], universe[1]))
+        answer_values = np.array([lookup[latex] for latex in answer_latex])
+        distractors = universe[0][nearest_distractors(answer_values, universe[1], NUM_OPTIONS - 1, rng)]
+
+        for row, latex, wrong in zip(rows, answer_latex, distractors):
+            angle = EXACT_ANGLES[angles[row]]
+            arg = angle.rad_latex if use_radians[row] else rf"{angle.degrees}^\circ"
+            difficulty = 3 if angle.degrees % 30 and angle.degrees % 45 else (1 if angle.degrees <= 90 else 2)
+            questions.append({
+                "question": rf"$\{func}({arg})$의 값은 무엇인가요?",
+                "answer": _option(latex),
+                "options": [_option(latex)] + [_option(w) for w in wrong],
+                "tags": ["특수각"],
+                "difficulty": difficulty,
+                "skill": f"생성·특수각·{func}·{'호도법' if use_radians[row] else '육십분법'}",
+            })
+    return questions
+
+
+def _graph_questions(n, rng):
+    kinds = rng.integers(0, 3, size=n)  # 0: 주기, 1: 최댓값, 2: 최솟값
+    funcs = np.where(kinds == 0, rng.integers(0, 3, size=n), rng.integers(0, 2, size=n))
+    amplitudes = rng.integers(1, 4, size=n)
+    frequencies = rng.integers(1, 5, size=n)
+    shifts = rng.integers(-3, 4, size=n)
+
+    period_values = np.where(funcs == 2, 1.0, 2.0) / frequencies
+    extreme_values = np.where(kinds == 1, amplitudes + shifts, shifts - amplitudes).astype(float)
+
+    period_wrong = _PERIOD_UNIVERSE[0][nearest_distractors(period_values, _PERIOD_UNIVERSE[1], NUM_OPTIONS - 1, rng)]
+    extreme_wrong = _INTEGER_UNIVERSE[0][nearest_distractors(extreme_values, _INTEGER_UNIVERSE[1], NUM_OPTIONS - 1, rng)]
+
+    questions = []
+    for i in range(n):
+        func = FUNCS[funcs[i]]
+        a = "" if amplitudes[i] == 1 else str(amplitudes[i])
+        b = "" if frequencies[i] == 1 else str(frequencies[i])
+        d = "" if shifts[i] == 0 else f" {'+' if shifts[i] > 0 else '-'} {abs(shifts[i])}"
+        formula = rf"$y = {a}\{func}({b}x){d}$"
+        if kinds[i] == 0:
+            answer = _pi_fraction_latex(Fraction(2 if func != "tan" else 1, int(frequencies[i])))
+            wrong, text, tags = period_wrong[i], "의 주기는 얼마인가요?", ["그래프", "주기"]
+            label = "주기"
+        else:
+            answer = str(int(extreme_values[i]))
+            label = "최댓값" if kinds[i] == 1 else "최솟값"
+            wrong, text, tags = extreme_wrong[i], f" 그래프의 {label}은 무엇인가요?", ["그래프", "최댓값·최솟값"]
+        questions.append({
+            "question": formula + text,
+            "answer": _option(answer),
+            "options": [_option(answer)] + [_option(w) for w in wrong],
+            "tags": tags,
+            "difficulty": 1 if amplitudes[i] == 1 and frequencies[i] == 1 and shifts[i] == 0 else 2,
+            "skill": f"생성·그래프·{label}·{func}",
+        })
+    return questions
+
+
+def _triangle_questions(n, rng):
+    triples = PYTHAGOREAN_TRIPLES[rng.integers(0, len(PYTHAGOREAN_TRIPLES), size=n)]
+    swap = rng.random(n) < 0.5
+    opposite = np.where(swap, triples[:, 1], triples[:, 0])
+    adjacent = np.where(swap, triples[:, 0], triples[:, 1])
+    hypotenuse = triples[:, 2]
+    funcs = rng.integers(0, 3, size=n)
+
+    # 문제마다 같은 삼각형의 여섯 가지 변의 비가 보기 후보
+    numerators = np.stack([opposite, adjacent, opposite, adjacent, hypotenuse, hypotenuse], axis=1)
+    denominators = np.stack([hypotenuse, hypotenuse, adjacent, opposite, opposite, adjacent], axis=1)
+    ratios = numerators / denominators
+    answer_column = funcs  # sin = 대변/빗변, cos = 밑변/빗변, tan = 대변/밑변
+    answer_values = ratios[np.arange(n), answer_column]
+    wrong = nearest_distractors(answer_values, ratios, NUM_OPTIONS - 1, rng)
+
+    questions = []
+    for i in range(n):
+        def ratio(j):
+            return rf"{numerators[i, j]}/{denominators[i, j]}"
+        answer = ratio(answer_column[i])
+        questions.append({
+            "question": (
+                rf"직각삼각형에서 빗변이 {hypotenuse[i]}, 높이(대변)가 {opposite[i]}, 밑변이 {adjacent[i]}일 때, "
+                rf"$\{FUNCS[funcs[i]]}$ 값은 무엇인가요?"
+            ),
+            "answer": _option(answer),
+            "options": [_option(answer)] + [_option(ratio(j)) for j in wrong[i]],
+            "tags": ["직각삼각형"],
+            "difficulty": 2,
+            "skill": f"생성·직각삼각형·{FUNCS[funcs[i]]}",
+        })
+    return questions
+
+
+def generate_questions(n, seed):
+    """시드로 정해지는 문제 n개를 문제 은행 dict 형식의 목록으로 만듭니다."""
+    rng = np.random.default_rng(seed)
+    kinds = rng.integers(0, 3, size=n)
+    questions = (
+        _value_questions(int(np.sum(kinds == 0)), rng)
+        + _graph_questions(int(np.sum(kinds == 1)), rng)
+        + _triangle_questions(int(np.sum(kinds == 2)), rng)
+    )
+    for i, q in enumerate(questions):
+        q["id"] = f"gen-{seed}-{i}"
+    return questions
+
+
+def stats_key(question):
+    """답안 기록과 문제별 정답률에 쓸 키: 생성 문제는 유형(skill), 문제 은행 문제는 id."""
+    return question.get("skill", question["id"])
+
+
+class QuestionPool:
+    """미리 만들어 둔 생성 문제 묶음(QuestionBank)을 공유하고, 백그라운드에서 다시 채우는 풀.
+
+    하나의 묶음은 최대 ``uses_per_batch``번의 퀴즈에 쓰인 뒤 다음 묶음으로 바뀝니다.
+    다음 묶음은 항상 백그라운드 스레드가 미리 만들어 두므로 퀴즈 시작은 생성을 기다리지 않습니다.
+    프로세스가 막 시작해 첫 묶음이 아직 없을 때만 잠금을 풀고 채우기 스레드를 기다립니다.
+    최근 묶음은 시드로 다시 찾을 수 있고, 캐시에서 밀려난 묶음은 시드로 다시 만듭니다.
+    """
+
+    def __init__(self, batch_size=500, uses_per_batch=20, ready_batches=2, retained_batches=16, first_seed=0):
+        self.batch_size = batch_size
+        self.uses_per_batch = uses_per_batch
+        self.ready_batches = ready_batches
+        self.retained_batches = retained_batches
+        self._lock = threading.Lock()
+        self._batch_ready = threading.Condition(self._lock)
+        self._refill_needed = threading.Event()
+        self._next_seed = first_seed
+        self._ready = []  # [(seed, bank)] 아직 쓰지 않은 묶음
+        self._retained = OrderedDict()  # seed → bank (최근에 쓴 묶음)
+        self._current = None
+        self._current_uses = 0
+        self._refill_needed.set()
+        threading.Thread(target=self._refill_loop, name="question-pool-refill", daemon=True).start()
+
+    def _build(self, seed):
+        return QuestionBank(generate_questions(self.batch_size, seed))
+
+    def _refill_loop(self):
+        while True:
+            self._refill_needed.wait()
+            self._refill_needed.clear()
+            while True:
+                with self._lock:
+                    if len(self._ready) >= self.ready_batches:
+                        break
+                    seed = self._next_seed
+                    self._next_seed += 1
+                bank = self._build(seed)
+                with self._lock:
+                    self._ready.append((seed, bank))
+                    self._batch_ready.notify_all()
+
+    def _retain(self, seed, bank):
+        self._retained[seed] = bank
+        self._retained.move_to_end(seed)
+        while len(self._retained) > self.retained_batches:
+            self._retained.popitem(last=False)
+
+    def _current_batch_locked(self):
+        # 현재 묶음이 없거나 다 썼으면 준비된 묶음으로 교체
+        if self._current is None or self._current_uses >= self.uses_per_batch:
+            if not self._ready and self._current is None:
+                # 첫 묶음이 아직 없으면 백그라운드 스레드가 만들 때까지 기다림 (wait는 잠금을 풀어
+                # 두므로 다른 세션의 조회와 채우기 스레드를 막지 않음)
+                self._refill_needed.set()
+                self._batch_ready.wait_for(lambda: self._ready or self._current is not None)
+            if self._ready and (self._current is None or self._current_uses >= self.uses_per_batch):
+                self._current = self._ready.pop(0)
+                self._current_uses = 0
+            self._retain(*self._current)
+            self._refill_needed.set()
+        return self._current
+
+    def take(self):
+        """퀴즈 하나에 쓸 (시드, 문제 묶음)을 반환합니다."""
+        with self._lock:
+            current = self._current_batch_locked()
+            self._current_uses += 1
+            return current
+
+    def peek(self):
+        """다음 퀴즈에 쓰일 문제 묶음을 사용 횟수를 늘리지 않고 반환합니다 (주제/난이도 목록 구성용)."""
+        with self._lock:
+            return self._current_batch_locked()[1]
+
+    def get(self, seed):
+        """시드에 해당하는 문제 묶음을 반환합니다 (캐시에 없으면 같은 시드로 다시 만듦)."""
+        with self._lock:
+            bank = self._retained.get(seed)
+            if bank is not None:
+                self._retained.move_to_end(seed)
+                return bank
+        bank = self._build(seed)
+        with self._lock:
+            self._retain(seed, bank)
+        return bank
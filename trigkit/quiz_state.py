@@ -0,0 +1,54 @@
+"""세션마다 들고 있는 퀴즈 상태를 작게 표현하는 도구.
+
+- 출제 순서: 문제 은행 인덱스의 ``array('H')`` (은행이 65535문제를 넘으면 ``array('I')``)
+- 보기 순서: 보기 순열의 순위 번호(Lehmer 코드) 정수 하나
+- 채점 결과: 문제 i번의 정답 여부를 i번째 비트에 담은 정수 비트맵
+"""
+import random
+from array import array
+from math import factorial
+
+
+def index_array(indices, bank_size):
+    """문제 은행 크기에 맞는 가장 작은 부호 없는 정수 배열로 인덱스를 담습니다."""
+    typecode = "H" if bank_size <= 0xFFFF else "I"
+    return array(typecode, (int(i) for i in indices))
+
+
+def random_permutation_code(n, rng=random):
+    """n개 보기의 무작위 순열을 순위 번호로 반환합니다."""
+    return rng.randrange(factorial(n))
+
+
+def decode_permutation(code, n):
+    """순위 번호를 0 … n-1 의 순열 목록으로 되돌립니다."""
+    remaining = list(range(n))
+    perm = []
+    for i in range(n, 0, -1):
+        position, code = divmod(code, factorial(i - 1))
+        perm.append(remaining.pop(position))
+    return perm
+
+
+def encode_permutation(perm):
+    """0 … n-1 의 순열을 순위 번호로 바꿉니다."""
+    remaining = sorted(perm)
+    code = 0
+    for i, value in enumerate(perm):
+        position = remaining.index(value)
+        code += position * factorial(len(perm) - 1 - i)
+        remaining.pop(position)
+    return code
+
+
+def apply_permutation(items, code):
+    """순위 번호가 가리키는 순서로 items를 재배열한 새 목록을 반환합니다."""
+    return [items[i] for i in decode_permutation(code, len(items))]
+
+
+def set_answer_bit(bits, question_number):
+    return bits | (1 << question_number)
+
+
+def answer_bit(bits, question_number):
+    return bool(bits >> question_number & 1)
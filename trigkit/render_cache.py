@@ -0,0 +1,133 @@
+"""그래프 렌더링 결과(인코딩된 이미지 바이트)를 프로세스 전체에서 공유하는 LRU 캐시.
+
+같은 반 학생들이 같은 슬라이더 값을 고르면 matplotlib 렌더링을 다시 하지 않고
+딕셔너리 조회만으로 이미지를 돌려줍니다. 여러 세션이 같은 키를 동시에 놓치면(수업 시작 때
+모두 기본 그래프를 여는 경우 등) 한 세션만 렌더링하고 나머지는 그 결과를 기다려 받습니다.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+# 캐시 메모리 상한 (MB 단위, 환경 변수로 조정 가능)
+DEFAULT_MAX_MB = float(os.environ.get("TRIG_RENDER_CACHE_MB", "64"))
+
+
+class RenderCache:
+    """바이트 수 기준 상한을 가진 스레드 안전 LRU 캐시입니다."""
+
+    def __init__(self, max_bytes=int(DEFAULT_MAX_MB * 1024 * 1024)):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared = 0
+        self._in_flight = {}
+
+    def get(self, key):
+        """캐시된 바이트를 반환하고, 없으면 None을 반환합니다."""
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        """바이트를 저장하고 상한을 넘으면 가장 오래 쓰지 않은 항목부터 버립니다."""
+        size = len(data)
+        if size > self.max_bytes:
+            return  # 상한보다 큰 항목은 저장하지 않음
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old)
+            self._items[key] = data
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key, render):
+        """캐시에 없을 때만 render()를 호출해 결과를 저장합니다.
+
+        렌더링은 잠금 밖에서 수행하므로 느린 렌더링이 다른 세션의 조회를 막지 않습니다.
+        같은 키를 이미 다른 세션이 렌더링 중이면 새로 그리지 않고 그 결과를 기다립니다.
+        렌더링이 실패하면 기다리던 세션 중 하나가 다시 시도합니다.
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+        while True:
+            with self._lock:
+                data = self._items.get(key)
+                if data is not None:
+                    self._items.move_to_end(key)
+                    return data
+                flight = self._in_flight.get(key)
+                if flight is None:
+                    flight = self._in_flight[key] = _Flight()
+                    break
+            flight.done.wait()
+            if flight.data is not None:
+                with self._lock:
+                    self.shared += 1
+                return flight.data
+
+        try:
+            flight.data = render()
+            self.put(key, flight.data)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.done.set()
+        return flight.data
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """캐시 크기 조정에 쓰는 적중/실패 카운터를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._items),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "shared": self.shared,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+class _Flight:
+    """렌더링 중인 키 하나: 끝나면 done이 설정되고, 성공했으면 data에 결과가 있습니다."""
+
+    __slots__ = ("done", "data")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+
+
+_render_cache = None
+_render_cache_lock = threading.Lock()
+
+
+def get_render_cache():
+    """프로세스 전체에서 공유하는 렌더링 캐시를 반환합니다."""
+    global _render_cache
+    if _render_cache is None:
+        with _render_cache_lock:
+            if _render_cache is None:
+                _render_cache = RenderCache()
+    return _render_cache
@@ -0,0 +1,545 @@
+"""사용자별 간격 반복(spaced repetition) 출제 스케줄러.
+
+문제마다 난이도 계수(ease), 복습 간격, 다음 복습 시각(due)을 SM-2 방식으로 기억해 두고,
+이미 익힌 문제는 간격을 늘려 뒤로 미루고 틀린 문제는 짧은 간격 뒤에 다시 냅니다.
+
+출제할 때 문제 은행 전체를 훑지 않도록 두 가지 구조를 씁니다.
+
+- 복습 힙: (due, 문제 인덱스). 푼 적 있는 문제만 들어 있어 크기가 문제 은행이 아니라 푼 문제 수에
+  비례합니다. 답할 때마다 새 항목을 넣고, due가 바뀐 옛 항목은 꺼낼 때 버림
+- 새 문제 순서: 문제 인덱스를 섞인 순서로 둔 int32 배열. 앞에서부터 안 푼 문제를 꺼내며, 앞쪽의
+  이미 푼 문제는 시작 위치를 옮겨 다시 보지 않음
+
+``select``는 복습 시각이 지난 문제 → 새 문제 → 아직 때가 안 된 문제 중 가장 이른 것 순으로
+k개를 고르며 힙 연산 O(k log s)(s는 푼 문제 수)만 합니다(낡은 항목 정리는 분할 상환). 주제/난이도
+조건이 있으면 조건마다 그 문제들만 담은 힙과 순서 배열을 따로 두므로, 처음 한 번 O(m log m)으로
+만든 뒤에는 조건 안의 문제 수 m과 상관없이 같은 비용입니다. ``record``는 그 문제를 담은 힙마다 O(log s)입니다.
+스케줄러 하나의 메모리는 문제당 약 28바이트(상태 20 + 순서 배열 8)에 푼 문제의 힙 항목을 더한 정도이며,
+``ReviewRegistry``는 메모리에 둔 스케줄러들의 이 크기 합으로 상한을 둡니다.
+
+상태는 푼 적 있는 문제만 ``encode``로 압축된 바이너리(문제 id 목록 + 항목당 20바이트 레코드)로
+바꿔 SQLite(``ReviewStore``)에 저장하며, 사용자가 다시 오면 이어서 씁니다. 저장은 답안 기록
+(``trigkit.attempt_log``)처럼 write-behind라, 답할 때는 저장할 사용자를 표시만 하고 백그라운드
+스레드가 모아서 한 트랜잭션으로 씁니다.
+"""
+import atexit
+import heapq
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+# SM-2 기본값
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+FIRST_INTERVAL = 24 * 60 * 60  # 초: 처음 맞힌 문제는 하루 뒤
+SECOND_INTERVAL = 3 * 24 * 60 * 60
+LAPSE_INTERVAL = 10 * 60  # 초: 틀린 문제는 10분 뒤 다시
+
+# 응답 시간(초)에 따른 정답 품질 (SM-2의 q: 5 바로 앎, 4 잠깐 생각, 3 겨우 맞힘)
+QUICK_ANSWER_SECONDS = 10
+SLOW_ANSWER_SECONDS = 30
+
+STATE_DTYPE = np.dtype([
+    ("ease", "<f4"), ("interval", "<f4"), ("due", "<f8"), ("reps", "<u2"), ("lapses", "<u2"),
+])
+_MAGIC = b"TRS1"
+_HEADER = struct.Struct("<II")  # 항목 수, id 목록 바이트 수
+
+SAVE_INTERVAL = 1.0  # 초: 저장할 사용자를 모았다가 쓰는 주기
+SAVE_TIMEOUT = 10.0  # 초: flush가 저장을 기다리는 기본 최대 시간
+RETRY_DELAY = 0.5  # 초: 쓰기에 실패한 상태를 다시 쓰기 전 대기 시간
+STORE_CHECK_INTERVAL = 30.0  # 초: 다른 프로세스가 저장했는지 저장소에 다시 물어보는 최소 간격
+MAX_FILTER_HEAPS = 32  # 스케줄러마다 기억해 두는 출제 조건별 힙 수 (오래 안 쓴 것부터 버림)
+MAX_REGISTRY_BYTES = 256 * 1024 * 1024  # 메모리에 둘 스케줄러들의 크기 합 상한
+HEAP_ENTRY_BYTES = 120  # 힙 항목 (due, 인덱스) 하나의 대략적인 크기: 튜플 + float + int + 목록 칸
+
+logger = logging.getLogger(__name__)
+
+
+def answer_quality(correct, latency_ms):
+    if not correct:
+        return 0
+    seconds = latency_ms / 1000
+    if seconds < QUICK_ANSWER_SECONDS:
+        return 5
+    if seconds < SLOW_ANSWER_SECONDS:
+        return 4
+    return 3
+
+
+@lru_cache(maxsize=8)
+def _id_index(question_ids):
+    # 같은 문제 은행을 쓰는 스케줄러들이 id → 인덱스 dict를 함께 씀
+    return {qid: i for i, qid in enumerate(question_ids)}
+
+
+class _Heaps:
+    """출제 조건 하나(전체 또는 주제/난이도)의 복습 힙과 새 문제 순서."""
+
+    __slots__ = ("members", "size", "review", "live", "new", "new_start")
+
+    def __init__(self, members, size, review, new):
+        self.members = members  # 조건에 속한 문제 인덱스의 정렬된 int32 배열, 전체면 None
+        self.size = size
+        self.review = review  # (due, 문제 인덱스) 힙, 푼 적 있는 문제만
+        self.live = len(review)  # review 안의 서로 다른 문제 수 (낡은 항목 정리 기준)
+        self.new = new  # 문제 인덱스를 섞인 순서로 둔 int32 배열 (푼 문제는 꺼낼 때 건너뜀)
+        self.new_start = 0  # new 앞쪽의 이미 푼 문제를 건너뛴 위치
+
+    def contains(self, idx):
+        if self.members is None:
+            return True
+        i = self.members.searchsorted(idx)
+        return i < len(self.members) and self.members[i] == idx
+
+    @property
+    def nbytes(self):
+        members = 0 if self.members is None else self.members.nbytes
+        return members + self.new.nbytes + len(self.review) * HEAP_ENTRY_BYTES
+
+
+class ReviewScheduler:
+    """한 사용자가 한 문제 은행에 대해 가진 복습 상태입니다."""
+
+    def __init__(self, question_ids, seed=None):
+        self.question_ids = question_ids if isinstance(question_ids, tuple) else tuple(question_ids)
+        self._index = _id_index(self.question_ids)
+        n = len(self.question_ids)
+        self.state = np.zeros(n, dtype=STATE_DTYPE)
+        self.state["ease"] = INITIAL_EASE
+        self._lock = threading.Lock()
+        # 새 문제는 무작위 순번으로 섞어 둠: _order는 문제별 순번, _new_queue는 순번 순서의 문제 인덱스
+        self._order = np.random.default_rng(seed).permutation(n).astype(np.int32)
+        self._new_queue = np.empty(n, dtype=np.int32)
+        self._new_queue[self._order] = np.arange(n, dtype=np.int32)
+        self._all = self._build_heaps(None)
+        self._filtered = OrderedDict()  # 출제 조건 키 → _Heaps
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.question_ids)
+
+    @property
+    def nbytes(self):
+        """메모리에 둔 상태와 힙의 대략적인 바이트 수."""
+        heaps = [self._all, *list(self._filtered.values())]
+        return self.state.nbytes + self._order.nbytes + sum(h.nbytes for h in heaps)
+
+    def seen(self, idx):
+        return self.state["reps"][idx] > 0 or self.state["lapses"][idx] > 0
+
+    def _seen_mask(self):
+        return (self.state["reps"] > 0) | (self.state["lapses"] > 0)
+
+    def _review_entries(self, review_idx):
+        review = list(zip(self.state["due"][review_idx].tolist(), review_idx.tolist()))
+        heapq.heapify(review)
+        return review
+
+    def _seen_members(self, heaps, seen):
+        return np.flatnonzero(seen) if heaps.members is None else heaps.members[seen[heaps.members]]
+
+    def _build_heaps(self, candidates):
+        """candidates(문제 인덱스 배열, None이면 전체)의 복습 힙과 새 문제 순서를 만듭니다."""
+        seen = self._seen_mask()
+        if candidates is None:
+            heaps = _Heaps(None, len(self.question_ids), [], self._new_queue)
+        else:
+            members = np.unique(np.asarray(candidates, dtype=np.int64)).astype(np.int32)
+            new = members[np.argsort(self._order[members], kind="stable")]
+            heaps = _Heaps(members, len(members), [], new)
+        heaps.review = self._review_entries(self._seen_members(heaps, seen))
+        heaps.live = len(heaps.review)
+        return heaps
+
+    def _heaps_for(self, candidates, filter_key):
+        # 잠금을 잡은 채로 부름
+        if candidates is None:
+            return self._all
+        if filter_key is None:
+            return self._build_heaps(candidates)  # 키가 없으면 이번 한 번만 쓰고 버림
+        heaps = self._filtered.get(filter_key)
+        if heaps is None:
+            heaps = self._filtered[filter_key] = self._build_heaps(candidates)
+            while len(self._filtered) > MAX_FILTER_HEAPS:
+                self._filtered.popitem(last=False)
+        self._filtered.move_to_end(filter_key)
+        return heaps
+
+    def _take_new(self, heaps, chosen, k):
+        """새 문제 순서에서 안 푼 문제를 chosen이 k개가 될 때까지 덧붙입니다 (배열은 조금씩 잘라 봄)."""
+        reps, lapses = self.state["reps"], self.state["lapses"]
+        start, chunk = heaps.new_start, 64
+        while start < len(heaps.new) and len(chosen) < k:
+            block = heaps.new[start:start + chunk]
+            fresh = (reps[block] == 0) & (lapses[block] == 0)
+            if start == heaps.new_start:  # 맨 앞의 푼 문제들은 다음부터 보지 않음
+                heaps.new_start += int(fresh.argmax()) if fresh.any() else len(block)
+            for idx in block[fresh].tolist():
+                if len(chosen) == k:
+                    break
+                if idx not in chosen:
+                    chosen.append(idx)
+            start += len(block)
+            chunk *= 2
+
+    def select(self, k, candidates=None, now=None, filter_key=None):
+        """다음에 낼 문제 인덱스를 최대 k개 고릅니다.
+
+        candidates(문제 인덱스 배열)를 주면 그 안에서만 고릅니다. filter_key(예: (주제, 난이도))를 같이
+        주면 그 조건의 힙을 만들어 두고 다음 호출부터 다시 쓰므로, 같은 키에는 늘 같은 candidates를
+        넘겨야 합니다. 고른 문제는 힙에서 빠지지 않으므로 답하지 않고 그만둬도 상태가 그대로 남습니다.
+        """
+        now = time.time() if now is None else now
+        due = self.state["due"]
+        with self._lock:
+            heaps = self._heaps_for(candidates, filter_key)
+            chosen, popped = [], []
+
+            def take(heap, stop):
+                skipped = []
+                while heap and len(chosen) < k:
+                    entry = heap[0]
+                    if due[entry[1]] != entry[0]:
+                        heapq.heappop(heap)  # 갱신되어 낡은 항목은 버림
+                        continue
+                    if stop(entry):
+                        break
+                    heapq.heappop(heap)
+                    idx = entry[1]
+                    if idx not in chosen:
+                        chosen.append(idx)
+                        popped.append(entry)
+                    else:
+                        skipped.append(entry)
+                for entry in skipped:
+                    heapq.heappush(heap, entry)
+
+            take(heaps.review, lambda entry: entry[0] > now)  # 복습 시각이 지난 문제
+            self._take_new(heaps, chosen, k)  # 새 문제
+            take(heaps.review, lambda entry: False)  # 나머지는 가장 이른 복습부터
+            for entry in popped:
+                heapq.heappush(heaps.review, entry)
+        return chosen
+
+    def record(self, question_id, correct, latency_ms=0, now=None):
+        """답 하나를 반영해 그 문제의 간격과 다음 복습 시각을 갱신합니다. 모르는 id면 무시합니다."""
+        idx = self._index.get(question_id)
+        if idx is None:
+            return False
+        now = time.time() if now is None else now
+        quality = answer_quality(correct, latency_ms)
+        with self._lock:
+            first_time = not self.seen(idx)
+            item = self.state[idx]
+            if quality == 0:
+                item["lapses"] += 1
+                item["reps"] = 0
+                item["ease"] = max(MIN_EASE, item["ease"] - 0.2)
+                interval = LAPSE_INTERVAL
+            else:
+                item["reps"] += 1
+                if item["reps"] == 1:
+                    interval = FIRST_INTERVAL
+                elif item["reps"] == 2:
+                    interval = SECOND_INTERVAL
+                else:
+                    interval = float(item["interval"]) * float(item["ease"])
+                miss = 5 - quality
+                item["ease"] = max(MIN_EASE, item["ease"] + 0.1 - miss * (0.08 + miss * 0.02))
+            item["interval"] = interval
+            item["due"] = now + interval
+            entry = (float(item["due"]), idx)
+            for heaps in (self._all, *self._filtered.values()):
+                if not heaps.contains(idx):
+                    continue
+                heapq.heappush(heaps.review, entry)
+                heaps.live += first_time
+                # 낡은 항목이 살아 있는 항목 수의 두 배를 넘으면 한 번 정리 (분할 상환)
+                if len(heaps.review) > 2 * heaps.live + 64:
+                    heaps.review = self._review_entries(self._seen_members(heaps, self._seen_mask()))
+                    heaps.live = len(heaps.review)
+            self.dirty = True
+        return True
+
+    def encode(self):
+        """푼 적 있는 문제의 상태를 압축된 바이너리로 바꿉니다."""
+        with self._lock:
+            seen = np.flatnonzero(self._seen_mask())
+            records = self.state[seen].tobytes()
+            ids = "\n".join(self.question_ids[i] for i in seen).encode("utf-8")
+        return _MAGIC + zlib.compress(_HEADER.pack(len(seen), len(ids)) + ids + records)
+
+    def load(self, data):
+        """``encode``로 만든 바이너리를 불러옵니다. 지금 문제 은행에 없는 id는 건너뜁니다."""
+        if not data.startswith(_MAGIC):
+            raise ValueError("복습 상태 형식이 아닙니다.")
+        raw = zlib.decompress(data[len(_MAGIC):])
+        count, ids_len = _HEADER.unpack_from(raw)
+        offset = _HEADER.size
+        ids = raw[offset:offset + ids_len].decode("utf-8").split("\n") if count else []
+        records = np.frombuffer(raw, dtype=STATE_DTYPE, count=count, offset=offset + ids_len)
+        positions = [self._index.get(qid, -1) for qid in ids]
+        known = np.array([p >= 0 for p in positions], dtype=bool)
+        with self._lock:
+            self.state[np.array(positions, dtype=np.int64)[known]] = records[known]
+            self._all = self._build_heaps(None)
+            self._filtered.clear()
+            self.dirty = False
+        return int(known.sum())
+
+
+class ReviewStore:
+    """사용자별 복습 상태 바이너리를 SQLite에 저장합니다 (답안 기록과 같은 파일을 써도 됨)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS review_state ("
+            " user TEXT PRIMARY KEY, data BLOB NOT NULL, updated REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+
+    def _connection(self):
+        # 연결은 스레드마다 하나씩 열어 두고 재사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def updated(self, user):
+        row = self._connection().execute("SELECT updated FROM review_state WHERE user = ?", (user,)).fetchone()
+        return row[0] if row else None
+
+    def load(self, user):
+        """(updated, data) 또는 None을 반환합니다."""
+        row = self._connection().execute("SELECT updated, data FROM review_state WHERE user = ?", (user,)).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def save(self, user, data):
+        return self.save_many([(user, data)])
+
+    def save_many(self, items):
+        """[(user, data), ...]를 한 트랜잭션으로 저장하고 저장 시각을 반환합니다."""
+        updated = time.time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO review_state (user, data, updated) VALUES (?, ?, ?)"
+                " ON CONFLICT (user) DO UPDATE SET data = excluded.data, updated = excluded.updated",
+                [(user, data, updated) for user, data in items],
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return updated
+
+
+class ReviewRegistry:
+    """사용자 → 스케줄러. 최근에 쓴 사용자만 메모리에 두고, 나머지는 저장소에서 다시 불러옵니다.
+
+    메모리에 둘 양은 사용자 수가 아니라 스케줄러 크기(``nbytes``)의 합 ``max_bytes``로 제한하므로,
+    문제 은행이 커지면 메모리에 두는 사용자 수가 그만큼 줄어듭니다.
+
+    사용자 키는 겹치거나 바뀌지 않는 학습자 id여야 합니다 (앱은 세션의 ``learner_id``를 쓰고,
+    닉네임은 리더보드 표시에만 씀).
+
+    다른 서버 프로세스가 더 최근에 저장했는지는 ``get(..., refresh=True)``(퀴즈 시작)일 때나
+    마지막 확인 뒤 ``check_interval``초가 지났을 때만 저장소에 물어보므로, 답할 때마다 부르는
+    ``get``은 보통 메모리만 봅니다.
+
+    ``save_later``는 저장할 스케줄러를 표시만 하고 바로 돌아오며, 쓰기 스레드가 ``save_interval``초마다
+    모아서 씁니다. 메모리에서 밀려나는 스케줄러에 저장 안 된 변경이 있으면 같은 방식으로 저장하고,
+    쓰기 전에 그 사용자가 다시 오면 저장소 대신 기다리던 스케줄러를 그대로 씁니다.
+    """
+
+    def __init__(self, store, max_bytes=MAX_REGISTRY_BYTES, check_interval=STORE_CHECK_INTERVAL,
+                 save_interval=SAVE_INTERVAL):
+        self.store = store
+        self.max_bytes = max_bytes
+        self.check_interval = check_interval
+        self.save_interval = save_interval
+        self.failed_writes = 0
+        # user → [스케줄러, 불러오거나 저장한 시각, 저장소를 확인한 시각, 마지막으로 잰 nbytes]
+        self._schedulers = OrderedDict()
+        self._bytes = 0  # 메모리에 둔 스케줄러들의 nbytes 합 (퀴즈 시작과 불러올 때 다시 잼)
+        self._lock = threading.Lock()
+        self._pending = {}  # user → 저장할 스케줄러
+        self._writing = {}  # 쓰기 스레드가 지금 쓰고 있는 묶음
+        self._queued = self._saved = 0  # 저장 요청 수, 저장을 마친 요청 수 (flush 대기용)
+        self._stopping = False
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name="review-state-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def get(self, user, bank, refresh=False):
+        question_ids = bank.ids
+        now = time.monotonic()
+        with self._lock:
+            cached = self._schedulers.get(user)
+            if cached is not None:
+                self._schedulers.move_to_end(user)
+        if cached is not None:
+            scheduler, loaded_at, checked_at, _ = cached
+            same_bank = scheduler.question_ids is question_ids or scheduler.question_ids == question_ids
+            if same_bank and not refresh and now - checked_at < self.check_interval:
+                return scheduler
+            newer = self.store.updated(user)
+            if same_bank and (newer is None or newer <= loaded_at):
+                cached[2] = now
+                self._evict(self._resize(user, cached))
+                return scheduler
+
+        scheduler = self._unsaved(user, question_ids)
+        loaded_at = time.time() if scheduler is not None else 0.0
+        if scheduler is None:
+            scheduler = ReviewScheduler(question_ids)
+            record = self.store.load(user)
+            if record is not None:
+                loaded_at, data = record
+                scheduler.load(data)
+        entry = [scheduler, loaded_at, now, 0]
+        with self._lock:
+            previous = self._schedulers.pop(user, None)
+            if previous is not None:
+                self._bytes -= previous[3]
+            self._schedulers[user] = entry
+        self._evict(self._resize(user, entry))
+        return scheduler
+
+    def _resize(self, user, entry):
+        """entry의 크기를 다시 재어 합계에 반영하고, 상한을 넘어 밀려난 항목 목록을 반환합니다."""
+        nbytes = entry[0].nbytes
+        evicted = []
+        with self._lock:
+            if self._schedulers.get(user) is not entry:
+                return evicted
+            self._bytes += nbytes - entry[3]
+            entry[3] = nbytes
+            # 방금 쓴 사용자(맨 뒤)는 남기고 오래 안 쓴 사용자부터 밀어냄
+            while self._bytes > self.max_bytes and len(self._schedulers) > 1:
+                evicted_user, evicted_entry = self._schedulers.popitem(last=False)
+                self._bytes -= evicted_entry[3]
+                evicted.append((evicted_user, evicted_entry[0]))
+        return evicted
+
+    def _evict(self, evicted):
+        for user, scheduler in evicted:
+            if scheduler.dirty:
+                self._queue(user, scheduler)
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._schedulers)
+
+    def _unsaved(self, user, question_ids):
+        # 밀려났지만 아직 저장되지 않은 스케줄러 (저장소에 있는 상태보다 새로움)
+        with self._cond:
+            scheduler = self._pending.get(user) or self._writing.get(user)
+        if scheduler is None or scheduler.question_ids != question_ids:
+            return None
+        return scheduler
+
+    def _queue(self, user, scheduler):
+        with self._cond:
+            self._pending[user] = scheduler
+            self._queued += 1
+
+    def save_later(self, user):
+        """바뀐 상태가 있으면 쓰기 스레드에 저장을 맡기고 바로 반환합니다."""
+        with self._lock:
+            cached = self._schedulers.get(user)
+        if cached is None or not cached[0].dirty:
+            return False
+        self._queue(user, cached[0])
+        return True
+
+    def save(self, user):
+        """바뀐 상태가 있으면 지금 저장합니다 (도구와 테스트용, 앱은 ``save_later``)."""
+        with self._lock:
+            cached = self._schedulers.get(user)
+        if cached is None or not cached[0].dirty:
+            return False
+        self._write({user: cached[0]})
+        return True
+
+    def flush(self, timeout=SAVE_TIMEOUT):
+        """지금까지 맡긴 저장이 모두 끝날 때까지 최대 timeout초 기다립니다. 끝났으면 True."""
+        with self._cond:
+            target = self._queued
+            self._wake.set()
+            return self._cond.wait_for(lambda: self._saved >= target, timeout)
+
+    def close(self, timeout=SAVE_TIMEOUT):
+        if self._writer.is_alive():
+            with self._cond:
+                self._stopping = True
+            self._wake.set()
+            self._writer.join(timeout)
+
+    def _write(self, batch):
+        items = []
+        for user, scheduler in batch.items():
+            scheduler.dirty = False  # 인코딩한 뒤에 들어온 답은 다시 dirty로 남도록 먼저 내려 둠
+            items.append((user, scheduler.encode()))
+        try:
+            updated = self.store.save_many(items)
+        except BaseException:
+            for scheduler in batch.values():
+                scheduler.dirty = True
+            raise
+        with self._lock:
+            for user, scheduler in batch.items():
+                cached = self._schedulers.get(user)
+                if cached is not None and cached[0] is scheduler:
+                    cached[1] = updated
+
+    def _write_loop(self):
+        while True:
+            self._wake.wait(self.save_interval)
+            self._wake.clear()
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                self._writing = batch
+                target, stopping = self._queued, self._stopping
+            try:
+                if batch:
+                    self._write(batch)
+            except sqlite3.Error:
+                self.failed_writes += 1
+                with self._cond:
+                    for user, scheduler in batch.items():
+                        self._pending.setdefault(user, scheduler)
+                    self._writing = {}
+                if stopping:
+                    logger.error("복습 상태 %d건을 저장하지 못하고 종료합니다.", len(batch))
+                    return
+                logger.warning("복습 상태 %d건 저장 실패, %.1f초 뒤 다시 씁니다.", len(batch), RETRY_DELAY,
+                               exc_info=True)
+                time.sleep(RETRY_DELAY)
+                continue
+            with self._cond:
+                self._writing = {}
+                self._saved = target
+                self._cond.notify_all()
+                if stopping and not self._pending:
+                    return
+            if stopping:
+                self._wake.set()  # 종료 요청 뒤에 맡겨진 저장까지 쓰고 끝냄
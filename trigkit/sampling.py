@@ -0,0 +1,143 @@
+"""sin, cos, tan 곡선이 함께 쓰는 적응형 샘플링 엔진.
+
+고정된 500점 격자 대신 위상 u = Bx + C 공간에서 곡률 기준으로 간격을 정합니다.
+직선 근사 오차(현의 처짐)가 허용 오차 이하가 되도록 간격을 고르므로, 주파수가 낮으면
+점이 적고 높으면 많아집니다. 극값은 격자 위에 정확히 놓이고 탄젠트 극 근처는
+기하급수적으로 촘촘하게 채웁니다. 반환값은 진폭 1, 이동 0인 기본 곡선 f(Bx + C)이며,
+A와 D는 호출하는 쪽에서 적용합니다.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from trigkit.curves import split_at_poles, tan_asymptotes
+
+# 슬라이더 범위 기준의 최악 조건 (샘플 위치가 A, D와 무관하도록 최댓값으로 계산)
+AMPLITUDE_MAX = 4.0
+AMPLITUDE_MIN = 0.1
+Y_SHIFT_MAX = 5.0
+
+# 그래프 y 범위 16을 약 1000픽셀로 그리므로 반 픽셀 정도의 오차를 허용
+DEFAULT_TOLERANCE = 16 / 2000
+
+# 곡선 하나당 최대 점 수
+MAX_POINTS = 2000
+
+# 반주기당 최소 점 수 (허용 오차가 커도 각져 보이지 않도록)
+MIN_POINTS_PER_HALF_PERIOD = 8
+
+# 탄젠트 극 근처 세분화 비율
+POLE_REFINE_RATIO = 0.75
+
+# (함수, B, C) 기본 곡선 캐시 크기
+BASE_CURVE_CACHE_SIZE = 512
+
+
+def phase_step(tolerance=DEFAULT_TOLERANCE, amplitude=AMPLITUDE_MAX):
+    """현의 처짐 A·h²/8 이 허용 오차 이하가 되는 위상 간격 h를 구합니다."""
+    h = np.sqrt(8 * tolerance / amplitude)
+    return min(h, np.pi / MIN_POINTS_PER_HALF_PERIOD)
+
+
+def _phase_window(frequency, x_shift, x_min, x_max):
+    u_lo, u_hi = frequency * x_min + x_shift, frequency * x_max + x_shift
+    return min(u_lo, u_hi), max(u_lo, u_hi)
+
+
+def _sample_periodic(anchor, u_lo, u_hi, h, max_points):
+    # 반주기를 정수 등분하고 극값 위치(anchor + kπ)에 격자를 맞춤
+    per_half = int(np.ceil(np.pi / h))
+    span = u_hi - u_lo
+    per_half = max(1, min(per_half, int((max_points - 2) * np.pi / max(span, 1e-12))))
+    h = np.pi / per_half
+    j = np.arange(np.ceil((u_lo - anchor) / h), np.floor((u_hi - anchor) / h) + 1)
+    return np.unique(np.concatenate(([u_lo], anchor + j * h, [u_hi])))
+
+
+@lru_cache(maxsize=64)
+def _tan_branch_template(tolerance, budget):
+    """한 가지(-π/2, π/2) 안의 위상 오프셋을 만듭니다.
+
+    점 밀도를 max(1/h, sqrt(|tan''(u)| / 8·tol)) 로 두고 누적 밀도를 역보간해 간격을
+    곡률에 맞게 배분합니다. 화면 밖으로 나가는 구간은 극 방향으로 기하급수적으로만 채웁니다.
+    위치가 B, C와 무관하므로 허용 오차와 점 예산별로 한 번만 계산해 둡니다.
+    """
+    h = phase_step(tolerance)
+    # 진폭 1일 때 화면 안에 들어오는 |tan| 범위
+    d_visible = np.arctan(1 / (8 + Y_SHIFT_MAX))
+    u = np.linspace(0, np.pi / 2 - d_visible, 4001)
+    t = np.tan(u)
+    curvature = 2 * t * (1 + t * t)
+    density = np.maximum(1 / h, np.sqrt(curvature / (8 * tolerance)))
+    cumulative = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(u))))
+
+    # 화면 밖 구간: 작은 진폭에서도 곡선이 화면 끝까지 이어지도록 극 방향으로 세분화
+    d_min = 1 / ((8 + Y_SHIFT_MAX) / AMPLITUDE_MIN)
+    n_tail = max(0, int(np.ceil(np.log(d_min / d_visible) / np.log(POLE_REFINE_RATIO))))
+
+    n_half = max(2, min(int(np.ceil(cumulative[-1])), budget // 2 - n_tail))
+    half = np.interp(np.linspace(0, cumulative[-1], n_half + 1), cumulative, u)
+    tail = np.pi / 2 - d_visible * POLE_REFINE_RATIO ** np.arange(1, n_tail + 1)
+    half = np.concatenate((half, tail))
+    return np.concatenate((-half[:0:-1], half))
+
+
+def _sample_tan(u_lo, u_hi, tolerance, max_points):
+    k = np.arange(np.floor((u_lo + np.pi / 2) / np.pi), np.ceil((u_hi + np.pi / 2) / np.pi) + 1)
+    # 보이는 가지 수로 점 예산을 나눔 (양 끝 가지는 일부만 보이므로 1개로 계산)
+    visible_branches = max(1.0, (u_hi - u_lo) / np.pi)
+    template = _tan_branch_template(tolerance, int(max_points / visible_branches))
+    u = (k[:, None] * np.pi + template[None, :]).ravel()
+    u = u[(u >= u_lo) & (u <= u_hi)]
+    return np.concatenate(([u_lo], u, [u_hi]))
+
+
+def sample_curve(func, frequency, x_shift, x_min, x_max,
+                 tolerance=DEFAULT_TOLERANCE, max_points=MAX_POINTS):
+    """기본 곡선 f(Bx + C)를 적응형으로 샘플링해 float32 (x, y) 배열로 반환합니다.
+
+    탄젠트는 극 위치에 NaN이 들어가 있어 그대로 그리면 점근선에서 끊어집니다.
+    """
+    u_lo, u_hi = _phase_window(frequency, x_shift, x_min, x_max)
+    h = phase_step(tolerance)
+
+    if func == "sin":
+        u = _sample_periodic(np.pi / 2, u_lo, u_hi, h, max_points)
+        y = np.sin(u)
+    elif func == "cos":
+        u = _sample_periodic(0.0, u_lo, u_hi, h, max_points)
+        y = np.cos(u)
+    elif func == "tan":
+        u = _sample_tan(u_lo, u_hi, tolerance, max_points)
+        y = np.tan(u)
+    else:
+        raise ValueError(f"지원하지 않는 함수입니다: {func}")
+
+    x = (u - x_shift) / frequency
+    if frequency < 0:
+        x, y = x[::-1], y[::-1]
+    if func == "tan":
+        x, y = split_at_poles(x, y, tan_asymptotes(frequency, x_shift, x_min, x_max))
+    return x.astype(np.float32), y.astype(np.float32)
+
+
+@lru_cache(maxsize=BASE_CURVE_CACHE_SIZE)
+def _cached_base_curve(func, frequency, x_shift, x_min, x_max):
+    x, y = sample_curve(func, frequency, x_shift, x_min, x_max)
+    # 여러 세션이 공유하므로 읽기 전용으로 고정
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+def base_curve(func, frequency, x_shift, x_min, x_max):
+    """(함수, B, C)별로 캐시된 기본 곡선 f(Bx + C)를 반환합니다.
+
+    진폭(A)과 Y축 이동(D)만 바뀌는 경우에는 삼각함수 계산을 다시 하지 않습니다.
+    슬라이더 값의 부동 소수점 오차는 반올림으로 흡수해 같은 키로 모읍니다.
+    """
+    return _cached_base_curve(func, round(frequency, 6), round(x_shift, 6), x_min, x_max)
+
+
+def base_curve_cache_info():
+    return _cached_base_curve.cache_info()
@@ -0,0 +1,26 @@
+"""그래프 렌더링 예열과 함께 Streamlit 서버를 시작합니다.
+
+``streamlit run main.py`` 대신 저장소 루트에서 ``python -m trigkit.serve [streamlit 옵션...]``로
+실행하면, 서버가 뜨는 동안 같은 프로세스의 백그라운드 스레드에서 ``warm_up``을 실행합니다.
+``TRIG_WARMUP=0``이면 예열 없이 그대로 시작합니다.
+"""
+import os
+import sys
+
+from streamlit.web import cli
+
+from trigkit.warmup import start_warm_up
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if os.environ.get("TRIG_WARMUP", "1") != "0":
+        start_warm_up()
+    sys.argv = ["streamlit", "run", os.path.join(ROOT, "main.py"), *argv]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
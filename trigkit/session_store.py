@@ -0,0 +1,221 @@
+"""세션 상태를 프로세스 밖에 저장해 여러 서버 프로세스가 같은 사용자를 이어서 처리하게 합니다.
+
+Streamlit 세션은 웹소켓이 연결된 프로세스 안에만 있으므로, 다시 연결될 때 다른 프로세스로
+가면 진행 상황이 사라집니다. 여기서는 브라우저 쿠키(``trig_sid``)에 둔 임의의 sid를 사용자
+식별자로 쓰고, 페이지별로 정한 키만 골라 저장소에 저장합니다. 어느 프로세스든 sid로 상태를 불러올 수 있습니다.
+sid는 그 세션을 가져가는 열쇠이므로 주소에 넣지 않습니다. 공유한 링크나 즐겨찾기, 교실 화면에 비친
+주소로는 남의 세션을 이어받을 수 없고, 예전 주소의 ``?sid=``는 읽지 않고 지웁니다.
+
+저장소는 ``TRIG_SESSION_STORE`` 환경 변수로 고릅니다.
+
+- ``memory`` (기본): 프로세스 안의 dict. 프로세스 하나로 실행할 때와 동작이 같습니다.
+- ``sqlite:<경로>``: SQLite 파일. 같은 서버의 여러 프로세스가 공유합니다.
+
+값은 키 이름 없이 정해진 순서의 JSON 배열로 저장하므로 세션당 수십~수백 바이트입니다.
+"""
+import array
+import json
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+
+SID_PARAM = "sid"  # 예전에 sid를 넣던 주소 매개변수 (지우기만 함)
+SID_COOKIE = "trig_sid"
+SID_COOKIE_MAX_AGE = 30 * 24 * 60 * 60  # 초
+_SID_PATTERN = re.compile(r"[A-Za-z0-9_-]{16,64}")
+_SID_KEY = "_session_sid"
+_COOKIE_PENDING_KEY = "_session_sid_cookie_pending"
+_VERSIONS_KEY = "_session_store_versions"
+_ARRAY_TAG = "$a"
+
+
+def encode_values(values):
+    """값 목록을 압축된 JSON 바이트로 바꿉니다 (array.array는 타입 코드와 함께 저장)."""
+    def default(value):
+        if isinstance(value, array.array):
+            return {_ARRAY_TAG: value.typecode, "v": value.tolist()}
+        if hasattr(value, "item"):  # numpy 스칼라
+            return value.item()
+        raise TypeError(f"세션 저장소에 저장할 수 없는 값: {type(value).__name__}")
+
+    return json.dumps(values, default=default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def decode_values(data):
+    def object_hook(obj):
+        if _ARRAY_TAG in obj:
+            return array.array(obj[_ARRAY_TAG], obj["v"])
+        return obj
+
+    return json.loads(data, object_hook=object_hook)
+
+
+class MemorySessionStore:
+    """프로세스 안의 dict에 저장합니다 (단일 프로세스용)."""
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def load(self, sid, namespace):
+        """(version, data) 또는 None을 반환합니다."""
+        with self._lock:
+            return self._records.get((sid, namespace))
+
+    def save(self, sid, namespace, data):
+        """data를 저장하고 새 version을 반환합니다 (마지막에 쓴 쪽이 이김)."""
+        with self._lock:
+            previous = self._records.get((sid, namespace))
+            version = previous[0] + 1 if previous else 1
+            self._records[(sid, namespace)] = (version, data)
+            return version
+
+    def delete(self, sid, namespace):
+        with self._lock:
+            self._records.pop((sid, namespace), None)
+
+
+class SQLiteSessionStore:
+    """SQLite 파일에 저장합니다. WAL 모드라 읽기는 쓰기를 기다리지 않습니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " sid TEXT NOT NULL, namespace TEXT NOT NULL, version INTEGER NOT NULL,"
+                " data BLOB NOT NULL, updated REAL NOT NULL, PRIMARY KEY (sid, namespace)"
+                ") WITHOUT ROWID"
+            )
+
+    def _connection(self):
+        # 연결은 스레드마다 하나씩 열어 두고 재사용
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def load(self, sid, namespace):
+        row = self._connection().execute(
+            "SELECT version, data FROM sessions WHERE sid = ? AND namespace = ?", (sid, namespace)
+        ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def save(self, sid, namespace, data):
+        row = self._connection().execute(
+            "INSERT INTO sessions (sid, namespace, version, data, updated) VALUES (?, ?, 1, ?, ?)"
+            " ON CONFLICT (sid, namespace) DO UPDATE SET"
+            " version = version + 1, data = excluded.data, updated = excluded.updated"
+            " RETURNING version",
+            (sid, namespace, data, time.time()),
+        ).fetchone()
+        return row[0]
+
+    def delete(self, sid, namespace):
+        self._connection().execute("DELETE FROM sessions WHERE sid = ? AND namespace = ?", (sid, namespace))
+
+
+def create_session_store(spec):
+    """``memory`` 또는 ``sqlite:<경로>`` 설정 문자열로 저장소를 만듭니다."""
+    if spec == "memory":
+        return MemorySessionStore()
+    if spec.startswith("sqlite:"):
+        return SQLiteSessionStore(spec[len("sqlite:"):])
+    raise ValueError(f"알 수 없는 세션 저장소 설정: {spec!r} (memory 또는 sqlite:<경로>)")
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_session_store():
+    """환경 변수 설정에 따른 프로세스 공용 저장소를 반환합니다."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = create_session_store(os.environ.get("TRIG_SESSION_STORE", "memory"))
+        return _store
+
+
+class SessionSync:
+    """페이지 하나의 세션 상태 키를 저장소와 맞춥니다.
+
+    스크립트 맨 앞에서 ``restore``, 상태를 바꾼 뒤(스크립트 끝, fragment 끝)에 ``persist``를
+    부릅니다. 저장소의 version이 이 세션이 마지막으로 본 것보다 새로우면(다른 프로세스가 썼으면)
+    불러와 덮어쓰고, 값이 바뀌었을 때만 저장합니다.
+    """
+
+    def __init__(self, namespace, keys, store=None):
+        self.namespace = namespace
+        self.keys = tuple(keys)
+        self._store = store
+
+    @property
+    def store(self):
+        return self._store if self._store is not None else get_session_store()
+
+    def session_id(self, state, query_params, cookies):
+        """세션에 기억해 둔 sid, 브라우저 쿠키의 sid, 새 sid 순으로 씁니다.
+
+        새로 만든 sid는 ``cookie_script``로 브라우저에 넣어야 다음 연결에서 이어집니다.
+        """
+        if SID_PARAM in query_params:
+            del query_params[SID_PARAM]
+        sid = state.get(_SID_KEY)
+        if sid is None:
+            cookie = cookies.get(SID_COOKIE)
+            sid = cookie if isinstance(cookie, str) and _SID_PATTERN.fullmatch(cookie) else secrets.token_urlsafe(16)
+            state[_SID_KEY] = sid
+            if sid != cookie:
+                state[_COOKIE_PENDING_KEY] = True
+        return sid
+
+    def cookie_script(self, state):
+        """새 sid를 브라우저 쿠키에 넣는 ``<script>`` (넣을 것이 없으면 None).
+
+        ``st.html(..., unsafe_allow_javascript=True)``로 그립니다. sid는 ``_SID_PATTERN`` 문자만 있어 그대로 넣어도 됩니다.
+        """
+        if not state.pop(_COOKIE_PENDING_KEY, False):
+            return None
+        cookie = f"{SID_COOKIE}={state[_SID_KEY]}; path=/; max-age={SID_COOKIE_MAX_AGE}; samesite=strict"
+        return f"<script>document.cookie = '{cookie}' + (location.protocol === 'https:' ? '; secure' : '');</script>"
+
+    def _seen(self, state):
+        versions = state.get(_VERSIONS_KEY)
+        if versions is None:
+            versions = state[_VERSIONS_KEY] = {}
+        return versions
+
+    def restore(self, state, query_params, cookies):
+        """저장소에 더 새로운 상태가 있으면 세션 상태에 채워 넣습니다."""
+        sid = self.session_id(state, query_params, cookies)
+        record = self.store.load(sid, self.namespace)
+        seen = self._seen(state)
+        if record is None or seen.get(self.namespace, (0, None))[0] >= record[0]:
+            return False
+        version, data = record
+        values = decode_values(data)
+        if len(values) != len(self.keys):  # 키 구성이 바뀐 이전 기록은 무시
+            return False
+        for key, value in zip(self.keys, values):
+            state[key] = value
+        seen[self.namespace] = (version, data)
+        return True
+
+    def persist(self, state):
+        """키 값이 마지막으로 저장/복원한 것과 달라졌을 때만 저장합니다."""
+        sid = state.get(_SID_KEY)
+        if sid is None:
+            return False
+        data = encode_values([state.get(key) for key in self.keys])
+        seen = self._seen(state)
+        if seen.get(self.namespace, (0, None))[1] == data:
+            return False
+        seen[self.namespace] = (self.store.save(sid, self.namespace, data), data)
+        return True
@@ -0,0 +1,28 @@
+"""세션 상태 메모리 사용량 측정 도구."""
+import sys
+from array import array
+
+import numpy as np
+
+
+def deep_sizeof(obj, seen=None):
+    """컨테이너 안의 내용까지 포함한 객체의 바이트 수를 추정합니다 (같은 객체는 한 번만 셈)."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, array, np.ndarray)) or obj is None:
+        return size
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def session_state_nbytes(state):
+    """세션 상태(키 → 값 매핑)의 전체 바이트 수와 키별 바이트 수를 반환합니다."""
+    seen = set()
+    per_key = {key: deep_sizeof(value, seen) for key, value in state.items()}
+    return sum(per_key.values()), per_key
@@ -0,0 +1,61 @@
+"""여러 각도의 sin, cos, tan 값을 한 번에 계산해 표로 만드는 도구.
+
+수치 값은 NumPy 한 번의 벡터 연산으로 구하고, 15°의 배수인 각도에는
+정확한 값 표(``trigkit.exact_values``)의 LaTeX를 인덱스로 채워 넣습니다.
+"""
+import numpy as np
+import pandas as pd
+
+from trigkit.exact_values import EXACT_ANGLES, STEP_DEGREES, UNDEFINED
+
+FUNCS = ("sin", "cos", "tan")
+
+# 정확한 값 표를 열 단위 배열로 펼쳐 둠 (np.take로 한꺼번에 꺼내기 위함)
+_EXACT_COLUMNS = {
+    "rad": np.array([angle.rad_latex for angle in EXACT_ANGLES], dtype=object),
+    **{func: np.array([getattr(angle, f"{func}_latex") for angle in EXACT_ANGLES], dtype=object) for func in FUNCS},
+}
+
+
+def angle_grid(step_degrees, start=0, stop=360):
+    """start° 부터 stop° 까지 step_degrees 간격의 각도 배열을 반환합니다."""
+    return np.arange(start, stop + step_degrees / 2, step_degrees, dtype=float)
+
+
+def build_value_table(degrees):
+    """주어진 각도(°)들의 삼각함수 값 표를 DataFrame으로 반환합니다.
+
+    탄젠트가 정의되지 않는 각도의 수치 값은 NaN, 정확한 값 열은 안내 문구입니다.
+    15°의 배수가 아닌 각도의 정확한 값 열은 빈 문자열입니다.
+    """
+    degrees = np.asarray(degrees, dtype=float)
+    radians = np.deg2rad(degrees)
+    sin_values = np.sin(radians)
+    cos_values = np.cos(radians)
+    tan_defined = np.abs(cos_values) >= 1e-9
+    tan_values = np.divide(sin_values, cos_values, out=np.full_like(sin_values, np.nan), where=tan_defined)
+
+    # 15°의 배수(0° ~ 360°)만 정확한 값 표에 있음
+    steps = degrees / STEP_DEGREES
+    indices = np.rint(steps).astype(int)
+    in_table = np.isclose(steps, indices) & (indices >= 0) & (indices < len(EXACT_ANGLES))
+    safe_indices = np.where(in_table, indices, 0)
+
+    def exact_column(name, fallback):
+        return np.where(in_table, np.take(_EXACT_COLUMNS[name], safe_indices), fallback)
+
+    rad_fallback = np.char.mod("%.4f", radians).astype(object)
+    table = pd.DataFrame({
+        "각도 (°)": degrees,
+        "라디안": exact_column("rad", rad_fallback),
+        "sin": sin_values,
+        "cos": cos_values,
+        "tan": tan_values,
+        "sin (정확한 값)": exact_column("sin", ""),
+        "cos (정확한 값)": exact_column("cos", ""),
+        "tan (정확한 값)": exact_column("tan", np.where(tan_defined, "", UNDEFINED)),
+    })
+    # 부동 소수점 잡음(예: sin(π) = 1.2e-16) 정리
+    for func in FUNCS:
+        table[func] = table[func].round(12) + 0.0
+    return table
@@ -0,0 +1,222 @@
+"""각도 확인 페이지의 단위원 그림.
+
+단위원, 좌표축, 16개 특수각 눈금과 그 LaTeX 라벨은 각도와 상관없이 항상 같으므로, 각도 단위(도/라디안)별로
+프로세스에서 한 번만 그려 RGBA 배경 배열로 보관합니다. 버튼을 누를 때마다는 그 배경을 Figure의 픽셀 버퍼에
+복사한 뒤, 각의 동경과 sin/cos 투영, tan 선분 같은 작은 동적 요소만 ``draw_artist``로 덧그리고(blit)
+PNG로 인코딩합니다. 수식 라벨 조판과 전체 그리기는 배경을 만들 때 한 번만 합니다.
+
+인코딩은 RGBA 그대로보다 미리 정해 둔 색 팔레트(8비트)로 바꿔 압축하는 편이 세 배쯤 빠르고
+파일도 작아서, 팔레트도 처음 한 번 견본 그림으로 만들어 둡니다.
+
+Figure는 그래프 페이지와 같은 방식으로 프로세스 전체의 풀에 두고 그리는 동안만 빌려 씁니다.
+"""
+import contextlib
+import io
+import threading
+
+import numpy as np
+
+from trigkit import instrumentation
+from trigkit.exact_values import EXACT_ANGLES, angle_index_from_degrees
+from trigkit.graph_figure import CURVE_COLORS
+
+# 16개 특수각: 30°와 45°의 배수
+SPECIAL_DEGREES = tuple(sorted({d for d in range(0, 360, 30)} | {d for d in range(0, 360, 45)}))
+
+UNITS = ("deg", "rad")
+FIGURE_SIZE = (5, 5)
+FIGURE_DPI = 100
+# tan 60° = √3 선분까지 잘리지 않도록 잡은 좌표 범위
+LIMIT = 1.85
+LABEL_RADIUS = 1.28
+TICK_LENGTH = 0.05
+ARC_RADIUS = 0.22
+# PNG 팔레트 색 수: 검정/회색 선, 세 함수 색과 그 사이 안티에일리어싱 색이면 충분함
+PALETTE_COLORS = 64
+# 팔레트를 만들 때 쓰는 견본 (각도, 강조 함수): 모든 동적 요소와 흐린/굵은 선이 한 번씩 나오도록
+PALETTE_SAMPLES = ((60, "sin"), (150, "cos"), (225, "tan"))
+
+
+def tick_label(degrees, unit):
+    if unit == "deg":
+        return rf"${degrees}^\circ$"
+    return rf"${EXACT_ANGLES[angle_index_from_degrees(degrees)].rad_latex}$"
+
+
+def unit_circle_point(degrees):
+    """(cos, sin, tan 또는 None). 특수각은 정확한 값 표를 써서 tan 90° 같은 오차를 피합니다."""
+    index = angle_index_from_degrees(degrees % 360)
+    if index is not None:
+        angle = EXACT_ANGLES[index]
+        return angle.cos, angle.sin, (angle.tan if angle.tan_defined else None)
+    radians = np.deg2rad(degrees)
+    cos, sin = float(np.cos(radians)), float(np.sin(radians))
+    return cos, sin, (sin / cos if abs(cos) > 1e-9 else None)
+
+
+class UnitCircleFigure:
+    """정적 배경 요소와, 배경을 다시 그리지 않고 덧그리는 동적 요소를 묶은 클래스입니다."""
+
+    def __init__(self, figsize=FIGURE_SIZE, dpi=FIGURE_DPI):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_axes((0, 0, 1, 1))
+        self._build_static()
+        self._build_overlay()
+
+    def _build_static(self):
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Circle
+
+        ax = self.ax
+        ax.set_xlim(-LIMIT, LIMIT)
+        ax.set_ylim(-LIMIT, LIMIT)
+        ax.set_aspect("equal")
+        ax.set_axis_off()
+        ax.axhline(0, color="black", linewidth=0.8)
+        ax.axvline(0, color="black", linewidth=0.8)
+        ax.axvline(1, color="gray", linewidth=0.6, linestyle=":")  # tan 선분이 놓이는 접선 x = 1
+        ax.add_patch(Circle((0, 0), 1, fill=False, color="black", linewidth=1.2))
+
+        radians = np.deg2rad(SPECIAL_DEGREES)
+        direction = np.column_stack((np.cos(radians), np.sin(radians)))
+        ticks = np.stack((direction * (1 - TICK_LENGTH), direction * (1 + TICK_LENGTH)), axis=1)
+        ax.add_collection(LineCollection(ticks, colors="black", linewidths=1))
+        self.labels = [
+            ax.text(x * LABEL_RADIUS, y * LABEL_RADIUS, "", ha="center", va="center", fontsize=10)
+            for x, y in direction
+        ]
+        ax.legend(
+            handles=[Line2D([], [], color=CURVE_COLORS[func], linewidth=3, label=rf"$\{func}\,\theta$")
+                     for func in ("sin", "cos", "tan")],
+            loc="lower right", fontsize=9, frameon=False,
+        )
+
+    def _build_overlay(self):
+        # animated=True인 요소는 전체 그리기(배경)에서 빠지고 draw_artist로만 그려짐
+        ax = self.ax
+        (self.arc,) = ax.plot([], [], color="black", linewidth=1, animated=True)
+        (self.tan_guide,) = ax.plot([], [], color=CURVE_COLORS["tan"], linewidth=1, linestyle="--", animated=True)
+        self.segments = {
+            func: ax.plot([], [], color=CURVE_COLORS[func], solid_capstyle="butt", animated=True)[0]
+            for func in ("cos", "sin", "tan")
+        }
+        (self.ray,) = ax.plot([], [], color="black", linewidth=2, animated=True)
+        (self.point,) = ax.plot([], [], "o", color="black", markersize=6, animated=True)
+        self.overlay = [self.arc, self.tan_guide, *self.segments.values(), self.ray, self.point]
+
+    def render_background(self, unit):
+        """정적 요소만 그린 RGBA 배열을 반환합니다 (각도 단위마다 한 번)."""
+        for degrees, label in zip(SPECIAL_DEGREES, self.labels):
+            label.set_text(tick_label(degrees, unit))
+        self.canvas.draw()
+        return np.asarray(self.canvas.buffer_rgba()).copy()
+
+    def _set_overlay(self, degrees, highlight):
+        cos, sin, tan = unit_circle_point(degrees)
+        arc = np.deg2rad(np.linspace(0, degrees % 360, 48))
+        self.arc.set_data(ARC_RADIUS * np.cos(arc), ARC_RADIUS * np.sin(arc))
+        self.ray.set_data((0, cos), (0, sin))
+        self.point.set_data((cos,), (sin,))
+        self.segments["cos"].set_data((0, cos), (0, 0))
+        self.segments["sin"].set_data((cos, cos), (0, sin))
+        self.segments["tan"].set_visible(tan is not None)
+        self.tan_guide.set_visible(tan is not None)
+        if tan is not None:
+            self.segments["tan"].set_data((1, 1), (0, tan))
+            self.tan_guide.set_data((0, 1), (0, tan))
+        for func, line in self.segments.items():
+            line.set_linewidth(4 if func == highlight else 2)
+            line.set_alpha(1 if highlight in (None, func) else 0.45)
+
+    def blit(self, degrees, unit="deg", highlight=None):
+        """캐시된 배경을 픽셀 버퍼에 복사하고 동적 요소만 덧그린 뒤 그 버퍼(RGBA 배열)를 반환합니다."""
+        background = get_background(unit, self)
+        buffer = np.asarray(self.canvas.get_renderer().buffer_rgba())
+        buffer[...] = background
+        self._set_overlay(degrees, highlight)
+        for artist in self.overlay:
+            self.ax.draw_artist(artist)
+        return buffer
+
+    def render_png(self, degrees, unit="deg", highlight=None):
+        """캐시된 배경 위에 동적 요소만 덧그려 PNG 바이트로 반환합니다."""
+        palette = get_palette(self)
+        with instrumentation.phase("radian.unit_circle_blit"):
+            buffer = self.blit(degrees, unit, highlight)
+        with instrumentation.phase("radian.unit_circle_encode"):
+            return encode_png(buffer, palette)
+
+
+_backgrounds = {}
+_background_lock = threading.Lock()
+
+
+def get_background(unit, figure):
+    """각도 단위별 배경 RGBA 배열. 처음 요청할 때 빌린 Figure로 한 번 그립니다."""
+    if unit not in UNITS:
+        raise ValueError(f"알 수 없는 각도 단위: {unit!r} ({', '.join(UNITS)})")
+    background = _backgrounds.get(unit)
+    if background is None:
+        with _background_lock:
+            background = _backgrounds.get(unit)
+            if background is None:
+                with instrumentation.phase("radian.unit_circle_background"):
+                    background = _backgrounds[unit] = figure.render_background(unit)
+                background.flags.writeable = False
+    return background
+
+
+_palette = []
+
+
+def get_palette(figure):
+    """동적 요소까지 그려진 견본 그림들로 만든 PNG 팔레트 이미지 (처음 한 번만 만듦)."""
+    if not _palette:
+        from PIL import Image
+
+        samples = np.concatenate([
+            figure.blit(degrees, "deg", func)[..., :3].copy() for degrees, func in PALETTE_SAMPLES
+        ])
+        palette = Image.fromarray(samples).quantize(PALETTE_COLORS, dither=Image.Dither.NONE)
+        with _background_lock:
+            _palette[:] = [palette]
+    return _palette[0]
+
+
+def encode_png(rgba, palette):
+    """RGBA 배열을 팔레트 색으로 바꿔 PNG로 인코딩합니다."""
+    from PIL import Image
+
+    output = io.BytesIO()
+    image = Image.fromarray(rgba[..., :3]).quantize(palette=palette, dither=Image.Dither.NONE)
+    image.save(output, format="PNG", compress_level=1)
+    return output.getvalue()
+
+
+_idle_figures = []
+_idle_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def checkout_unit_circle():
+    """쉬고 있는 UnitCircleFigure를 빌려 주고, 다 쓰면 풀에 돌려놓습니다 (없으면 새로 만듦)."""
+    with _idle_lock:
+        figure = _idle_figures.pop() if _idle_figures else None
+    if figure is None:
+        figure = UnitCircleFigure()
+    try:
+        yield figure
+    finally:
+        with _idle_lock:
+            _idle_figures.append(figure)
+
+
+def render_unit_circle_png(degrees, unit="deg", highlight=None):
+    """각 degrees의 단위원 그림을 PNG 바이트로 반환합니다. highlight 함수의 선분을 굵게 그립니다."""
+    with checkout_unit_circle() as figure:
+        return figure.render_png(degrees, unit, highlight)
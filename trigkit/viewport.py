@@ -0,0 +1,175 @@
+"""그래프 보기 범위(뷰포트)와 픽셀 열 단위 min/max 솎아내기.
+
+보기 범위의 가로 폭은 기본 폭(4π)의 2의 거듭제곱 배(확대 단계)로만 바뀌고, 왼쪽 끝은
+그 폭의 1/``TILES_PER_VIEW`` 단위(이동 칸)로만 움직입니다. 그래서 화면은 항상 같은 크기의
+타일 ``TILES_PER_VIEW``개로 정확히 나뉘고, 타일별 곡선은 (함수, B, C, 확대 단계, 타일 번호)로
+캐시됩니다. 옆으로 한 칸 옮기면 나머지 타일은 그대로 재사용되고, 되돌아오면 모두 캐시 적중입니다.
+
+곡선은 보이는 범위만 계산합니다. 픽셀 열마다 그 열에 들어가는 함수값의 최솟값과 최댓값을
+닫힌 식으로 구해 두 점(탄젠트는 세 칸)만 남기므로, 점 수는 x 범위가 아니라 픽셀 폭에
+비례합니다. ±100π처럼 주기가 픽셀보다 촘촘한 범위에서도 점을 건너뛰어 생기는 에일리어싱 없이
+실제로 칠해질 픽셀이 그대로 채워집니다.
+"""
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+TILES_PER_VIEW = 4
+
+# 확대 단계 0의 보기 범위: x [−2π, 2π], y [−8, 8]
+BASE_WIDTH = 4 * np.pi
+BASE_HEIGHT = 16.0
+
+# 확대 단계 범위 (음수일수록 확대). x는 ±128π까지 축소, 극 근처는 약 0.003 폭까지 확대
+X_LEVEL_MIN, X_LEVEL_MAX = -12, 6
+Y_LEVEL_MIN, Y_LEVEL_MAX = -6, 8
+
+# 극을 포함한 픽셀 열에서 탄젠트 값을 자르는 크기 (보기 범위보다 충분히 큰 유한값)
+TAN_CLIP = 1e6
+
+TILE_CACHE_SIZE = 512
+
+
+class Viewport(NamedTuple):
+    """정수 단계로 나타낸 보기 범위. 캐시 키로 그대로 쓸 수 있습니다."""
+    x_level: int  # 가로 폭 = BASE_WIDTH · 2^x_level
+    x_index: int  # 왼쪽 끝 = x_index · (가로 폭 / TILES_PER_VIEW)
+    y_level: int
+    y_index: int
+
+    @property
+    def x_step(self):
+        return BASE_WIDTH * 2.0 ** self.x_level / TILES_PER_VIEW
+
+    @property
+    def y_step(self):
+        return BASE_HEIGHT * 2.0 ** self.y_level / TILES_PER_VIEW
+
+    @property
+    def x_min(self):
+        return self.x_index * self.x_step
+
+    @property
+    def x_max(self):
+        return (self.x_index + TILES_PER_VIEW) * self.x_step
+
+    @property
+    def y_min(self):
+        return self.y_index * self.y_step
+
+    @property
+    def y_max(self):
+        return (self.y_index + TILES_PER_VIEW) * self.y_step
+
+    def panned(self, dx=0, dy=0):
+        """이동 칸 단위로 옮긴 보기 범위."""
+        return self._replace(x_index=self.x_index + dx, y_index=self.y_index + dy)
+
+    def zoomed(self, dx=0, dy=0):
+        """가운데를 유지한 채 확대 단계를 바꾼 보기 범위 (+1은 두 배 넓게, −1은 두 배 좁게)."""
+        x_level, x_index = _zoom_axis(self.x_level, self.x_index, dx, X_LEVEL_MIN, X_LEVEL_MAX)
+        y_level, y_index = _zoom_axis(self.y_level, self.y_index, dy, Y_LEVEL_MIN, Y_LEVEL_MAX)
+        return Viewport(x_level, x_index, y_level, y_index)
+
+
+# 기본 보기 범위 (그래프 페이지가 원래 쓰던 고정 범위와 같음)
+DEFAULT_VIEWPORT = Viewport(0, -TILES_PER_VIEW // 2, 0, -TILES_PER_VIEW // 2)
+
+
+def _zoom_axis(level, index, delta, level_min, level_max):
+    new_level = min(max(level + delta, level_min), level_max)
+    # 가운데 = (index + 칸 수/2) · 칸 폭 을 새 칸 폭 기준으로 다시 나타냄 (축소 시에는 반 칸 이내로 맞춤)
+    center = (index + TILES_PER_VIEW / 2) * 2.0 ** (level - new_level)
+    return new_level, int(np.floor(center + 0.5)) - TILES_PER_VIEW // 2
+
+
+def _column_edges(frequency, x_shift, x_min, x_max, columns):
+    edges = np.linspace(x_min, x_max, columns + 1)
+    centers = (edges[:-1] + edges[1:]) / 2
+    u = frequency * edges + x_shift
+    return centers, u[:-1], u[1:]
+
+
+def _count_in(lo, hi, offset, period):
+    """[lo, hi] 안에 있는 offset + k·period 꼴의 점 개수 (열마다)."""
+    return np.floor((hi - offset) / period) - np.ceil((lo - offset) / period) + 1
+
+
+def _sin_columns(phase, u_start, u_end):
+    # f(u) = sin(u + phase): 열 양 끝 값과, 열 안에 꼭대기/바닥이 있으면 ±1
+    a = np.minimum(u_start, u_end) + phase
+    b = np.maximum(u_start, u_end) + phase
+    f_start = np.sin(u_start + phase)
+    f_end = np.sin(u_end + phase)
+    y_max = np.where(_count_in(a, b, np.pi / 2, 2 * np.pi) > 0, 1.0, np.maximum(f_start, f_end))
+    y_min = np.where(_count_in(a, b, -np.pi / 2, 2 * np.pi) > 0, -1.0, np.minimum(f_start, f_end))
+    # 올라가는 열은 최솟값 → 최댓값, 내려가는 열은 반대 순서로 이어서 선이 자연스럽게 이어지게 함
+    rising = f_start <= f_end
+    return np.column_stack((np.where(rising, y_min, y_max), np.where(rising, y_max, y_min)))
+
+
+def _tan_columns(frequency, u_start, u_end):
+    # 극이 없는 열은 단조이므로 양 끝 값이 곧 최솟값/최댓값
+    f_start = np.clip(np.tan(u_start), -TAN_CLIP, TAN_CLIP)
+    f_end = np.clip(np.tan(u_end), -TAN_CLIP, TAN_CLIP)
+    has_pole = _count_in(np.minimum(u_start, u_end), np.maximum(u_start, u_end), np.pi / 2, np.pi) > 0
+    # 극이 있는 열은 한쪽 무한대로 올라갔다가 NaN에서 끊고 반대쪽 무한대에서 다시 시작
+    toward = TAN_CLIP if frequency > 0 else -TAN_CLIP
+    return np.column_stack((
+        np.where(has_pole, toward, f_start),
+        np.where(has_pole, np.nan, f_end),
+        np.where(has_pole, -toward, f_end),
+    ))
+
+
+def minmax_columns(func, frequency, x_shift, x_min, x_max, columns):
+    """[x_min, x_max]를 픽셀 열 ``columns``개로 나눠 열마다 f(Bx + C)의 최솟값/최댓값을 구합니다.
+
+    사인·코사인은 열마다 2점, 탄젠트는 3칸(극이 있으면 가운데가 NaN)을 열 가운데 x에 놓은
+    (x, y) 배열을 반환합니다.
+    """
+    centers, u_start, u_end = _column_edges(frequency, x_shift, x_min, x_max, columns)
+    if func == "sin":
+        y = _sin_columns(0.0, u_start, u_end)
+    elif func == "cos":
+        y = _sin_columns(np.pi / 2, u_start, u_end)
+    elif func == "tan":
+        y = _tan_columns(frequency, u_start, u_end)
+    else:
+        raise ValueError(f"지원하지 않는 함수입니다: {func}")
+    return np.repeat(centers, y.shape[1]), y.ravel()
+
+
+@lru_cache(maxsize=TILE_CACHE_SIZE)
+def _cached_tile(func, frequency, x_shift, x_level, tile_index, columns):
+    step = Viewport(x_level, 0, 0, 0).x_step
+    x, y = minmax_columns(func, frequency, x_shift, tile_index * step, (tile_index + 1) * step, columns)
+    # 여러 세션이 공유하므로 읽기 전용으로 고정
+    x.flags.writeable = False
+    y.flags.writeable = False
+    return x, y
+
+
+def viewport_curve(func, frequency, x_shift, viewport, columns):
+    """보기 범위에 보이는 기본 곡선 f(Bx + C)를 픽셀 열 ``columns``개 해상도로 반환합니다.
+
+    타일별로 캐시된 결과를 이어 붙이므로 이미 본 범위로 돌아가면 삼각함수 계산을 다시 하지 않습니다.
+    """
+    frequency, x_shift = round(frequency, 6), round(x_shift, 6)
+    per_tile = max(columns // TILES_PER_VIEW, 1)
+    tiles = [
+        _cached_tile(func, frequency, x_shift, viewport.x_level, viewport.x_index + i, per_tile)
+        for i in range(TILES_PER_VIEW)
+    ]
+    return np.concatenate([x for x, _ in tiles]), np.concatenate([y for _, y in tiles])
+
+
+def tile_cache_info():
+    return _cached_tile.cache_info()
+
+
+def format_range(lo, hi, unit=""):
+    """보기 범위를 짧은 문자열로 나타냅니다 (unit="π"이면 π의 배수로)."""
+    scale = np.pi if unit == "π" else 1.0
+    return f"[{lo / scale:.4g}{unit}, {hi / scale:.4g}{unit}]"
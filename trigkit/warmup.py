@@ -0,0 +1,64 @@
+"""서버 시작 시 그래프 렌더링을 미리 준비(예열)합니다.
+
+그래프 페이지의 첫 방문은 matplotlib import, 글꼴 캐시 생성, 범례 수식(mathtext)과 π 눈금
+라벨의 첫 렌더링 비용을 모두 냅니다. ``warm_up``은 이 일을 미리 해 두고, 예열에 쓴 Figure는
+공용 풀(``checkout_figure``)에 남겨 첫 방문자가 바로 빌려 쓰게 합니다. 기본 파라미터 그래프는
+렌더링 캐시에도 넣어 두므로 첫 화면은 PNG를 새로 그리지 않습니다. 각도 확인 페이지의 단위원
+배경도 이때 함께 만들어 둡니다.
+
+서버와 같은 프로세스에서 실행해야 효과가 있으므로 보통 ``python -m trigkit.serve``로 서버를
+띄울 때 백그라운드 스레드로 실행됩니다.
+"""
+import threading
+import time
+
+from trigkit.graph_figure import checkout_figure, make_render_key, render_graph_png
+from trigkit.render_cache import get_render_cache
+from trigkit.unit_circle import UNITS, render_unit_circle_png
+
+# 그래프 페이지 위젯의 기본값 (사인만 표시, A=1, B=1, C=0, D=0)
+DEFAULT_GRAPH_PARAMS = (True, False, False, 1.0, 1.0, 0.0, 0.0)
+
+# 범례 수식에 숫자 0~9, 소수점, 부호가 모두 나오도록 고른 파라미터 (sin, cos, tan 모두 표시)
+WARMUP_PARAMS = (
+    (True, True, True, 1.0, 1.0, 0.0, 0.0),
+    (True, True, True, 2.34, 5.67, -0.89, 1.01),
+)
+
+
+def warm_up():
+    """matplotlib과 글꼴 캐시를 불러오고 예열용 그래프를 그립니다. 단계별 걸린 시간(초)을 반환합니다."""
+    timings = {}
+
+    start = time.perf_counter()
+    import matplotlib.figure  # noqa: F401
+    from matplotlib import font_manager
+    font_manager.fontManager  # 글꼴 캐시가 없으면 여기서 만들어짐
+    timings["import"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with checkout_figure() as graph:
+        for params in WARMUP_PARAMS:
+            graph.render_png(*params)
+    timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_render_cache().get_or_render(
+        make_render_key(*DEFAULT_GRAPH_PARAMS),
+        lambda: render_graph_png(*DEFAULT_GRAPH_PARAMS),
+    )
+    timings["default_graph"] = time.perf_counter() - start
+
+    # 각도 확인 페이지의 단위원 배경(단위별)과 PNG 팔레트도 미리 만들어 둠
+    start = time.perf_counter()
+    for unit in UNITS:
+        render_unit_circle_png(30, unit, "sin")
+    timings["unit_circle"] = time.perf_counter() - start
+    return timings
+
+
+def start_warm_up():
+    """예열을 백그라운드 스레드에서 시작하고 그 스레드를 반환합니다."""
+    thread = threading.Thread(target=warm_up, name="graph-warm-up", daemon=True)
+    thread.start()
+    return thread